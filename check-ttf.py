@@ -1,4 +1,6 @@
 from fontTools.ttLib import TTFont
+from font_ranges import points_to_ranges
+from unicode_blocks import format_block_coverage, script_ranges
 
 ttf_path = r"E:\Fonts\chinese_fonts_filtered\NotoSansSC-Regular.ttf"
 font = TTFont(ttf_path)
@@ -6,8 +8,14 @@ font = TTFont(ttf_path)
 cmap = font['cmap'].getBestCmap()
 print(f"Number of codepoints in font: {len(cmap)}")
 
-# Example: print first 20 Chinese codepoints
-chinese_points = [cp for cp in cmap.keys() if cp >= 0x4E00]
+ranges = points_to_ranges(sorted(cmap))
+
+# Example: print first 20 Chinese (Han script) codepoints
+chinese_points = [cp for a, b in script_ranges(ranges, "Han") for cp in range(a, min(b, a + 20) + 1)]
 print("Sample Chinese codepoints:", [hex(cp) for cp in chinese_points[:20]])
 
+print("Coverage per Unicode block:")
+for line in format_block_coverage(ranges):
+    print(" ", line)
+
 font.close()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Estimate the flash footprint of an LVGL font (lv_font_conv output) before running
+the converter.
+
+Bitmap, cmap, glyph_dsc and kerning bytes for 1/2/4/8 bpp come from the size model in
+lvgl_size.py, per range and optionally per chunk, so chunk sizes and flash partitions
+can be planned up front.
+"""
+
+import argparse
+import os
+import sys
+
+from font_ranges import format_range_str, parse_range_str
+from lvgl_size import BPPS, FontSizeModel
+
+
+def print_estimate(label, res):
+    print(f"{label}")
+    print(f"  glyphs: {res['glyphs']}  glyph_dsc: {res['glyph_dsc']} B  cmap: {res['cmap']} B  kerning: {res['kerning']} B")
+    for bpp in BPPS:
+        print(f"  {bpp} bpp: bitmap {res['bitmap'][bpp]:>10} B  total {res['total'][bpp]:>10} B"
+              f"  ({res['total'][bpp] / 1024:.1f} KiB)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Estimate LVGL font flash size per range and bpp from a TTF/OTF file.")
+    parser.add_argument("font", help="path to TTF/OTF font")
+    parser.add_argument("--size", type=int, default=16, help="font size in pixels (default 16)")
+    parser.add_argument("--range", dest="range_str", default="0x0000-0x10FFFF",
+                        help="ranges to include, e.g. 0x4E00-0x9FFF (default: whole cmap)")
+    parser.add_argument("--chunk", type=int, default=None,
+                        help="also estimate each chunk of N glyphs (like max_glyphs_per_chunk)")
+    parser.add_argument("--no-kerning", action="store_true", help="don't count kerning data")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.font):
+        print("File not found:", args.font)
+        sys.exit(1)
+
+    ranges = parse_range_str(args.range_str)
+    model = FontSizeModel(args.font, args.size)
+    kerning = not args.no_kerning
+
+    print(f"File: {os.path.basename(args.font)} @ {args.size}px")
+    chunk_glyphs = 0
+    if args.chunk:
+        for chunk in model.chunk_ranges(ranges, args.chunk):
+            res = model.estimate(chunk, kerning)
+            chunk_glyphs += res["glyphs"]
+            print_estimate(format_range_str(chunk), res)
+    total = model.estimate(ranges, kerning)
+    print_estimate(f"Total {args.range_str}", total)
+    model.close()
+
+    # every glyph must land in exactly one chunk
+    if args.chunk and chunk_glyphs != total["glyphs"]:
+        print(f"Chunks hold {chunk_glyphs} glyphs but the range has {total['glyphs']}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
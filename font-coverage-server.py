@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+Long-running coverage service over a font directory.
+
+`serve` loads the Unicode coverage of every font in a folder once, keeps it in memory
+as sorted (start, end) runs, rescans the folder for changed files in the background and
+answers queries over localhost (one JSON object per line). `query` is the thin client:
+when no server is listening, or the server indexes a different folder than --dir, it
+falls back to scanning the fonts in-process.
+
+  python font-coverage-server.py serve E:\\Fonts\\arabic_fonts
+  python font-coverage-server.py query --dir E:\\Fonts\\arabic_fonts which 0x0600-0x06FF
+  python font-coverage-server.py query --dir E:\\Fonts\\arabic_fonts contains noto-sans-arabic-400.ttf 0x0600-0x06FF
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import sys
+from bisect import bisect_right
+
+from font_ranges import format_range_str, get_unicode_ranges, parse_range_str
+
+HOST = "127.0.0.1"
+PORT = 8765
+FONT_EXTENSIONS = (".ttf", ".otf")
+RESCAN_INTERVAL = 2.0  # seconds between directory scans
+
+
+# -----------------------------
+# Coverage primitives
+# -----------------------------
+
+def text_to_ranges(text):
+    return [(ord(ch), ord(ch)) for ch in set(text)]
+
+
+class Coverage:
+    """Sorted, merged codepoint runs of one font with O(log n) lookups."""
+
+    def __init__(self, ranges):
+        self.ranges = ranges
+        self.starts = [a for a, _ in ranges]
+        self.ends = [b for _, b in ranges]
+        self.total = sum(b - a + 1 for a, b in ranges)
+
+    def covered_count(self, a, b):
+        """Number of codepoints of [a, b] present in the font."""
+        n = 0
+        i = max(bisect_right(self.starts, a) - 1, 0)
+        while i < len(self.starts) and self.starts[i] <= b:
+            lo, hi = max(a, self.starts[i]), min(b, self.ends[i])
+            if lo <= hi:
+                n += hi - lo + 1
+            i += 1
+        return n
+
+    def contains(self, target_ranges):
+        """True if every codepoint of the target ranges is present."""
+        for a, b in target_ranges:
+            i = bisect_right(self.starts, a) - 1
+            if i < 0 or self.ends[i] < b:
+                return False
+        return True
+
+    def missing_count(self, target_ranges):
+        return sum((b - a + 1) - self.covered_count(a, b) for a, b in target_ranges)
+
+
+# -----------------------------
+# Index
+# -----------------------------
+
+class CoverageIndex:
+    def __init__(self, folder):
+        self.folder = os.path.abspath(folder)
+        self.fonts = {}   # file name -> Coverage
+        self.stamps = {}  # file name -> (mtime_ns, size)
+
+    def _scan(self):
+        stamps = {}
+        for file in os.listdir(self.folder):
+            if file.lower().endswith(FONT_EXTENSIONS):
+                st = os.stat(os.path.join(self.folder, file))
+                stamps[file] = (st.st_mtime_ns, st.st_size)
+        return stamps
+
+    def refresh(self):
+        """Reload new or changed fonts and drop deleted ones. Return names that changed."""
+        stamps = self._scan()
+        changed = [f for f, s in stamps.items() if self.stamps.get(f) != s]
+        removed = [f for f in self.stamps if f not in stamps]
+        if not changed and not removed:
+            return []
+        # build a new dict and swap it in, so queries never see a half-updated index
+        fonts = {f: cov for f, cov in self.fonts.items() if f in stamps}
+        for file in changed:
+            fonts[file] = Coverage(get_unicode_ranges(os.path.join(self.folder, file)))
+        self.fonts = fonts
+        self.stamps = stamps
+        return changed + removed
+
+    def serves(self, folder):
+        """True if requests for `folder` (None: any) can be answered from this index."""
+        if folder is None:
+            return True
+        return os.path.normcase(os.path.realpath(folder)) == os.path.normcase(os.path.realpath(self.folder))
+
+    def handle(self, request):
+        op = request.get("op")
+        if op == "list":
+            return {"fonts": sorted(self.fonts)}
+        if op == "ranges":
+            cov = self._font(request)
+            return {"ranges": format_range_str(cov.ranges).split(","), "total": cov.total}
+
+        target = self._target(request)
+        if op == "contains":
+            cov = self._font(request)
+            return {"contains": cov.contains(target), "missing": cov.missing_count(target)}
+        if op == "which":
+            return {"fonts": sorted(f for f, cov in self.fonts.items() if cov.contains(target))}
+        if op == "missing":
+            return {"missing": {f: cov.missing_count(target) for f, cov in sorted(self.fonts.items())}}
+        raise ValueError(f"unknown op: {op!r}")
+
+    def _font(self, request):
+        name = request.get("font")
+        if name not in self.fonts:
+            raise ValueError(f"font not indexed: {name!r}")
+        return self.fonts[name]
+
+    @staticmethod
+    def _target(request):
+        if "text" in request:
+            return text_to_ranges(request["text"])
+        return parse_range_str(request["ranges"])
+
+
+def answer(index, request):
+    if not index.serves(request.get("dir")):
+        return {"ok": False, "wrong_dir": True,
+                "error": f"server indexes {index.folder}, not {request['dir']}"}
+    try:
+        return {"ok": True, **index.handle(request)}
+    except Exception as e:
+        return {"ok": False, "error": str(e)}
+
+
+# -----------------------------
+# Server
+# -----------------------------
+
+async def serve(folder, host=HOST, port=PORT, interval=RESCAN_INTERVAL):
+    index = CoverageIndex(folder)
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(None, index.refresh)
+    print(f"Indexed {len(index.fonts)} fonts in {folder}")
+
+    async def watch():
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                changed = await loop.run_in_executor(None, index.refresh)
+            except OSError as e:
+                print(f"Rescan failed: {e}")
+                continue
+            if changed:
+                print(f"Reloaded: {', '.join(changed)}")
+
+    async def client(reader, writer):
+        try:
+            while line := await reader.readline():
+                try:
+                    request = json.loads(line)
+                except ValueError as e:
+                    response = {"ok": False, "error": f"bad request: {e}"}
+                else:
+                    response = answer(index, request)
+                writer.write(json.dumps(response).encode("utf-8") + b"\n")
+                await writer.drain()
+        finally:
+            writer.close()
+
+    watcher = asyncio.create_task(watch())
+    server = await asyncio.start_server(client, host, port)
+    print(f"Listening on {host}:{port}")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        watcher.cancel()
+
+
+# -----------------------------
+# Client
+# -----------------------------
+
+def query(request, folder=None, host=HOST, port=PORT, timeout=1.0):
+    """
+    Send one request to the server. The request names `folder`, and the server only
+    answers it if that is the folder it indexes. If the server is not running, indexes
+    another folder or doesn't speak this protocol, answer it in-process by scanning
+    `folder` (or fail if no folder was given).
+    """
+    if folder is not None:
+        request = dict(request, dir=os.path.abspath(folder))
+    try:
+        with socket.create_connection((host, port), timeout=timeout) as sock:
+            sock.sendall(json.dumps(request).encode("utf-8") + b"\n")
+            with sock.makefile("rb") as f:
+                response = json.loads(f.readline())
+        if not isinstance(response, dict):
+            raise ValueError("not a coverage server reply")
+        if not response.get("wrong_dir"):
+            return response
+    except (OSError, ValueError):
+        if folder is None:
+            raise
+    index = CoverageIndex(folder)
+    index.refresh()
+    return answer(index, request)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve or query font Unicode coverage for a font folder.")
+    parser.add_argument("--host", default=HOST)
+    parser.add_argument("--port", type=int, default=PORT)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("serve", help="index a folder and answer queries")
+    p.add_argument("folder", help="folder containing TTF/OTF files")
+    p.add_argument("--interval", type=float, default=RESCAN_INTERVAL, help="seconds between rescans")
+
+    p = sub.add_parser("query", help="ask the server (or scan in-process if it is not running)")
+    p.add_argument("--dir", dest="folder", help="folder to scan when no server is running")
+    qsub = p.add_subparsers(dest="op", required=True)
+    qsub.add_parser("list")
+    q = qsub.add_parser("ranges")
+    q.add_argument("font")
+    for name in ("which", "missing"):
+        q = qsub.add_parser(name)
+        q.add_argument("ranges", nargs="?", help="e.g. 0x0600-0x06FF,0x0750-0x077F")
+        q.add_argument("--text", help="characters to check instead of ranges")
+    q = qsub.add_parser("contains")
+    q.add_argument("font")
+    q.add_argument("ranges", nargs="?", help="e.g. 0x0600-0x06FF,0x0750-0x077F")
+    q.add_argument("--text", help="characters to check instead of ranges")
+
+    args = parser.parse_args()
+
+    if args.command == "serve":
+        if not os.path.isdir(args.folder):
+            print("Folder not found:", args.folder)
+            sys.exit(1)
+        try:
+            asyncio.run(serve(args.folder, args.host, args.port, args.interval))
+        except KeyboardInterrupt:
+            pass
+        return
+
+    request = {"op": args.op}
+    if getattr(args, "font", None):
+        request["font"] = args.font
+    if getattr(args, "text", None):
+        request["text"] = args.text
+    elif getattr(args, "ranges", None):
+        request["ranges"] = args.ranges
+    elif args.op in ("which", "missing", "contains"):
+        parser.error("give ranges or --text")
+
+    try:
+        response = query(request, args.folder, args.host, args.port)
+    except (OSError, ValueError) as e:
+        print(f"No coverage server at {args.host}:{args.port} ({e}) and no --dir to scan")
+        sys.exit(1)
+    print(json.dumps(response, indent=2, ensure_ascii=False))
+    if not response.get("ok"):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,454 @@
+#!/usr/bin/env python3
+"""
+Run the font build (download -> instance -> filter -> split -> convert -> verify) as a
+declarative pipeline.
+
+Stages are declared in a TOML (or YAML, with PyYAML installed) file and run as a DAG:
+every stage waits for the stages in its `inputs`, processes its items with at most
+`concurrency` in flight, and hands its outputs to the next stages in memory (loaded
+TTFont objects are passed along instead of being re-read). Each item's output is cached
+by a hash of the stage settings and the item's input, so a rerun only redoes what
+changed. The converter stage runs lv_font_conv as a subprocess, or writes a stub
+C file with --stub (or `stub = true`) where lv_font_conv isn't installed.
+
+  python font-pipeline.py font-pipeline.toml
+  python font-pipeline.py font-pipeline.toml --stub --only verify_chinese
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+
+from fontTools.ttLib import TTFont
+
+from font_ranges import flatten_ranges, format_range_str, parse_range_str, points_to_ranges
+from font_store import FONT_STORE_DIR, file_hash, store_and_link
+from lvgl_c_font import read_lvgl_c_file
+
+FONT_EXTENSIONS = (".ttf", ".otf")
+DOWNLOAD_BASE_URL = "https://gwfh.mranftl.com/api/fonts/"
+LV_FONT_CONV = ["lv_font_conv", "--no-compress", "--font", "{font}", "-r", "{ranges}",
+                "--size", "{size}", "--bpp", "{bpp}", "--format", "lvgl", "-o", "{output}"]
+
+# settings that don't change a stage's outputs, left out of cache keys
+NON_CACHE_KEYS = ("inputs", "concurrency")
+
+
+# -----------------------------
+# Helpers
+# -----------------------------
+
+def text_hash(*parts):
+    return hashlib.sha256(json.dumps(parts, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def artifact(name, path, digest=None, font=None, **meta):
+    """A stage output: a file (path + content digest) plus metadata, and optionally the loaded font."""
+    a = {"name": name, "path": path, "digest": digest or file_hash(path), "meta": meta}
+    if font is not None:
+        a["font"] = font
+    return a
+
+
+# fontTools decompiles tables on first access, which isn't thread-safe
+_font_lock = threading.Lock()
+
+
+def load_font(a):
+    """The artifact's font, from memory when the producing stage ran in this process."""
+    if "font" not in a:
+        a["font"] = TTFont(a["path"], lazy=True)
+    return a["font"]
+
+
+def codepoints_of(a):
+    with _font_lock:
+        return set(load_font(a).getBestCmap())
+
+
+def stage_dir(ctx, name):
+    d = os.path.join(ctx["work_dir"], name)
+    os.makedirs(d, exist_ok=True)
+    return d
+
+
+# -----------------------------
+# Stages
+#
+# Each stage type has an items() function returning (cache key material, item) pairs
+# and an async run() function producing a list of artifacts for one item. A run() that
+# skips part of its item appends a message to ctx["failures"]; the item is then not
+# cached, so the next run retries it.
+# -----------------------------
+
+def files_items(name, cfg, inputs, ctx):
+    folder = cfg["dir"]
+    paths = sorted(os.path.join(folder, f) for f in os.listdir(folder) if f.lower().endswith(FONT_EXTENSIONS))
+    return [((p, os.stat(p).st_mtime_ns, os.stat(p).st_size), p) for p in paths]
+
+
+async def files_run(name, cfg, path, ctx):
+    return [await asyncio.to_thread(artifact, os.path.basename(path), path)]
+
+
+def download_items(name, cfg, inputs, ctx):
+    return [((fid,), fid) for fid in cfg["ids"]]
+
+
+def _download_font_family(fid, cfg, out_dir, failures):
+    """Download every variant of a family, skipping (and reporting) the ones that fail."""
+    url = f"{cfg.get('base_url', DOWNLOAD_BASE_URL)}{fid}?subsets={cfg.get('subsets', 'latin')}"
+    try:
+        with urllib.request.urlopen(url) as resp:
+            data = json.loads(resp.read().decode("utf-8"))
+    except (OSError, ValueError) as e:
+        print(f"  Failed to fetch {fid}: {e}")
+        failures.append(f"{fid}: {e}")
+        return []
+    out = []
+    for variant in data.get("variants", []):
+        ttf_url = variant.get("ttf")
+        if not ttf_url:
+            continue
+        fname = f"{fid}-{variant['id']}.ttf"
+        fd, tmp = tempfile.mkstemp(suffix=".ttf", dir=out_dir)
+        os.close(fd)
+        try:
+            urllib.request.urlretrieve(ttf_url, tmp)
+        except OSError as e:
+            os.remove(tmp)
+            print(f"  Failed download {fname}: {e}")
+            failures.append(f"{fname}: {e}")
+            continue
+        path = os.path.join(out_dir, fname)
+        digest, _, _ = store_and_link(tmp, path, cfg.get("store", FONT_STORE_DIR), move=True)
+        out.append(artifact(fname, path, digest))
+    return out
+
+
+async def download_run(name, cfg, fid, ctx):
+    return await asyncio.to_thread(_download_font_family, fid, cfg, stage_dir(ctx, name), ctx["failures"])
+
+
+def instance_items(name, cfg, inputs, ctx):
+    source = cfg["source"]
+    digest = file_hash(source)
+    return [((digest, inst), inst) for inst in cfg["instances"]]
+
+
+def _instantiate(source, inst, out_dir):
+    from fontTools.varLib import instancer
+
+    axes = {k: v for k, v in inst.items() if k != "name"}
+    vf = TTFont(source)
+    static = instancer.instantiateVariableFont(vf, axes)  # do NOT use inplace=True
+    path = os.path.join(out_dir, inst["name"] + ".ttf")
+    static.save(path)
+    vf.close()
+    return [artifact(os.path.basename(path), path, font=static)]
+
+
+async def instance_run(name, cfg, inst, ctx):
+    return await asyncio.to_thread(_instantiate, cfg["source"], inst, stage_dir(ctx, name))
+
+
+def per_input_items(name, cfg, inputs, ctx):
+    return [((a["digest"],), a) for a in inputs]
+
+
+def _filter(cfg, a):
+    target = flatten_ranges(parse_range_str(cfg["ranges"]))
+    missing = len(target - codepoints_of(a))
+    tolerance = cfg.get("tolerance", 0)
+    if missing == 0:
+        print(f"  {a['name']} ✅ Full coverage")
+    elif missing <= tolerance:
+        print(f"  {a['name']} ⚠️ Missing {missing} codepoints (tolerated)")
+    elif cfg.get("keep_all", False):
+        print(f"  {a['name']} ⚠️ Missing {missing} codepoints (subset font)")
+    else:
+        print(f"  {a['name']} ❌ Missing {missing} codepoints → dropped")
+        return []
+    return [dict(a, meta=dict(a["meta"], missing=missing))]
+
+
+async def filter_run(name, cfg, a, ctx):
+    return await asyncio.to_thread(_filter, cfg, a)
+
+
+def _split(cfg, a):
+    """Chunk the font's codepoints like get-coderange-from-ttf.py."""
+    cps = sorted(codepoints_of(a))
+    if "ranges" in cfg:
+        wanted = flatten_ranges(parse_range_str(cfg["ranges"]))
+        cps = [cp for cp in cps if cp in wanted]
+    else:
+        cps = [cp for cp in cps if cp >= cfg.get("start", 0)]
+    size = cfg.get("max_glyphs_per_chunk", 256)
+    out = []
+    for i in range(0, len(cps), size):
+        chunk = cps[i:i + size]
+        ranges = format_range_str(points_to_ranges(chunk)) if "ranges" in cfg else f"0x{chunk[0]:04X}-0x{chunk[-1]:04X}"
+        out.append(dict(a, name=f"{os.path.splitext(a['name'])[0]}_{chunk[0]:04X}_{chunk[-1]:04X}",
+                        digest=text_hash(a["digest"], ranges),
+                        meta=dict(a["meta"], ranges=ranges, expected=len(chunk))))
+    return out
+
+
+async def split_run(name, cfg, a, ctx):
+    return await asyncio.to_thread(_split, cfg, a)
+
+
+def _write_stub(a, path):
+    """A minimal lv_font_conv-like C file with the cmaps of the chunk (for local runs)."""
+    wanted = flatten_ranges(parse_range_str(a["meta"]["ranges"]))
+    cps = sorted(cp for cp in codepoints_of(a) if cp in wanted)
+    lines = ["/* stub generated by font-pipeline.py */",
+             "static const lv_font_fmt_txt_cmap_t cmaps[] =", "{"]
+    gid = 1
+    for start, end in points_to_ranges(cps):
+        length = end - start + 1
+        lines.append(f"    {{.range_start = {start}, .range_length = {length}, .glyph_id_start = {gid}, "
+                     f".unicode_list = NULL, .glyph_id_ofs_list = NULL, .list_length = 0, "
+                     f".type = LV_FONT_FMT_TXT_CMAP_FORMAT0_TINY}},")
+        gid += length
+    lines.append("};")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+
+
+async def convert_run(name, cfg, a, ctx):
+    size, bpp = cfg.get("size", 16), cfg.get("bpp", 4)
+    out = os.path.join(stage_dir(ctx, name), f"{a['name']}_{size}px_{bpp}bpp.c")
+    if ctx["stub"] or cfg.get("stub", False):
+        await asyncio.to_thread(_write_stub, a, out)
+    else:
+        fields = {"font": a["path"], "ranges": a["meta"]["ranges"], "size": size, "bpp": bpp, "output": out}
+        cmd = [arg.format(**fields) for arg in cfg.get("command", LV_FONT_CONV)]
+        try:
+            proc = await asyncio.create_subprocess_exec(*cmd, stdout=asyncio.subprocess.PIPE,
+                                                        stderr=asyncio.subprocess.STDOUT)
+        except FileNotFoundError:
+            raise RuntimeError(f"{cmd[0]} not found: install it, set `command`, or run with --stub")
+        output, _ = await proc.communicate()
+        if proc.returncode != 0:
+            raise RuntimeError(f"{cmd[0]} failed for {a['name']}:\n{output.decode(errors='ignore')}")
+    return [artifact(os.path.basename(out), out, **dict(a["meta"], font_path=a["path"]))]
+
+
+def _verify(a):
+    """Count the codepoints in the cmaps of the C file, like read-lvgl-c-file.py."""
+    found = len(read_lvgl_c_file(a["path"]).cmap)
+    expected = a["meta"].get("expected")
+    ok = expected is None or found == expected
+    mark = "✅" if ok else "❌"
+    print(f"  {a['name']} {mark} {found} codepoints (expected {expected})")
+    return [dict(a, meta=dict(a["meta"], found=found, ok=ok))]
+
+
+async def verify_run(name, cfg, a, ctx):
+    return await asyncio.to_thread(_verify, a)
+
+
+STAGES = {
+    "files": (files_items, files_run),
+    "download": (download_items, download_run),
+    "instance": (instance_items, instance_run),
+    "filter": (per_input_items, filter_run),
+    "split": (per_input_items, split_run),
+    "convert": (per_input_items, convert_run),
+    "verify": (per_input_items, verify_run),
+}
+
+
+# -----------------------------
+# Cache
+# -----------------------------
+
+class StageCache:
+    """Stage outputs stored as JSON manifests, valid while the output files are unchanged."""
+
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+
+    def _path(self, stage, key):
+        return os.path.join(self.cache_dir, stage, key + ".json")
+
+    def get(self, stage, key):
+        path = self._path(stage, key)
+        if not os.path.exists(path):
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            artifacts = json.load(f)
+        for a in artifacts:
+            stamp = a.pop("stamp")
+            if not os.path.exists(a["path"]):
+                return None
+            st = os.stat(a["path"])
+            if [st.st_mtime_ns, st.st_size] != stamp:
+                return None
+        return artifacts
+
+    def put(self, stage, key, artifacts):
+        path = self._path(stage, key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        records = []
+        for a in artifacts:
+            st = os.stat(a["path"])
+            records.append({k: v for k, v in a.items() if k != "font"} | {"stamp": [st.st_mtime_ns, st.st_size]})
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(records, f, indent=1)
+
+
+# -----------------------------
+# Runner
+# -----------------------------
+
+def load_config(path):
+    if path.lower().endswith((".yaml", ".yml")):
+        try:
+            import yaml
+        except ImportError:
+            print("PyYAML is required for YAML pipelines (pip install pyyaml), or use TOML")
+            sys.exit(1)
+        with open(path, "r", encoding="utf-8") as f:
+            return yaml.safe_load(f)
+    import tomllib
+
+    with open(path, "rb") as f:
+        return tomllib.load(f)
+
+
+def stage_order(stages, only=None):
+    """Stages in dependency order (only the ones `only` needs, if given). Raise on cycles."""
+    order, state = [], {}
+
+    def visit(name, chain):
+        if name not in stages:
+            raise ValueError(f"unknown stage {name!r} (needed by {chain[-1] if chain else 'command line'})")
+        if state.get(name) == "done":
+            return
+        if state.get(name) == "visiting":
+            raise ValueError("cycle in pipeline: " + " -> ".join(chain + [name]))
+        state[name] = "visiting"
+        for dep in stages[name].get("inputs", []):
+            visit(dep, chain + [name])
+        state[name] = "done"
+        order.append(name)
+
+    for name in (only or stages):
+        visit(name, [])
+    return order
+
+
+class Pipeline:
+    def __init__(self, config, stub=False, force=False):
+        settings = config.get("pipeline", {})
+        self.stages = config.get("stages", {})
+        for name, cfg in self.stages.items():
+            if cfg.get("type") not in STAGES:
+                raise ValueError(f"stage {name!r}: unknown type {cfg.get('type')!r}")
+        work_dir = settings.get("work_dir", "build")
+        self.ctx = {"work_dir": work_dir, "stub": stub}
+        self.cache = StageCache(settings.get("cache_dir", os.path.join(work_dir, ".cache")))
+        self.force = force
+        self.stats = {}
+        self.failures = {}
+
+    async def _run_stage(self, name, cfg, inputs):
+        items_fn, run_fn = STAGES[cfg["type"]]
+        settings = {k: v for k, v in cfg.items() if k not in NON_CACHE_KEYS}
+        if cfg["type"] == "convert" and self.ctx["stub"]:
+            settings["stub"] = True
+        sem = asyncio.Semaphore(cfg.get("concurrency", 1))
+        stats = self.stats[name] = {"items": 0, "cached": 0, "outputs": 0, "failed": 0, "seconds": 0.0}
+        failures = self.failures[name] = []
+        t0 = time.perf_counter()
+
+        async def one(key_material, item):
+            key = text_hash(name, settings, key_material)
+            cached = None if self.force else self.cache.get(name, key)
+            if cached is not None:
+                stats["cached"] += 1
+                return cached
+            item_failures = []
+            async with sem:
+                out = await run_fn(name, cfg, item, dict(self.ctx, failures=item_failures))
+            if item_failures:
+                stats["failed"] += len(item_failures)
+                failures.extend(item_failures)
+            else:
+                self.cache.put(name, key, out)
+            return out
+
+        items = await asyncio.to_thread(items_fn, name, cfg, inputs, self.ctx)
+        stats["items"] = len(items)
+        print(f"[{name}] {len(items)} item(s)")
+        results = await asyncio.gather(*(one(k, item) for k, item in items))
+        outputs = [a for out in results for a in out]
+        stats["outputs"] = len(outputs)
+        stats["seconds"] = time.perf_counter() - t0
+        return outputs
+
+    async def run(self, only=None):
+        order = stage_order(self.stages, only)
+        tasks = {}
+
+        async def run_stage(name):
+            cfg = self.stages[name]
+            inputs = []
+            for dep in cfg.get("inputs", []):
+                inputs.extend(await tasks[dep])
+            return await self._run_stage(name, cfg, inputs)
+
+        for name in order:
+            tasks[name] = asyncio.create_task(run_stage(name))
+        results = await asyncio.gather(*tasks.values())
+        return dict(zip(tasks, results))
+
+    def print_summary(self):
+        print("---------------------------------------------------")
+        for name, s in self.stats.items():
+            print(f"{name:<24} items {s['items']:>5}  cached {s['cached']:>5}  "
+                  f"outputs {s['outputs']:>5}  failed {s['failed']:>3}  {s['seconds']:.2f}s")
+        for name, failures in self.failures.items():
+            for msg in failures:
+                print(f"  {name}: skipped {msg}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a declarative font build pipeline (TOML/YAML).")
+    parser.add_argument("config", help="pipeline file (.toml, or .yaml with PyYAML)")
+    parser.add_argument("--only", nargs="+", help="run only these stages (and what they depend on)")
+    parser.add_argument("--stub", action="store_true", help="write stub C files instead of running lv_font_conv")
+    parser.add_argument("--force", action="store_true", help="ignore cached stage outputs")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.config):
+        print("File not found:", args.config)
+        sys.exit(1)
+
+    pipeline = Pipeline(load_config(args.config), stub=args.stub, force=args.force)
+    try:
+        results = asyncio.run(pipeline.run(args.only))
+    except (RuntimeError, ValueError) as e:
+        print("Pipeline failed:", e)
+        sys.exit(1)
+    pipeline.print_summary()
+
+    failed = [a["name"] for outs in results.values() for a in outs if a["meta"].get("ok") is False]
+    if failed:
+        print("Verification failed:", ", ".join(failed))
+    if failed or any(pipeline.failures.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
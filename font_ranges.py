@@ -0,0 +1,147 @@
+"""
+Unicode range primitives shared by the font scripts.
+
+Ranges are lists of inclusive (start, end) codepoint tuples. The interval functions
+work on merged runs directly, so their cost grows with the number of runs rather than
+with the number of codepoints. test_font_ranges.py checks them against a
+brute-force set oracle and measures their throughput.
+"""
+
+import re
+
+MAX_CP = 0x10FFFF
+
+_NUMBER_RE = re.compile(r"(?i)(?:0x|u\+)([0-9a-f]+)|(0|[1-9][0-9]*)")
+
+
+def parse_codepoint(token):
+    """
+    Parse one codepoint: '0x4E00' or 'U+4E00' (hex) or '19968' (decimal, as in
+    lv_font_conv -r). Anything else raises ValueError, including bare hex like '4DBF'
+    and zero-padded numbers like '0600': their base can't be told from the token.
+    """
+    m = _NUMBER_RE.fullmatch(token.strip())
+    if not m:
+        raise ValueError(f"invalid codepoint: {token.strip()!r} (write hex as 0x... or U+..., decimal without leading zeros)")
+    hex_digits, decimal = m.groups()
+    return int(hex_digits, 16) if hex_digits is not None else int(decimal, 10)
+
+
+def parse_range_str(range_str):
+    """
+    Convert something like '0x0600-0x06FF, 0x0750-0x077F' to a list of (start, end)
+    ints. Whitespace and empty segments are ignored; single codepoints give (v, v).
+    """
+    ranges = []
+    for part in range_str.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if "-" in part:
+            a, _, b = part.partition("-")
+            if not a.strip() or not b.strip() or "-" in b:
+                raise ValueError(f"invalid range: {part!r}")
+            start, end = parse_codepoint(a), parse_codepoint(b)
+        else:
+            start = end = parse_codepoint(part)
+        if start > end:
+            raise ValueError(f"range start after end: {part!r}")
+        ranges.append((start, end))
+    return ranges
+
+
+def format_range_str(ranges):
+    """Inverse of parse_range_str: '0x0600-0x06FF,0x0750-0x077F'."""
+    return ",".join(f"0x{a:04X}-0x{b:04X}" for a, b in ranges)
+
+
+def points_to_ranges(points):
+    """Merge sorted codepoints into (start, end) runs (duplicates are ignored)."""
+    if not points:
+        return []
+    ranges = []
+    start = prev = points[0]
+    for cp in points[1:]:
+        if cp == prev:
+            continue
+        if cp != prev + 1:
+            ranges.append((start, prev))
+            start = cp
+        prev = cp
+    ranges.append((start, prev))
+    return ranges
+
+
+def merge_ranges(ranges):
+    """Sort ranges and merge overlapping or adjacent ones."""
+    merged = []
+    for a, b in sorted(ranges):
+        if merged and a <= merged[-1][1] + 1:
+            if b > merged[-1][1]:
+                merged[-1] = (merged[-1][0], b)
+        else:
+            merged.append((a, b))
+    return merged
+
+
+def flatten_ranges(ranges):
+    """Return a set of all codepoints covered by the given ranges."""
+    s = set()
+    for a, b in ranges:
+        s.update(range(a, b + 1))
+    return s
+
+
+def count_ranges(ranges):
+    """Number of distinct codepoints covered by the ranges."""
+    return sum(b - a + 1 for a, b in merge_ranges(ranges))
+
+
+def missing_ranges(font_ranges, target_ranges):
+    """The parts of target_ranges not covered by font_ranges, as merged runs."""
+    font = merge_ranges(font_ranges)
+    missing = []
+    i = 0
+    for a, b in merge_ranges(target_ranges):
+        # skip font runs that end before this target run
+        while i < len(font) and font[i][1] < a:
+            i += 1
+        j = i
+        while a <= b:
+            if j == len(font) or font[j][0] > b:
+                missing.append((a, b))
+                break
+            if font[j][0] > a:
+                missing.append((a, font[j][0] - 1))
+            a = font[j][1] + 1
+            j += 1
+    return missing
+
+
+def missing_count(font_ranges, target_ranges):
+    return sum(b - a + 1 for a, b in missing_ranges(font_ranges, target_ranges))
+
+
+def contains_ranges(font_ranges, target_ranges):
+    """True if every codepoint of target_ranges is in font_ranges."""
+    return not missing_ranges(font_ranges, target_ranges)
+
+
+def same_ranges(font_ranges, target_ranges):
+    """True if both cover exactly the same codepoints."""
+    return merge_ranges(font_ranges) == merge_ranges(target_ranges)
+
+
+def get_unicode_ranges(ttf_path):
+    """Extract Unicode ranges from a TTF file as a list of (start, end) tuples."""
+    from fontTools.ttLib import TTFont
+
+    try:
+        font = TTFont(ttf_path)
+        cmap = font["cmap"].getBestCmap()
+        points = sorted(cmap.keys())
+        font.close()
+    except Exception as e:
+        print(f"Error reading {ttf_path}: {e}")
+        return []
+    return points_to_ranges(points)
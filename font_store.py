@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Content-addressed font store.
+
+Every font is hashed in streaming fashion (SHA-256) and stored once under
+<store>/objects/<hh>/<hash><ext>. Filtered/download directories get hardlinks (or
+reflinks, or as a last resort copies) to the stored object instead of their own copy,
+so disk use scales with unique fonts rather than with pipeline runs. Objects are made
+read-only once stored: a tool that rewrites a linked output in place fails instead of
+silently changing the object (and every other link to it); remove the output with
+unlink() first to write a fresh file there.
+
+Used by ttf-chinese.py and ttf-download-arabic.py; run it directly for a dedupe report:
+
+  python font_store.py E:\\Fonts\\chinese_fonts_filtered E:\\Fonts\\arabic_fonts_filtered
+  python font_store.py --apply --store E:\\Fonts\\store E:\\Fonts\\chinese_fonts_filtered
+"""
+
+import argparse
+import errno
+import hashlib
+import os
+import shutil
+import stat
+import subprocess
+import sys
+import tempfile
+from collections import defaultdict
+
+FONT_STORE_DIR = r"E:\Fonts\store"
+FONT_EXTENSIONS = (".ttf", ".otf")
+CHUNK_SIZE = 1 << 20
+
+
+def file_hash(path):
+    """SHA-256 hex digest of a file, read in chunks."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(CHUNK_SIZE):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def object_path(store_dir, digest, ext):
+    return os.path.join(store_dir, "objects", digest[:2], digest + ext.lower())
+
+
+def _reflink(src, dst):
+    """Copy-on-write clone where the filesystem supports it (btrfs, XFS, APFS)."""
+    if sys.platform.startswith("linux"):
+        cmd = ["cp", "--reflink=always", src, dst]
+    elif sys.platform == "darwin":
+        cmd = ["cp", "-c", src, dst]
+    else:
+        return False
+    return subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL).returncode == 0
+
+
+def _make_read_only(path):
+    mode = os.stat(path).st_mode
+    if mode & (stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH):
+        os.chmod(path, mode & ~(stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH))
+
+
+def unlink(path):
+    """
+    Remove a file, also when it is a read-only link to a store object (Windows refuses
+    to delete read-only files). The object keeps its content; add_to_store() makes it
+    read-only again the next time it is used.
+    """
+    try:
+        os.remove(path)
+    except PermissionError:
+        os.chmod(path, os.stat(path).st_mode | stat.S_IWUSR)
+        os.remove(path)
+
+
+def _copy_into(path, obj):
+    """Copy next to the object first so a crash never leaves a partial object."""
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(obj))
+    os.close(fd)
+    try:
+        shutil.copy2(path, tmp)
+        os.replace(tmp, obj)
+    except BaseException:
+        os.remove(tmp)
+        raise
+
+
+def link_file(src, dst):
+    """
+    Make dst refer to src's content: hardlink, else reflink, else copy.
+    Return the method used ("existing", "hardlink", "reflink" or "copy").
+    """
+    if os.path.exists(dst):
+        if os.path.samefile(src, dst):
+            return "existing"
+        unlink(dst)
+    try:
+        os.link(src, dst)
+        return "hardlink"
+    except OSError:
+        pass
+    if _reflink(src, dst):
+        return "reflink"
+    shutil.copy2(src, dst)
+    return "copy"
+
+
+def add_to_store(path, store_dir=FONT_STORE_DIR, move=False, digest=None):
+    """
+    Put a font into the store and return (digest, object path, is_new).
+    With move=True the source file is consumed: moved into the store when its content
+    is new, deleted when the store already has it. This avoids a copy for freshly
+    downloaded files. Moving across volumes falls back to copy + remove.
+    """
+    digest = digest or file_hash(path)
+    obj = object_path(store_dir, digest, os.path.splitext(path)[1])
+    if os.path.exists(obj):
+        _make_read_only(obj)
+        if move:
+            unlink(path)
+        return digest, obj, False
+    os.makedirs(os.path.dirname(obj), exist_ok=True)
+    if move:
+        try:
+            os.replace(path, obj)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            _copy_into(path, obj)
+            unlink(path)
+    else:
+        _copy_into(path, obj)
+    _make_read_only(obj)
+    return digest, obj, True
+
+
+def store_and_link(src, dst, store_dir=FONT_STORE_DIR, move=False):
+    """
+    Store src (by content) and expose it at dst. Return (digest, method, is_new).
+    src and dst may be the same path: the file is then replaced by a link to its object.
+    """
+    digest = file_hash(src)
+    same = os.path.abspath(src) == os.path.abspath(dst)
+    if same:
+        obj = object_path(store_dir, digest, os.path.splitext(src)[1])
+        if os.path.exists(obj) and os.path.samefile(obj, dst):
+            return digest, "existing", False
+    digest, obj, is_new = add_to_store(src, store_dir, move=move or same, digest=digest)
+    method = link_file(obj, dst)
+    return digest, method, is_new
+
+
+# -----------------------------
+# Dedupe report
+# -----------------------------
+
+def scan_duplicates(folders):
+    """Return {digest: [paths]} for all fonts in the given folders."""
+    by_size = defaultdict(list)
+    for folder in folders:
+        for file in os.listdir(folder):
+            if file.lower().endswith(FONT_EXTENSIONS):
+                path = os.path.join(folder, file)
+                by_size[os.path.getsize(path)].append(path)
+
+    groups = defaultdict(list)
+    for size, paths in by_size.items():
+        if len(paths) == 1:
+            # a unique size can't have a duplicate, skip hashing it
+            groups[f"size:{size}"].append(paths[0])
+            continue
+        seen = {}
+        for path in paths:
+            # hardlinks to the same object are one file on disk
+            key = (os.stat(path).st_dev, os.stat(path).st_ino)
+            if key not in seen:
+                seen[key] = file_hash(path)
+            groups[seen[key]].append(path)
+    return groups
+
+
+def print_report(groups):
+    total_files = sum(len(p) for p in groups.values())
+    unique_bytes = 0
+    total_bytes = 0
+    disk_bytes = 0
+    for digest, paths in sorted(groups.items(), key=lambda kv: kv[1][0]):
+        size = os.path.getsize(paths[0])
+        unique_bytes += size
+        total_bytes += size * len(paths)
+        disk_bytes += size * len({(os.stat(p).st_dev, os.stat(p).st_ino) for p in paths})
+        if len(paths) > 1:
+            print(f"{digest[:12]}  {size:>10} B  x{len(paths)}")
+            for p in paths:
+                print("   ", p)
+    print("---------------------------------------------------")
+    print(f"Files: {total_files}, unique fonts: {len(groups)}")
+    print(f"Logical size: {total_bytes / 1e6:.1f} MB, unique: {unique_bytes / 1e6:.1f} MB, "
+          f"on disk now: {disk_bytes / 1e6:.1f} MB")
+    print(f"Reclaimable by dedupe: {(disk_bytes - unique_bytes) / 1e6:.1f} MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report (and optionally remove) duplicate fonts via a content-addressed store.")
+    parser.add_argument("folders", nargs="+", help="font folders to scan")
+    parser.add_argument("--store", default=FONT_STORE_DIR, help=f"store directory (default {FONT_STORE_DIR})")
+    parser.add_argument("--apply", action="store_true", help="move fonts into the store and replace them with links")
+    args = parser.parse_args()
+
+    for folder in args.folders:
+        if not os.path.isdir(folder):
+            print("Folder not found:", folder)
+            sys.exit(1)
+
+    groups = scan_duplicates(args.folders)
+    print_report(groups)
+
+    if args.apply:
+        methods = defaultdict(int)
+        for paths in groups.values():
+            for path in paths:
+                _, method, _ = store_and_link(path, path, args.store)
+                methods[method] += 1
+        print("Linked:", ", ".join(f"{m}={n}" for m, n in sorted(methods.items())))
+
+
+if __name__ == "__main__":
+    main()
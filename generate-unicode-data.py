@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Generate unicode_data.py: compact, binary-searchable tables of Unicode blocks, scripts
+and non-printable ranges used by unicode_blocks.py.
+
+Block and script data come from fontTools.unicodedata (Blocks.txt / Scripts.txt of the
+Unicode version fontTools ships). Printability follows str.isprintable() (not printable:
+General_Category Cc, Cf, Zs except space, Zl, Zp, Cs, Co, Cn), with the categories of
+fontTools.unicodedata (unicodedata2 when installed, else Python's). Those can be older
+than Scripts.txt: a codepoint they don't know (Cn) but Scripts.txt assigns to a script,
+like a new CJK extension, counts as printable. Rerun after upgrading fontTools,
+unicodedata2 or Python to pick up a newer Unicode version.
+"""
+
+import os
+import re
+from bisect import bisect_right
+
+from fontTools.unicodedata import Blocks, Scripts, category, unidata_version
+
+OUTPUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "unicode_data.py")
+MAX_CP = 0x10FFFF
+NONPRINTABLE_CATEGORIES = {"Cc", "Cf", "Zs", "Zl", "Zp", "Cs", "Co", "Cn"}
+UNKNOWN_SCRIPT = "Zzzz"
+
+
+def unicode_version():
+    m = re.search(r"Blocks-(\d+\.\d+\.\d+)\.txt", open(Blocks.__file__, encoding="utf-8").read())
+    return m.group(1) if m else "unknown"
+
+
+def partition(starts, values):
+    """Merge adjacent ranges with the same value; return (starts, names, indices)."""
+    names = sorted(set(values))
+    merged_starts, indices = [], []
+    for start, value in zip(starts, values):
+        idx = names.index(value)
+        if indices and indices[-1] == idx:
+            continue
+        merged_starts.append(start)
+        indices.append(idx)
+    return merged_starts, names, indices
+
+
+def is_printable(cp):
+    cat = category(chr(cp))
+    if cat == "Cn":
+        # unassigned in the category data, but maybe assigned in the (newer) Scripts.txt
+        return Scripts.VALUES[bisect_right(Scripts.RANGES, cp) - 1] != UNKNOWN_SCRIPT
+    return cat not in NONPRINTABLE_CATEGORIES or cp == 0x20
+
+
+def nonprintable_ranges():
+    ranges = []
+    start = None
+    for cp in range(MAX_CP + 2):
+        printable = cp > MAX_CP or is_printable(cp)
+        if not printable and start is None:
+            start = cp
+        elif printable and start is not None:
+            ranges.append((start, cp - 1))
+            start = None
+    return ranges
+
+
+def format_array(name, typecode, values, per_line=8, hex_values=True):
+    lines = [f'{name} = array("{typecode}", [']
+    for i in range(0, len(values), per_line):
+        chunk = values[i:i + per_line]
+        lines.append("    " + ", ".join(f"0x{v:05X}" if hex_values else str(v) for v in chunk) + ",")
+    lines.append("])")
+    return "\n".join(lines)
+
+
+def format_names(name, names):
+    lines = [f"{name} = ("]
+    lines.extend(f"    {n!r}," for n in names)
+    lines.append(")")
+    return "\n".join(lines)
+
+
+def main():
+    block_starts, block_names, block_index = partition(Blocks.RANGES, Blocks.VALUES)
+    script_values = [Scripts.NAMES.get(v, v).replace("_", " ") for v in Scripts.VALUES]
+    script_starts, script_names, script_index = partition(Scripts.RANGES, script_values)
+    nonprintable = nonprintable_ranges()
+
+    parts = [
+        "# Generated by generate-unicode-data.py, do not edit.",
+        f"# Blocks and scripts: Unicode {unicode_version()} (fontTools.unicodedata).",
+        f"# Printability: General_Category of Unicode {unidata_version} (fontTools.unicodedata),",
+        "# plus codepoints assigned to a script since then.",
+        "#",
+        "# *_STARTS partition 0..0x10FFFF: entry i covers STARTS[i]..STARTS[i+1]-1 and",
+        "# *_INDEX[i] is its position in *_NAMES. Look up with bisect_right(STARTS, cp) - 1.",
+        "",
+        "from array import array",
+        "",
+        f"UNICODE_VERSION = {unicode_version()!r}",
+        "",
+        format_names("BLOCK_NAMES", block_names),
+        "",
+        format_array("BLOCK_STARTS", "I", block_starts),
+        "",
+        format_array("BLOCK_INDEX", "H", block_index, per_line=16, hex_values=False),
+        "",
+        format_names("SCRIPT_NAMES", script_names),
+        "",
+        format_array("SCRIPT_STARTS", "I", script_starts),
+        "",
+        format_array("SCRIPT_INDEX", "H", script_index, per_line=16, hex_values=False),
+        "",
+        "# Sorted, non-overlapping (start, end) runs of non-printable codepoints",
+        format_array("NONPRINTABLE_STARTS", "I", [a for a, _ in nonprintable]),
+        "",
+        format_array("NONPRINTABLE_ENDS", "I", [b for _, b in nonprintable]),
+        "",
+    ]
+    with open(OUTPUT, "w", encoding="utf-8", newline="\r\n") as f:
+        f.write("\n".join(parts))
+    print(f"Wrote {OUTPUT}: {len(block_starts)} block ranges, {len(script_starts)} script ranges, "
+          f"{len(nonprintable)} non-printable ranges")
+
+
+if __name__ == "__main__":
+    main()
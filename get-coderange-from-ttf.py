@@ -1,16 +1,23 @@
 from fontTools.ttLib import TTFont
+from font_ranges import merge_ranges, points_to_ranges
+from unicode_blocks import block_ranges, format_block_coverage, script_ranges
 
 # === CONFIGURATION ===
 input_font = r"E:\Fonts\chinese_fonts_filtered\NotoSansSC-Regular.ttf"  # Chinese
 max_glyphs_per_chunk = 256   # max glyphs per range
-start_cp_filter = 0x4E00     # only include codepoints >= 0x4E00
+# codepoints of these Unicode scripts are included (Han: ideographs, radicals, Ext-A...)
+script_filter = {"Han"}
+# plus these blocks: CJK punctuation and fullwidth forms (，。！？：；「」) are Common script
+extra_blocks = {"CJK Symbols and Punctuation", "Halfwidth and Fullwidth Forms"}
 
 # === LOAD FONT ===
 font = TTFont(input_font)
 cmap = font.getBestCmap()  # {unicode: glyph_name}
 
-# sort codepoints and filter for Chinese characters
-codepoints = sorted(cp for cp in cmap.keys() if cp >= start_cp_filter)
+# sort codepoints and filter for Chinese characters and punctuation
+cmap_ranges = points_to_ranges(sorted(cmap))
+chinese_ranges = merge_ranges(script_ranges(cmap_ranges, script_filter) + block_ranges(cmap_ranges, extra_blocks))
+codepoints = [cp for a, b in chinese_ranges for cp in range(a, b + 1)]
 
 # list to store ranges
 ranges_list = []
@@ -18,14 +25,19 @@ ranges_list = []
 # === CALCULATE RANGES ===
 for i in range(0, len(codepoints), max_glyphs_per_chunk):
     chunk = codepoints[i:i + max_glyphs_per_chunk]
-    start_cp = chunk[0]
-    end_cp = chunk[-1]
-    ranges_list.append(f"0x{start_cp:04X}-0x{end_cp:04X}")
+    # a chunk may span gaps with other scripts, so list its runs instead of first-last
+    ranges_list.append(",".join(f"0x{a:04X}-0x{b:04X}" for a, b in points_to_ranges(chunk)))
 
 # === PRINT RANGES ===
-all_ranges = ",".join(ranges_list)
-print("Ranges for conversion (Chinese characters 0x4E00+):")
-print(all_ranges)
+filter_names = ", ".join(sorted(script_filter)) + " script, " + ", ".join(sorted(extra_blocks))
+print(f"Coverage per Unicode block ({filter_names}):")
+for line in format_block_coverage(chinese_ranges):
+    print(" ", line)
+
+# one chunk (at most max_glyphs_per_chunk glyphs, one lv_font_conv -r argument) per line
+print(f"Ranges for conversion ({filter_names}), {len(ranges_list)} chunks:")
+for chunk_ranges in ranges_list:
+    print(chunk_ranges)
 
 
 
@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+"""
+Glyph closure of a codepoint set over GSUB (and composite glyphs), with GPOS stats and
+a size estimate, for sizing shaped scripts like Arabic.
+
+cmap coverage alone misses the glyphs that shaping reaches only through GSUB (init/
+medi/fina/isol forms, ligatures, ...). This walks the substitution lookups of the
+shaping features from the target codepoints to a fixed point and reports:
+  - how many glyphs the subset really needs,
+  - the extra codepoints (e.g. Presentation Forms 0xFB50-0xFDFF, 0xFE70-0xFEFF) that
+    map to closure glyphs, which LVGL's own Arabic shaping needs in the font,
+  - closure glyphs with no codepoint at all (unreachable without a shaper),
+  - GPOS kerning pairs and mark attachments among the closure glyphs,
+  - the LVGL size of target + extra codepoints, with the size model of
+    estimate-lvgl-size.py (lv_font_conv selects by codepoint, so unmapped glyphs are
+    not part of it).
+
+Fonts are parsed once per (path, mtime, size) and closure results are memoized, so
+repeated queries on the same font are cheap.
+"""
+
+import argparse
+import os
+import sys
+
+from fontTools.ttLib import TTFont
+
+from font_ranges import flatten_ranges, format_range_str, parse_range_str, points_to_ranges
+from lvgl_size import FontSizeModel
+
+# Unicode ranges to check (covers full Arabic + basic Latin), as in ttf-download-arabic.py
+TARGET_RANGE_STR = "0x0020-0x007D,0x0600-0x06FF,0x0750-0x077F,0x08A0-0x08FF"
+
+# GSUB features a shaper applies for Arabic (required + default-on)
+SHAPING_FEATURES = ("ccmp", "locl", "isol", "init", "medi", "med2", "fina", "fin2", "fin3",
+                    "rlig", "calt", "liga", "mset")
+# GPOS features whose data ends up in the subset
+POSITIONING_FEATURES = ("kern", "mark", "mkmk", "curs")
+# results kept per font and memo (oldest dropped first)
+MEMO_SIZE = 256
+
+
+# -----------------------------
+# GSUB rules
+# -----------------------------
+
+def _lookup_indices(table, features):
+    """Lookup indices referenced by the given feature tags (any script/language)."""
+    indices = set()
+    if table.FeatureList is None:
+        return indices
+    for rec in table.FeatureList.FeatureRecord:
+        if rec.FeatureTag in features:
+            indices.update(rec.Feature.LookupListIndex)
+    return indices
+
+
+def _subtables(lookup):
+    for sub in lookup.SubTable:
+        if lookup.LookupType == 7:
+            yield sub.ExtSubTable.LookupType, sub.ExtSubTable
+        else:
+            yield lookup.LookupType, sub
+
+
+def _compile_lookup(lookup):
+    """
+    Turn a GSUB lookup into plain rules:
+      ("map", {glyph: [glyphs]})                 single/multiple/alternate/reverse
+      ("lig", {first: [(components, lig)]})      ligature
+      ("ctx", {nested lookup indices})           contextual/chaining
+    """
+    rules = []
+    for ltype, sub in _subtables(lookup):
+        if ltype == 1:
+            rules.append(("map", {g: [s] for g, s in sub.mapping.items()}))
+        elif ltype == 2:
+            rules.append(("map", {g: list(s) for g, s in sub.mapping.items()}))
+        elif ltype == 3:
+            rules.append(("map", {g: list(s) for g, s in sub.alternates.items()}))
+        elif ltype == 4:
+            rules.append(("lig", {
+                first: [(tuple(lig.Component), lig.LigGlyph) for lig in ligs]
+                for first, ligs in sub.ligatures.items()
+            }))
+        elif ltype in (5, 6):
+            nested = set()
+            for attr in ("SubstLookupRecord", "SubRuleSet", "SubClassSet", "ChainSubRuleSet",
+                         "ChainSubClassSet"):
+                _collect_nested(getattr(sub, attr, None), nested)
+            rules.append(("ctx", nested))
+        elif ltype == 8:
+            rules.append(("map", {g: [s] for g, s in zip(sub.Coverage.glyphs, sub.Substitute)}))
+    return rules
+
+
+def _collect_nested(obj, out):
+    """Collect LookupListIndex values from (nested lists of) context rule objects."""
+    if obj is None:
+        return
+    if isinstance(obj, list):
+        for o in obj:
+            _collect_nested(o, out)
+        return
+    if hasattr(obj, "LookupListIndex"):
+        out.add(obj.LookupListIndex)
+        return
+    for attr in ("SubstLookupRecord", "SubRule", "SubClassRule", "ChainSubRule", "ChainSubClassRule"):
+        _collect_nested(getattr(obj, attr, None), out)
+
+
+# -----------------------------
+# Per-font analysis (memoized)
+# -----------------------------
+
+def _memo(cache, key, fn):
+    if key not in cache:
+        if len(cache) >= MEMO_SIZE:
+            del cache[next(iter(cache))]
+        cache[key] = fn(*key)
+    return cache[key]
+
+
+class FontClosure:
+    def __init__(self, path):
+        self.path = path
+        self.font = TTFont(path, lazy=True)
+        self.size_models = {}
+        # memos live on the instance, so open_font() dropping a font frees them too
+        self.closures = {}
+        self.gpos = {}
+        self.cmap = self.font.getBestCmap()
+        self.reverse_cmap = {}
+        for cp, g in self.cmap.items():
+            self.reverse_cmap.setdefault(g, []).append(cp)
+
+        self.lookups = []
+        self.feature_lookups = {}
+        if "GSUB" in self.font and self.font["GSUB"].table.LookupList:
+            table = self.font["GSUB"].table
+            self.lookups = [_compile_lookup(lk) for lk in table.LookupList.Lookup]
+            for tag in {rec.FeatureTag for rec in (table.FeatureList.FeatureRecord if table.FeatureList else [])}:
+                self.feature_lookups[tag] = frozenset(_lookup_indices(table, {tag}))
+
+        self.components = {}
+        if "glyf" in self.font:
+            glyf = self.font["glyf"]
+            for name in self.font.getGlyphOrder():
+                g = glyf[name]
+                if g.isComposite():
+                    self.components[name] = g.getComponentNames(glyf)
+
+    def closure(self, codepoints, features):
+        """Glyph names needed to render `codepoints` (frozenset) with GSUB `features`."""
+        return _memo(self.closures, (codepoints, features), self._closure)
+
+    def _closure(self, codepoints, features):
+        glyphs = {self.font.getGlyphName(0)}
+        glyphs.update(self.cmap[cp] for cp in codepoints if cp in self.cmap)
+
+        active = set()
+        for tag in features:
+            active |= self.feature_lookups.get(tag, frozenset())
+        # contextual lookups pull in their nested lookups (conservatively, for any context)
+        todo = list(active)
+        while todo:
+            for kind, data in self.lookups[todo.pop()]:
+                if kind == "ctx":
+                    for idx in data - active:
+                        if idx < len(self.lookups):
+                            active.add(idx)
+                            todo.append(idx)
+
+        changed = True
+        while changed:
+            before = len(glyphs)
+            for idx in sorted(active):
+                for kind, data in self.lookups[idx]:
+                    if kind == "map":
+                        for g in [g for g in data if g in glyphs]:
+                            glyphs.update(data[g])
+                    elif kind == "lig":
+                        for first in [g for g in data if g in glyphs]:
+                            for comps, lig in data[first]:
+                                if all(c in glyphs for c in comps):
+                                    glyphs.add(lig)
+            changed = len(glyphs) != before
+
+        # composite glyphs need their components
+        todo = [g for g in glyphs if g in self.components]
+        while todo:
+            for c in self.components[todo.pop()]:
+                if c not in glyphs:
+                    glyphs.add(c)
+                    if c in self.components:
+                        todo.append(c)
+        return frozenset(glyphs)
+
+    def gpos_stats(self, glyphs):
+        """(kerning pairs, mark attachments) among the given glyphs for POSITIONING_FEATURES."""
+        return _memo(self.gpos, (glyphs,), self._gpos_stats)
+
+    def _gpos_stats(self, glyphs):
+        pairs = marks = 0
+        if "GPOS" not in self.font or not self.font["GPOS"].table.LookupList:
+            return pairs, marks
+        table = self.font["GPOS"].table
+        for idx in sorted(_lookup_indices(table, set(POSITIONING_FEATURES))):
+            lookup = table.LookupList.Lookup[idx]
+            for sub in lookup.SubTable:
+                ltype = lookup.LookupType
+                if ltype == 9:
+                    sub, ltype = sub.ExtSubTable, sub.ExtSubTable.LookupType
+                if ltype == 2 and sub.Format == 1:
+                    for first, pset in zip(sub.Coverage.glyphs, sub.PairSet):
+                        if first in glyphs:
+                            pairs += sum(1 for r in pset.PairValueRecord if r.SecondGlyph in glyphs)
+                elif ltype == 2 and sub.Format == 2:
+                    firsts = sum(1 for g in sub.Coverage.glyphs if g in glyphs)
+                    seconds = sum(1 for g, c in sub.ClassDef2.classDefs.items() if c and g in glyphs)
+                    pairs += firsts * seconds
+                elif ltype in (4, 5, 6):
+                    mark_cov = sub.MarkCoverage if ltype != 6 else sub.Mark1Coverage
+                    marks += sum(1 for g in mark_cov.glyphs if g in glyphs)
+        return pairs, marks
+
+    def size_model(self, px_size):
+        """The LVGL size model of this font at px_size (built once per size)."""
+        if px_size not in self.size_models:
+            self.size_models[px_size] = FontSizeModel(self.path, px_size)
+        return self.size_models[px_size]
+
+    def close(self):
+        for model in self.size_models.values():
+            model.close()
+        self.font.close()
+
+
+_fonts = {}
+
+
+def open_font(path):
+    """Return the memoized FontClosure for path, reparsing it only when the file changes."""
+    st = os.stat(path)
+    key = (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+    fc = _fonts.get(key)
+    if fc is None:
+        for old in [k for k in _fonts if k[0] == key[0]]:
+            _fonts.pop(old).close()
+        fc = _fonts[key] = FontClosure(path)
+    return fc
+
+
+def analyze(path, target_ranges, features=SHAPING_FEATURES, px_size=16, bpp=4):
+    fc = open_font(path)
+    target = frozenset(flatten_ranges(target_ranges))
+    cmap_glyphs = {fc.cmap[cp] for cp in target if cp in fc.cmap}
+    glyphs = fc.closure(target, frozenset(features))
+
+    extra_cps = sorted(cp for g in glyphs for cp in fc.reverse_cmap.get(g, []) if cp not in target)
+    notdef = fc.font.getGlyphName(0)
+    unmapped = sorted(g for g in glyphs if g not in fc.reverse_cmap and g != notdef)
+    kern_pairs, mark_attachments = fc.gpos_stats(glyphs)
+
+    # what lv_font_conv would generate for target + extra codepoints
+    lvgl_cps = sorted({cp for cp in target if cp in fc.cmap} | set(extra_cps))
+    size = fc.size_model(px_size).estimate(points_to_ranges(lvgl_cps))
+    return {
+        "target_codepoints": len(target),
+        "cmap_glyphs": len(cmap_glyphs),
+        "closure_glyphs": len(glyphs),
+        "extra_codepoints": extra_cps,
+        "unmapped_glyphs": unmapped,
+        "kern_pairs": kern_pairs,
+        "mark_attachments": mark_attachments,
+        "lvgl_glyphs": size["glyphs"],
+        "bitmap_bytes": size["bitmap"][bpp],
+        "kerning_bytes": size["kerning"],
+        "estimated_bytes": size["total"][bpp],
+    }
+
+
+def print_report(path, res, px_size, bpp):
+    print(f"\nFile: {os.path.basename(path)}")
+    print(f"  Target codepoints:   {res['target_codepoints']}")
+    print(f"  Glyphs via cmap:     {res['cmap_glyphs']}")
+    print(f"  Glyphs after GSUB:   {res['closure_glyphs']}")
+    print(f"  Extra codepoints:    {len(res['extra_codepoints'])}")
+    if res["extra_codepoints"]:
+        print(f"    {format_range_str(points_to_ranges(res['extra_codepoints']))}")
+    print(f"  Unmapped glyphs:     {len(res['unmapped_glyphs'])} (reachable only through a shaper, not in the LVGL font)")
+    print(f"  GPOS kerning pairs:  {res['kern_pairs']}")
+    print(f"  GPOS mark anchors:   {res['mark_attachments']}")
+    print(f"  LVGL glyphs (target + extra codepoints): {res['lvgl_glyphs']}")
+    print(f"  Estimated size @ {px_size}px {bpp}bpp: {res['estimated_bytes']} B "
+          f"({res['estimated_bytes'] / 1024:.1f} KiB, bitmap {res['bitmap_bytes']} B, "
+          f"kerning {res['kerning_bytes']} B)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="GSUB glyph closure and size estimate for a codepoint set.")
+    parser.add_argument("fonts", nargs="+", help="TTF/OTF files")
+    parser.add_argument("--range", dest="range_str", default=TARGET_RANGE_STR,
+                        help=f"target ranges (default: {TARGET_RANGE_STR})")
+    parser.add_argument("--features", default=",".join(SHAPING_FEATURES),
+                        help="comma separated GSUB features to follow")
+    parser.add_argument("--size", type=int, default=16, help="font size in pixels (default 16)")
+    parser.add_argument("--bpp", type=int, default=4, choices=(1, 2, 4, 8), help="bits per pixel (default 4)")
+    args = parser.parse_args()
+
+    target_ranges = parse_range_str(args.range_str)
+    features = tuple(f.strip() for f in args.features.split(",") if f.strip())
+    for path in args.fonts:
+        if not os.path.exists(path):
+            print("File not found:", path)
+            sys.exit(1)
+        res = analyze(path, target_ranges, features, args.size, args.bpp)
+        print_report(path, res, args.size, args.bpp)
+
+
+if __name__ == "__main__":
+    main()
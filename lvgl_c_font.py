@@ -0,0 +1,134 @@
+"""
+Parser for LVGL C font files (lv_font_conv output), shared by read-lvgl-c-file.py,
+preview-glyphs-contact-sheet.py and font-pipeline.py.
+
+The cmaps table (with its unicode_list_N / glyph_id_ofs_list_N arrays) is parsed up
+front; glyph descriptors and bitmap data are only parsed when they are used, since the
+glyph_bitmap array of a CJK font is large and most callers only need the codepoints.
+
+  font = read_lvgl_c_file("font_chinese_16.c")
+  font.codepoints()   # sorted codepoints
+  font.cmap           # {codepoint: glyph id}
+  font.glyphs         # [(bitmap_index, adv_w, box_w, box_h, ofs_x, ofs_y)] by glyph id
+  font.bitmap         # glyph_bitmap as bytes
+"""
+
+import re
+from functools import cached_property
+
+HEX_RE = re.compile(r"0x[0-9A-Fa-f]+")
+INT_RE = re.compile(r"-?0x[0-9A-Fa-f]+|-?\d+")
+COMMENT_RE = re.compile(r"/\*.*?\*/|//[^\n]*", re.DOTALL)
+FIELD_RE = re.compile(r"\.(?P<key>[a-zA-Z0-9_]+)\s*=\s*(?P<val>[^,}\n]+)")
+
+
+def strip_comments(content):
+    """Remove C comments (the glyph_bitmap comments quote characters like '{' and '}')."""
+    return COMMENT_RE.sub(" ", content)
+
+
+def find_array_body(content, name):
+    """Initializer body of `name[] = { ... };`, or '' if the array isn't there."""
+    m = re.search(r"\b" + re.escape(name) + r"\s*\[\s*\]\s*=\s*\{(?P<body>.*?)\};", content, re.DOTALL)
+    return m.group("body") if m else ""
+
+
+def find_arrays(content, prefix):
+    """{name: body} of all arrays named prefix + number, e.g. unicode_list_0."""
+    arr_re = re.compile(r"\b(" + re.escape(prefix) + r"\d+)\s*\[\s*\]\s*=\s*\{(.*?)\};", re.DOTALL)
+    return {m.group(1): m.group(2) for m in arr_re.finditer(content)}
+
+
+def split_entries(body):
+    """Split the top-level '{...}' entries of a C array initializer."""
+    entries = []
+    depth = 0
+    cur = []
+    for ch in body:
+        if ch == '{':
+            depth += 1
+        if depth > 0:
+            cur.append(ch)
+        if ch == '}':
+            depth -= 1
+            if depth == 0:
+                entries.append(''.join(cur))
+                cur = []
+    return entries
+
+
+def fields(block):
+    """{key: raw value} of the '.key = value' designated initializers in block."""
+    return {m.group("key"): m.group("val").strip() for m in FIELD_RE.finditer(block)}
+
+
+def int_field(f, key, default=None):
+    """Integer value (hex or decimal) of a field, or default if missing/not a number."""
+    v = f.get(key)
+    if v is None:
+        return default
+    m = INT_RE.search(v)
+    return int(m.group(0), 0) if m else default
+
+
+def _list_ref(f, key, lists, prefix):
+    m = re.search(re.escape(prefix) + r"\d+", f.get(key, ""))
+    return lists.get(m.group(0)) if m else None
+
+
+def parse_cmaps(content):
+    """
+    Return {codepoint: glyph id} from the cmaps table of comment-free C source.
+    unicode_list_N holds offsets from range_start (sparse formats), glyph_id_ofs_list_N
+    glyph id offsets from glyph_id_start (FORMAT0_FULL / SPARSE_FULL).
+    """
+    unicode_lists = {name: [int(h, 16) for h in HEX_RE.findall(body)]
+                     for name, body in find_arrays(content, "unicode_list_").items()}
+    ofs_lists = {name: [int(v, 0) for v in INT_RE.findall(body)]
+                 for name, body in find_arrays(content, "glyph_id_ofs_list_").items()}
+
+    cmap = {}
+    for entry in split_entries(find_array_body(content, "cmaps")):
+        f = fields(entry)
+        rs = int_field(f, "range_start")
+        if rs is None:
+            continue
+        gid = int_field(f, "glyph_id_start", 0)
+        ulist = _list_ref(f, "unicode_list", unicode_lists, "unicode_list_")
+        olist = _list_ref(f, "glyph_id_ofs_list", ofs_lists, "glyph_id_ofs_list_")
+        offsets = ulist if ulist is not None else range(int_field(f, "range_length", 0))
+        for i, off in enumerate(offsets):
+            cmap[rs + off] = gid + (olist[i] if olist else i)
+    return cmap
+
+
+class LVGLCFont:
+    def __init__(self, content):
+        self.content = strip_comments(content)
+        dsc = fields(self.content)
+        self.bpp = int_field(dsc, "bpp", 4)
+        self.bitmap_format = int_field(dsc, "bitmap_format", 0)
+        self.line_height = int_field(dsc, "line_height")
+        self.base_line = int_field(dsc, "base_line", 0)
+        self.cmap = parse_cmaps(self.content)
+
+    def codepoints(self):
+        return sorted(self.cmap)
+
+    @cached_property
+    def glyphs(self):
+        out = []
+        for entry in split_entries(find_array_body(self.content, "glyph_dsc")):
+            f = fields(entry)
+            out.append(tuple(int_field(f, key, 0) for key in
+                             ("bitmap_index", "adv_w", "box_w", "box_h", "ofs_x", "ofs_y")))
+        return out
+
+    @cached_property
+    def bitmap(self):
+        return bytes(int(h, 16) for h in HEX_RE.findall(find_array_body(self.content, "glyph_bitmap")))
+
+
+def read_lvgl_c_file(path):
+    with open(path, "r", encoding="utf-8", errors="ignore") as f:
+        return LVGLCFont(f.read())
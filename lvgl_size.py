@@ -0,0 +1,222 @@
+"""
+LVGL font size model (lv_font_conv output), shared by estimate-lvgl-size.py and
+gsub-closure.py.
+
+Glyph bounding boxes are read from the TTF (glyf headers, or CFF outlines), scaled to
+the target pixel size and turned into bitmap sizes for 1/2/4/8 bpp in one vectorized
+pass. cmap, glyph_dsc and kerning overhead is added per range. lv_font_conv selects
+glyphs by codepoint, so only glyphs reachable through the cmap are counted.
+"""
+
+from collections import defaultdict
+
+import numpy as np
+from fontTools.ttLib import TTFont
+
+from font_ranges import points_to_ranges
+
+BPPS = (1, 2, 4, 8)
+
+# sizeof() of the lv_font_fmt_txt structures on a 32-bit target
+GLYPH_DSC_SIZE = 8    # bitmap_index:20, adv_w:12, box_w, box_h, ofs_x, ofs_y
+CMAP_ENTRY_SIZE = 20  # range_start, range_length, glyph_id_start, 2 pointers, list_length, type
+FONT_DSC_SIZE = 40    # lv_font_fmt_txt_dsc_t + lv_font_t, per generated font
+
+# lv_font_conv stores runs at least this long as FORMAT0_TINY, the rest as SPARSE_TINY
+MIN_DENSE_RUN = 8
+
+
+# -----------------------------
+# Glyph bounds
+# -----------------------------
+
+def glyf_bounds(font):
+    """
+    Return an (n_glyphs, 4) int array of xMin, yMin, xMax, yMax read straight from
+    the glyf headers (no per-glyph decompilation). Empty glyphs get all zeros.
+    """
+    data = np.frombuffer(font.reader["glyf"], dtype=np.uint8)
+    loca = np.asarray(font["loca"].locations, dtype=np.int64)
+    starts, ends = loca[:-1], loca[1:]
+    has_outline = (ends - starts) >= 10
+    bounds = np.zeros((len(starts), 4), dtype=np.int64)
+    if has_outline.any():
+        # header: numberOfContours, xMin, yMin, xMax, yMax (all int16, big endian)
+        idx = starts[has_outline, None] + np.arange(2, 10)
+        raw = data[idx].astype(np.int64)
+        words = (raw[:, 0::2] << 8) | raw[:, 1::2]
+        bounds[has_outline] = np.where(words >= 0x8000, words - 0x10000, words)
+    return bounds
+
+
+def cff_bounds(font):
+    """Bounds for CFF fonts, which do not store them: computed from the charstrings."""
+    from fontTools.pens.boundsPen import ControlBoundsPen
+
+    glyph_set = font.getGlyphSet()
+    order = font.getGlyphOrder()
+    bounds = np.zeros((len(order), 4), dtype=np.int64)
+    for gid, name in enumerate(order):
+        pen = ControlBoundsPen(glyph_set)
+        glyph_set[name].draw(pen)
+        if pen.bounds:
+            bounds[gid] = [round(v) for v in pen.bounds]
+    return bounds
+
+
+def glyph_bounds(font):
+    if "glyf" in font:
+        return glyf_bounds(font)
+    return cff_bounds(font)
+
+
+# -----------------------------
+# Kerning
+# -----------------------------
+
+def kerning_pairs(font):
+    """
+    Return (pairs, class_defs): pairs is a {(left_gid, right_gid): value} dict from
+    the 'kern' table and GPOS PairPos format 1; class_defs is a list of
+    (coverage_gids, right_classes, n_left_classes, n_right_classes) for GPOS
+    PairPos format 2.
+    """
+    rev = font.getReverseGlyphMap()
+    pairs = {}
+    class_defs = []
+
+    if "kern" in font:
+        for sub in font["kern"].kernTables:
+            for (left, right), value in getattr(sub, "kernTable", {}).items():
+                if value and left in rev and right in rev:
+                    pairs[rev[left], rev[right]] = value
+
+    if "GPOS" in font and font["GPOS"].table.LookupList:
+        for lookup in font["GPOS"].table.LookupList.Lookup:
+            for sub in lookup.SubTable:
+                if lookup.LookupType == 9:
+                    sub = sub.ExtSubTable
+                if getattr(sub, "LookupType", lookup.LookupType) != 2:
+                    continue
+                if sub.Format == 1:
+                    for first, pset in zip(sub.Coverage.glyphs, sub.PairSet):
+                        for rec in pset.PairValueRecord:
+                            value = getattr(rec.Value1, "XAdvance", 0) if rec.Value1 else 0
+                            pairs.setdefault((rev[first], rev[rec.SecondGlyph]), value)
+                elif sub.Format == 2:
+                    cov = {rev[g] for g in sub.Coverage.glyphs}
+                    right = {rev[g]: c for g, c in sub.ClassDef2.classDefs.items()}
+                    class_defs.append((cov, right, sub.Class1Count, sub.Class2Count))
+    return pairs, class_defs
+
+
+def kerning_size(pairs, class_defs, gids):
+    """
+    Estimate kerning bytes for the included glyphs: the smaller of the pair format
+    (ids + 1 byte value per pair) and the class format (1 byte class per glyph on each
+    side plus a left*right value matrix), like lv_font_conv chooses. For pair kerning
+    the classes are derived like lv_font_conv does: left glyphs with the same row of
+    values share a class, and so do right glyphs with the same column.
+    """
+    included = set(gids.tolist())
+    if not included:
+        return 0
+    id_size = 2 if len(included) > 255 else 1
+    rows = defaultdict(list)
+    cols = defaultdict(list)
+    for (a, b), value in sorted(pairs.items()):
+        if a in included and b in included:
+            rows[a].append((b, value))
+            cols[b].append((a, value))
+    n_pairs = sum(len(r) for r in rows.values())
+    for cov, right, _, _ in class_defs:
+        n_right = sum(1 for b in included if right.get(b, 0))
+        n_pairs += len(cov & included) * n_right
+    if n_pairs == 0:
+        return 0
+    pair_bytes = n_pairs * (2 * id_size + 1)
+
+    # class 0 is "no kerning" on both sides
+    n_left = 1 + len({tuple(r) for r in rows.values()}) + sum(c1 for _, _, c1, _ in class_defs)
+    n_right = 1 + len({tuple(c) for c in cols.values()}) + sum(c2 for _, _, _, c2 in class_defs)
+    class_bytes = 2 * (len(included) + 1) + n_left * n_right
+    return min(pair_bytes, class_bytes)
+
+
+# -----------------------------
+# Size model
+# -----------------------------
+
+def cmap_size(codepoints):
+    """Estimate cmap bytes for a sorted array of codepoints."""
+    if len(codepoints) == 0:
+        return 0
+    breaks = np.flatnonzero(np.diff(codepoints) != 1) + 1
+    run_lengths = np.diff(np.concatenate(([0], breaks, [len(codepoints)])))
+    dense = run_lengths >= MIN_DENSE_RUN
+    n_sparse = int(run_lengths[~dense].sum())
+    size = int(dense.sum()) * CMAP_ENTRY_SIZE
+    if n_sparse:
+        sparse_cps = codepoints[np.repeat(~dense, run_lengths)]
+        # unicode_list holds uint16 offsets, so a sparse entry spans at most 0xFFFF
+        n_entries = len(np.unique((sparse_cps - sparse_cps[0]) >> 16))
+        size += n_entries * CMAP_ENTRY_SIZE + 2 * n_sparse
+    return size
+
+
+class FontSizeModel:
+    def __init__(self, path, px_size):
+        self.font = TTFont(path, lazy=True)
+        cmap = self.font.getBestCmap()
+        rev = self.font.getReverseGlyphMap()
+        self.codepoints = np.array(sorted(cmap), dtype=np.int64)
+        self.gids = np.array([rev[cmap[cp]] for cp in self.codepoints.tolist()], dtype=np.int64)
+
+        scale = px_size / self.font["head"].unitsPerEm
+        b = glyph_bounds(self.font)
+        box_w = np.ceil(b[:, 2] * scale) - np.floor(b[:, 0] * scale)
+        box_h = np.ceil(b[:, 3] * scale) - np.floor(b[:, 1] * scale)
+        pixels = np.where((b[:, 2] > b[:, 0]) & (b[:, 3] > b[:, 1]), box_w * box_h, 0).astype(np.int64)
+        # (n_glyphs, len(BPPS)): each glyph bitmap starts on a byte boundary
+        self.bitmap_bytes = (pixels[:, None] * np.array(BPPS) + 7) // 8
+
+        self.pairs, self.class_defs = kerning_pairs(self.font)
+
+    def select(self, ranges):
+        """Return the indices (into self.codepoints) of the codepoints inside ranges."""
+        parts = []
+        for a, b in ranges:
+            lo = np.searchsorted(self.codepoints, a, side="left")
+            hi = np.searchsorted(self.codepoints, b, side="right")
+            parts.append(np.arange(lo, hi))
+        if not parts:
+            return np.zeros(0, dtype=np.int64)
+        return np.unique(np.concatenate(parts))
+
+    def estimate(self, ranges, kerning=True):
+        idx = self.select(ranges)
+        cps = self.codepoints[idx]
+        gids = self.gids[idx]
+        bitmap = self.bitmap_bytes[gids].sum(axis=0)
+        dsc = (len(cps) + 1) * GLYPH_DSC_SIZE
+        cm = cmap_size(cps)
+        kern = kerning_size(self.pairs, self.class_defs, gids) if kerning else 0
+        overhead = dsc + cm + kern + FONT_DSC_SIZE
+        return {
+            "glyphs": len(cps),
+            "bitmap": {bpp: int(v) for bpp, v in zip(BPPS, bitmap)},
+            "glyph_dsc": dsc,
+            "cmap": cm,
+            "kerning": kern,
+            "total": {bpp: int(v) + overhead for bpp, v in zip(BPPS, bitmap)},
+        }
+
+    def chunk_ranges(self, ranges, max_glyphs_per_chunk):
+        """Split the selected codepoints into chunks like get-coderange-from-ttf.py does."""
+        cps = self.codepoints[self.select(ranges)].tolist()
+        # runs of each chunk, so gaps (other scripts, missing glyphs) stay out of it
+        return [points_to_ranges(cps[i:i + max_glyphs_per_chunk])
+                for i in range(0, len(cps), max_glyphs_per_chunk)]
+
+    def close(self):
+        self.font.close()
@@ -1,63 +1,23 @@
 import os
-from fontTools.ttLib import TTFont
 
-def get_unicode_ranges(ttf_path):
-    """Extract Unicode ranges from a TTF file as a list of (start, end) tuples."""
-    try:
-        font = TTFont(ttf_path)
-        cmap = font["cmap"].getBestCmap()
-        points = sorted(cmap.keys())
-        font.close()
-    except Exception as e:
-        print(f"Error reading {ttf_path}: {e}")
-        return []
-
-    if not points:
-        return []
-
-    ranges = []
-    start = prev = points[0]
-    for cp in points[1:]:
-        if cp != prev + 1:
-            ranges.append((start, prev))
-            start = cp
-        prev = cp
-    ranges.append((start, prev))
-    return ranges
-
-
-def parse_range_str(range_str):
-    """Convert something like '0x0600-0x06FF,0x0750-0x077F' to a list of (start, end) ints."""
-    parts = range_str.split(",")
-    ranges = []
-    for p in parts:
-        if "-" in p:
-            a, b = p.split("-")
-            ranges.append((int(a, 16), int(b, 16)))
-        else:
-            v = int(p, 16)
-            ranges.append((v, v))
-    return ranges
-
-
-def flatten_ranges(ranges):
-    """Return a set of all codepoints covered by the given ranges."""
-    s = set()
-    for a, b in ranges:
-        s.update(range(a, b + 1))
-    return s
+from font_ranges import (
+    contains_ranges,
+    format_range_str,
+    get_unicode_ranges,
+    missing_ranges,
+    parse_range_str,
+    same_ranges,
+)
 
 
 def font_matches_range(font_ranges, target_ranges):
     """Check if the font exactly covers the same codepoints as the target ranges."""
-    return flatten_ranges(font_ranges) == flatten_ranges(target_ranges)
+    return same_ranges(font_ranges, target_ranges)
 
 
 def font_contains_range(font_ranges, target_ranges):
     """Check if the font covers all codepoints in the target ranges."""
-    font_points = flatten_ranges(font_ranges)
-    target_points = flatten_ranges(target_ranges)
-    return target_points.issubset(font_points)
+    return contains_ranges(font_ranges, target_ranges)
 
 
 def find_fonts_matching_range(folder, target_range_str):
@@ -68,10 +28,10 @@ def find_fonts_matching_range(folder, target_range_str):
         if file.lower().endswith(".ttf"):
             path = os.path.join(folder, file)
             font_ranges = get_unicode_ranges(path)
-            missing = flatten_ranges(parse_range_str(target_range)) - flatten_ranges(font_ranges)
+            missing = missing_ranges(font_ranges, target_ranges)
             if missing:
-                print(f"Missing {len(missing)} codepoints:")
-                print(", ".join(f"0x{cp:04X}" for cp in sorted(missing)))
+                print(f"Missing {sum(b - a + 1 for a, b in missing)} codepoints:")
+                print(format_range_str(missing))
             if font_contains_range(font_ranges, target_ranges):
                 matching_fonts.append(file)
 
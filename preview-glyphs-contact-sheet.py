@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+"""
+Render a contact sheet (tiled PNG or PGM) of the glyphs in a font so coverage can be
+reviewed visually without depending on the terminal font.
+
+Glyphs are rasterized directly from the TTF outlines (glyf or CFF, through fontTools
+pens) or taken from the bitmap data of an LVGL C font file (lv_font_conv output).
+Tiles are rendered in a worker pool, one sheet row per task, and the image is written
+row by row, so memory stays bounded even for full CJK sets.
+"""
+
+import argparse
+import math
+import os
+import struct
+import sys
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from collections import deque
+
+from font_ranges import flatten_ranges, missing_ranges, parse_range_str, points_to_ranges
+from lvgl_c_font import read_lvgl_c_file
+
+# Vertical samples per pixel row; horizontal coverage is computed exactly per span.
+SUBSAMPLES = 4
+# Number of flattening segments per curve.
+CURVE_STEPS = 8
+
+# Per-worker state, filled in by the pool initializer.
+_source = None
+
+
+# -----------------------------
+# TTF outline rasterizer
+# -----------------------------
+
+def _make_flatten_pen(glyph_set):
+    """Build a pen that flattens outlines into closed polygons (lists of (x, y))."""
+    from fontTools.pens.basePen import BasePen
+
+    class FlattenPen(BasePen):
+        def __init__(self):
+            super().__init__(glyph_set)
+            self.contours = []
+            self._cur = None
+
+        def _moveTo(self, pt):
+            self._cur = [pt]
+
+        def _lineTo(self, pt):
+            self._cur.append(pt)
+
+        def _curveToOne(self, p1, p2, p3):
+            x0, y0 = self._getCurrentPoint()
+            for i in range(1, CURVE_STEPS + 1):
+                t = i / CURVE_STEPS
+                mt = 1 - t
+                a, b, c, d = mt * mt * mt, 3 * mt * mt * t, 3 * mt * t * t, t * t * t
+                self._cur.append((
+                    a * x0 + b * p1[0] + c * p2[0] + d * p3[0],
+                    a * y0 + b * p1[1] + c * p2[1] + d * p3[1],
+                ))
+
+        def _qCurveToOne(self, p1, p2):
+            x0, y0 = self._getCurrentPoint()
+            for i in range(1, CURVE_STEPS + 1):
+                t = i / CURVE_STEPS
+                mt = 1 - t
+                a, b, c = mt * mt, 2 * mt * t, t * t
+                self._cur.append((
+                    a * x0 + b * p1[0] + c * p2[0],
+                    a * y0 + b * p1[1] + c * p2[1],
+                ))
+
+        def _closePath(self):
+            if self._cur and len(self._cur) > 2:
+                self.contours.append(self._cur)
+            self._cur = None
+
+        _endPath = _closePath
+
+    return FlattenPen()
+
+
+def rasterize_polygons(contours, size):
+    """
+    Fill polygons (already in pixel coordinates, y down) with the nonzero rule.
+    Return a bytearray of size*size grayscale pixels.
+    """
+    out = bytearray(size * size)
+    edges = []
+    for contour in contours:
+        n = len(contour)
+        for i in range(n):
+            x0, y0 = contour[i]
+            x1, y1 = contour[(i + 1) % n]
+            if y0 == y1:
+                continue
+            direction = 1
+            if y0 > y1:
+                x0, y0, x1, y1 = x1, y1, x0, y0
+                direction = -1
+            edges.append((y0, y1, x0, (x1 - x0) / (y1 - y0), direction))
+    if not edges:
+        return out
+
+    cov = [0.0] * size
+    for row in range(size):
+        for i in range(size):
+            cov[i] = 0.0
+        touched = False
+        for s in range(SUBSAMPLES):
+            y = row + (s + 0.5) / SUBSAMPLES
+            xs = [(x0 + (y - y0) * slope, d) for y0, y1, x0, slope, d in edges if y0 <= y < y1]
+            if not xs:
+                continue
+            xs.sort()
+            winding = 0
+            for idx in range(len(xs) - 1):
+                winding += xs[idx][1]
+                if winding == 0:
+                    continue
+                left = max(xs[idx][0], 0.0)
+                right = min(xs[idx + 1][0], float(size))
+                if right <= left:
+                    continue
+                touched = True
+                li, ri = int(left), int(right)
+                if li == ri:
+                    cov[li] += right - left
+                    continue
+                cov[li] += li + 1 - left
+                for px in range(li + 1, ri):
+                    cov[px] += 1.0
+                if ri < size:
+                    cov[ri] += right - ri
+        if touched:
+            base = row * size
+            for px in range(size):
+                v = int(cov[px] * 255 / SUBSAMPLES + 0.5)
+                out[base + px] = 255 if v > 255 else v
+    return out
+
+
+class TTFSource:
+    def __init__(self, path, tile):
+        from fontTools.ttLib import TTFont
+
+        self.font = TTFont(path, lazy=True)
+        self.glyph_set = self.font.getGlyphSet()
+        self.cmap = self.font.getBestCmap()
+        self.tile = tile
+        head = self.font["head"]
+        hhea = self.font["hhea"]
+        ascent, descent = hhea.ascent, hhea.descent
+        extent = max(ascent - descent, head.unitsPerEm)
+        self.scale = (tile - 2) / extent
+        # baseline position (pixels from the top of the tile)
+        self.baseline = 1 + ascent * self.scale
+
+    def codepoints(self):
+        return sorted(self.cmap)
+
+    def render(self, cp):
+        name = self.cmap.get(cp)
+        if name is None:
+            return bytearray(self.tile * self.tile)
+        glyph = self.glyph_set[name]
+        pen = _make_flatten_pen(self.glyph_set)
+        glyph.draw(pen)
+        scale = self.scale
+        # center horizontally using the advance width
+        x_off = (self.tile - glyph.width * scale) / 2
+        base = self.baseline
+        contours = [
+            [(x * scale + x_off, base - y * scale) for x, y in contour]
+            for contour in pen.contours
+        ]
+        return rasterize_polygons(contours, self.tile)
+
+
+# -----------------------------
+# LVGL bitmap source
+# -----------------------------
+
+class LVGLSource:
+    def __init__(self, path, tile):
+        self.font = read_lvgl_c_file(path)
+        if self.font.bitmap_format != 0:
+            raise ValueError("compressed LVGL bitmaps are not supported, convert with --no-compress")
+        self.tile = tile
+        line_height = self.font.line_height if self.font.line_height is not None else tile
+        self.baseline = (tile + line_height) // 2 - self.font.base_line
+
+    def codepoints(self):
+        return self.font.codepoints()
+
+    def render(self, cp):
+        tile = self.tile
+        out = bytearray(tile * tile)
+        gid = self.font.cmap.get(cp)
+        if gid is None or gid >= len(self.font.glyphs):
+            return out
+        index, adv_w, box_w, box_h, ofs_x, ofs_y = self.font.glyphs[gid]
+        bitmap = self.font.bitmap
+        bpp = self.font.bpp
+        maxv = (1 << bpp) - 1
+        x0 = (tile - adv_w // 16) // 2 + ofs_x
+        y0 = self.baseline - ofs_y - box_h
+        bit = index * 8
+        for y in range(box_h):
+            ty = y0 + y
+            for x in range(box_w):
+                byte = bitmap[bit >> 3] if (bit >> 3) < len(bitmap) else 0
+                v = (byte >> (8 - bpp - (bit & 7))) & maxv
+                bit += bpp
+                tx = x0 + x
+                if 0 <= tx < tile and 0 <= ty < tile:
+                    out[ty * tile + tx] = v * 255 // maxv
+        return out
+
+
+# -----------------------------
+# Worker pool
+# -----------------------------
+
+def _open_source(path, tile):
+    if path.lower().endswith(".c"):
+        return LVGLSource(path, tile)
+    return TTFSource(path, tile)
+
+
+def _init_worker(path, tile):
+    global _source
+    _source = _open_source(path, tile)
+
+
+def render_sheet_row(cps):
+    """Render one row of tiles and return it as a list of `tile` scanlines."""
+    tile = _source.tile
+    tiles = [_source.render(cp) for cp in cps]
+    lines = []
+    for y in range(tile):
+        start = y * tile
+        lines.append(b"".join(bytes(t[start:start + tile]) for t in tiles))
+    return lines
+
+
+def iter_rows_in_order(executor, chunks, window):
+    """Like executor.map, but with at most `window` rows in flight at once."""
+    pending = deque()
+    for chunk in chunks:
+        pending.append(executor.submit(render_sheet_row, chunk))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+# -----------------------------
+# Streaming image writers
+# -----------------------------
+
+class PGMWriter:
+    def __init__(self, f, width, height):
+        self.f = f
+        f.write(b"P5\n%d %d\n255\n" % (width, height))
+
+    def write_line(self, line):
+        self.f.write(line)
+
+    def close(self):
+        pass
+
+
+class PNGWriter:
+    IDAT_SIZE = 1 << 16
+
+    def __init__(self, f, width, height):
+        self.f = f
+        self.z = zlib.compressobj(6)
+        self.buf = bytearray()
+        f.write(b"\x89PNG\r\n\x1a\n")
+        # 8-bit grayscale, no interlace
+        self._chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 0, 0, 0, 0))
+
+    def _chunk(self, tag, data):
+        self.f.write(struct.pack(">I", len(data)))
+        self.f.write(tag)
+        self.f.write(data)
+        self.f.write(struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF))
+
+    def write_line(self, line):
+        # filter type 0 (None) per scanline
+        self.buf += self.z.compress(b"\x00" + line)
+        if len(self.buf) >= self.IDAT_SIZE:
+            self._chunk(b"IDAT", bytes(self.buf))
+            self.buf.clear()
+
+    def close(self):
+        self.buf += self.z.flush()
+        self._chunk(b"IDAT", bytes(self.buf))
+        self.buf.clear()
+        self._chunk(b"IEND", b"")
+
+
+def write_contact_sheet(font_path, out_path, ranges=None, tile=32, columns=64, workers=None):
+    """Render all (or the selected) codepoints of a font into a contact sheet image."""
+    if tile < 1 or columns < 1:
+        raise ValueError("tile and columns must be at least 1")
+    source = _open_source(font_path, tile)
+    cps = source.codepoints()
+    del source
+    if ranges:
+        # the font's runs outside the ranges (bounded by the font, not by the ranges)
+        outside = flatten_ranges(missing_ranges(ranges, points_to_ranges(cps)))
+        cps = [cp for cp in cps if cp not in outside]
+    if not cps:
+        raise ValueError("no codepoints to render")
+
+    columns = min(columns, len(cps))
+    rows = math.ceil(len(cps) / columns)
+    width, height = columns * tile, rows * tile
+    chunks = (cps[i:i + columns] for i in range(0, len(cps), columns))
+    workers = workers or os.cpu_count() or 1
+
+    writer_cls = PGMWriter if out_path.lower().endswith(".pgm") else PNGWriter
+    blank = b"\x00" * tile
+    index_lines = []
+    with open(out_path, "wb") as f, ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(font_path, tile)
+    ) as executor:
+        writer = writer_cls(f, width, height)
+        for row, lines in enumerate(iter_rows_in_order(executor, chunks, workers * 2)):
+            first = cps[row * columns]
+            index_lines.append(f"row {row}: 0x{first:04X}")
+            pad = blank * (columns - len(lines[0]) // tile)
+            for line in lines:
+                writer.write_line(line + pad)
+        writer.close()
+
+    return {"glyphs": len(cps), "columns": columns, "rows": rows, "width": width,
+            "height": height, "index": index_lines}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render a glyph contact sheet (PNG/PGM) from a TTF/OTF or LVGL .c font file.")
+    parser.add_argument("font", help="path to TTF/OTF font or lvgl generated C file")
+    parser.add_argument("output", help="output image (.png or .pgm)")
+    parser.add_argument("--range", dest="range_str", help="only render these ranges, e.g. 0x4E00-0x9FFF")
+    parser.add_argument("--tile", type=int, default=32, help="tile size in pixels (default 32)")
+    parser.add_argument("--columns", type=int, default=64, help="tiles per row (default 64)")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--index", action="store_true", help="print the first codepoint of each row")
+    args = parser.parse_args()
+    for name in ("tile", "columns", "workers"):
+        if getattr(args, name) is not None and getattr(args, name) < 1:
+            parser.error(f"--{name} must be at least 1")
+
+    if not os.path.exists(args.font):
+        print("File not found:", args.font)
+        sys.exit(1)
+
+    ranges = parse_range_str(args.range_str) if args.range_str else None
+    res = write_contact_sheet(args.font, args.output, ranges, args.tile, args.columns, args.workers)
+    print(f"Rendered {res['glyphs']} glyphs into {res['columns']}x{res['rows']} tiles "
+          f"({res['width']}x{res['height']} px) -> {args.output}")
+    if args.index:
+        for line in res["index"]:
+            print(" ", line)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,6 @@
 from fontTools.ttLib import TTFont
+from font_ranges import points_to_ranges
+from unicode_blocks import script_ranges
 
 ttf_path = r"E:\Fonts\arabic_fonts_filtered\noto-sans-arabic-600.ttf"
 #ttf_path = r"E:\Fonts\chinese_fonts_filtered\NotoSansSC-Regular.ttf"
@@ -24,6 +26,7 @@ font = TTFont(ttf_path)
 
 cmap = font['cmap'].getBestCmap()
 
-# Print first 50 Chinese characters
-for cp in sorted([k for k in cmap if k >= 0x4E00])[:50]:
+# Print first 50 Chinese (Han script) characters
+chinese_points = [cp for a, b in script_ranges(points_to_ranges(sorted(cmap)), "Han") for cp in range(a, b + 1)]
+for cp in chinese_points[:50]:
     print(chr(cp), end=' ')
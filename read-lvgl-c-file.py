@@ -1,154 +1,17 @@
 #!/usr/bin/env python3
 """
 Read LVGL C font file (lv_font_conv output) and extract the actual Unicode codepoints
-by parsing the unicode_list arrays and the cmaps table. Print count and characters.
+by parsing the unicode_list arrays and the cmaps table (lvgl_c_font.py). Print count
+and characters.
 """
 
-import re
 import sys
 import os
 import argparse
-from itertools import chain
 
-HEX_RE = re.compile(r"0x[0-9A-Fa-f]+")
-
-def parse_unicode_list_arrays(content):
-    """
-    Find unicode_list_N arrays and return dict name -> [ints].
-    Handles uint16_t, uint32_t, static const, etc.
-    Example match:
-      static const uint16_t unicode_list_0[] = { 0x0, 0x1, 0x41, ... };
-    """
-    arr_re = re.compile(
-        r"(?:static\s+)?(?:const\s+)?(?:uint(?:16|32)_t|int|uint32_t|uint16_t)\s+"
-        r"(?P<name>unicode_list_\d+)\s*\[\s*\]\s*=\s*\{(?P<body>.*?)\};",
-        re.DOTALL,
-    )
-    arrays = {}
-    for m in arr_re.finditer(content):
-        name = m.group("name")
-        body = m.group("body")
-        hexes = HEX_RE.findall(body)
-        values = [int(h, 16) for h in hexes]
-        arrays[name] = values
-    return arrays
-
-def find_cmaps_blocks(content):
-    """
-    Find the cmaps array block. It may look like:
-    static const lv_font_fmt_txt_cmap_t cmaps[] = {
-      {
-        .range_start = 32, .range_length = 95, .glyph_id_start = 1
-      }, { ... }
-    };
-    Return list of blocks (strings) for each cmap entry.
-    """
-    # find the whole cmaps array
-    cmaps_array_re = re.compile(
-        r"(?s)static\s+const\s+[^{;]*lv_font_fmt_txt_cmap_t\s+cmaps\s*\[\s*\]\s*=\s*\{(?P<body>.*?)\};"
-    )
-    m = cmaps_array_re.search(content)
-    if not m:
-        # fallback: find any variable named cmaps
-        # try to find 'cmaps[] = { ... };' without type
-        cmaps_array_re2 = re.compile(r"(?s)\bcmaps\s*\[\s*\]\s*=\s*\{(?P<body>.*?)\};")
-        m = cmaps_array_re2.search(content)
-    if not m:
-        return []
-
-    body = m.group("body")
-    # split top-level '{...},' entries (rudimentary)
-    entries = []
-    depth = 0
-    cur = []
-    for ch in body:
-        cur.append(ch)
-        if ch == '{':
-            depth += 1
-        elif ch == '}':
-            depth -= 1
-            if depth == 0:
-                # collect full block
-                entries.append(''.join(cur))
-                cur = []
-    # Clean entries
-    cleaned = [e.strip().strip(',') for e in entries if e.strip()]
-    return cleaned
-
-def parse_cmap_entry(block):
-    """
-    Parse fields from one cmap block and return a dict with keys:
-    range_start (int), range_length (int), glyph_id_start (int),
-    unicode_list (str or None), list_length (int or None), type (str or None)
-    Works with patterns like '.range_start = 32', '.unicode_list = unicode_list_0'
-    """
-    result = {
-        "range_start": None,
-        "range_length": None,
-        "glyph_id_start": None,
-        "unicode_list": None,
-        "list_length": None,
-        "type": None,
-    }
-    # find numeric assignments
-    kv_re = re.compile(r"\.(?P<key>[a-zA-Z0-9_]+)\s*=\s*(?P<val>[^,}\n]+)")
-    for m in kv_re.finditer(block):
-        k = m.group("key").strip()
-        v = m.group("val").strip().rstrip(',')
-        # clean v
-        # if v is a name like unicode_list_0
-        if k == "unicode_list":
-            name_match = re.search(r"(unicode_list_\d+)", v)
-            if name_match:
-                result["unicode_list"] = name_match.group(1)
-            else:
-                result["unicode_list"] = None
-            continue
-        if k == "type":
-            # type may be LV_FONT_FMT_TXT_CMAP_FORMAT0_TINY or similar
-            t = v.split()[-1]
-            result["type"] = t.strip()
-            continue
-        # integers: could be hex or decimal
-        num_match = re.search(r"0x[0-9A-Fa-f]+|\d+", v)
-        if num_match:
-            num = int(num_match.group(0), 0)
-            if k in result:
-                result[k] = num
-            else:
-                # ignore other keys
-                result[k] = num
-    return result
-
-def extract_codepoints_from_cmaps(content):
-    """
-    Return set of actual Unicode codepoints present in the font, by parsing cmaps and unicode_list arrays.
-    """
-    arrays = parse_unicode_list_arrays(content)
-    cmap_blocks = find_cmaps_blocks(content)
-    codepoints = set()
-
-    for block in cmap_blocks:
-        info = parse_cmap_entry(block)
-        rs = info.get("range_start")
-        rl = info.get("range_length")
-        ulist_name = info.get("unicode_list")
-        # If there's a unicode_list, values are offsets from range_start
-        if rs is None:
-            continue
-        if ulist_name and ulist_name in arrays:
-            offsets = arrays[ulist_name]
-            for off in offsets:
-                codepoints.add(rs + int(off))
-        else:
-            # otherwise add the full dense range
-            if rl is None:
-                # try to guess range_length from other patterns (rare)
-                # fallback: if glyph_id_start present and block contains a pattern .range_length = N, etc.
-                continue
-            for cp in range(rs, rs + rl):
-                codepoints.add(cp)
-    return codepoints
+from font_ranges import points_to_ranges
+from lvgl_c_font import HEX_RE, LVGLCFont
+from unicode_blocks import format_block_coverage, printable_ranges
 
 def try_extract_unicode_from_other_patterns(content):
     """
@@ -167,7 +30,7 @@ def parse_font_file(path, show_chars=True, limit=None):
         content = f.read()
 
     # Try robust extraction via cmaps and unicode_list arrays
-    cps = extract_codepoints_from_cmaps(content)
+    cps = set(LVGLCFont(content).cmap)
 
     # If we got nothing (or suspiciously small), fallback to broader scanning
     if len(cps) < 256:
@@ -175,21 +38,12 @@ def parse_font_file(path, show_chars=True, limit=None):
         fallback = try_extract_unicode_from_other_patterns(content)
         cps |= fallback
 
-    cps = sorted(cps)
-    # Prepare printable characters
-    chars = []
-    for cp in cps:
-        try:
-            ch = chr(cp)
-            # We consider printable any that Python reports printable or CJK/Arabic categories
-            # but avoid control chars
-            if not ch.isspace():
-                chars.append((cp, ch))
-            else:
-                # keep spaces and newlines as visible tokens optionally
-                chars.append((cp, ch))
-        except:
-            continue
+    # drop anything outside the Unicode range (fallback scanning may pick those up)
+    cps = sorted(cp for cp in cps if cp <= 0x10FFFF)
+    ranges = points_to_ranges(cps)
+    # Prepare characters; printability is decided per run against the Unicode tables
+    chars = [(cp, chr(cp)) for cp in cps]
+    printable = {cp for a, b in printable_ranges(ranges) for cp in range(a, b + 1)}
 
     # Optionally limit number of chars to print
     if limit is not None and len(chars) > limit:
@@ -200,6 +54,8 @@ def parse_font_file(path, show_chars=True, limit=None):
     return {
         "codepoints": cps,
         "char_tuples": chars_to_print,
+        "printable": printable,
+        "blocks": format_block_coverage(ranges),
         "total_codepoints": len(cps),
     }
 
@@ -207,12 +63,15 @@ def print_report(path, show_chars=True, limit=None):
     res = parse_font_file(path, show_chars=show_chars, limit=limit)
     print(f"\nFile: {os.path.basename(path)}")
     print(f"  Codepoints found: {res['total_codepoints']}")
+    print("\n Coverage per Unicode block:")
+    for line in res['blocks']:
+        print(f"  {line}")
     if show_chars:
         print("\n Characters (codepoint -> glyph):")
         for cp, ch in res['char_tuples']:
             # print hex and character; for safety, escape if non-printable
             try:
-                if ch.isprintable():
+                if cp in res['printable']:
                     print(f"  0x{cp:04X} -> {ch}")
                 else:
                     # show representative name
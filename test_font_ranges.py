@@ -0,0 +1,324 @@
+"""
+Tests for the range primitives in font_ranges.py (pytest).
+
+Correctness: every primitive is compared with a brute-force oracle built on Python
+sets of codepoints, on generated inputs (property-based with Hypothesis when it is
+installed, seeded random cases always). The parser gets the generated ranges back as
+text, written with random whitespace, empty segments and decimal, 0x, U+ or bare hex
+numbers: it must return exactly those ranges, or raise ValueError when the text has a
+bare hex number. Fixed parser cases cover the known traps ('3400-4DBF', '0600-06FF').
+
+Throughput: the primitives are timed with the pytest-benchmark `benchmark` fixture on
+large random range lists and on a cmap with 100k+ entries (skipped without the plugin).
+Setting RANGES_MIN_SPEEDUP=1 also times the set-based code they replaced and fails a
+primitive that is below its MIN_SPEEDUP; the ratios depend on the machine, so this is
+off by default.
+
+  python -m pytest -q test_font_ranges.py
+  python -m pytest -q test_font_ranges.py --benchmark-skip
+  RANGES_MIN_SPEEDUP=1 python -m pytest -q test_font_ranges.py -k bench
+"""
+
+import os
+import random
+import time
+
+import pytest
+
+import font_ranges as fr
+
+try:
+    from hypothesis import given, settings, strategies as st
+except ImportError:
+    st = None
+
+MAX_CP = fr.MAX_CP
+
+
+# -----------------------------
+# Oracle (set of codepoints)
+# -----------------------------
+
+def oracle_points(ranges):
+    s = set()
+    for a, b in ranges:
+        s.update(range(a, b + 1))
+    return s
+
+
+def oracle_runs(points):
+    """Maximal runs of a set of codepoints, the slow obvious way."""
+    runs = []
+    for cp in sorted(points):
+        if runs and runs[-1][1] == cp - 1:
+            runs[-1][1] = cp
+        else:
+            runs.append([cp, cp])
+    return [tuple(r) for r in runs]
+
+
+def check_ranges_case(font_ranges, target_ranges, points):
+    """Compare all interval primitives with the oracle for one generated case."""
+    fp, tp = oracle_points(font_ranges), oracle_points(target_ranges)
+    assert fr.merge_ranges(font_ranges) == oracle_runs(fp), "merge_ranges"
+    assert fr.count_ranges(font_ranges) == len(fp), "count_ranges"
+    assert fr.flatten_ranges(font_ranges) == fp, "flatten_ranges"
+    assert fr.missing_ranges(font_ranges, target_ranges) == oracle_runs(tp - fp), "missing_ranges"
+    assert fr.missing_count(font_ranges, target_ranges) == len(tp - fp), "missing_count"
+    assert fr.contains_ranges(font_ranges, target_ranges) == tp.issubset(fp), "contains_ranges"
+    assert fr.same_ranges(font_ranges, target_ranges) == (fp == tp), "same_ranges"
+    assert fr.points_to_ranges(sorted(points)) == oracle_runs(set(points)), "points_to_ranges"
+    text = fr.format_range_str(font_ranges)
+    assert fr.parse_range_str(text) == list(font_ranges), "format/parse round trip"
+
+
+def check_parse_case(text, expected):
+    if expected is ValueError:
+        with pytest.raises(ValueError):
+            fr.parse_range_str(text)
+        return
+    got = fr.parse_range_str(text)
+    assert got == expected, f"parse_range_str({text!r}) = {got}, expected {expected}"
+
+
+# -----------------------------
+# Parser cases
+# -----------------------------
+
+# (text, expected ranges, or ValueError)
+PARSE_CASES = [
+    ("0x0600-0x06FF,0x0750-0x077F", [(0x600, 0x6FF), (0x750, 0x77F)]),
+    (" 0x0600 - 0x06FF , 0x0750-0x077F ", [(0x600, 0x6FF), (0x750, 0x77F)]),
+    ("0x0020-0x007D,,0x0600-0x06FF,", [(0x20, 0x7D), (0x600, 0x6FF)]),
+    ("", []),
+    (" , ", []),
+    ("32-127", [(32, 127)]),
+    ("32-0x7F", [(32, 127)]),
+    ("U+4E00-U+9FFF", [(0x4E00, 0x9FFF)]),
+    ("0x41", [(0x41, 0x41)]),
+    ("65", [(65, 65)]),
+    ("0", [(0, 0)]),
+    # bare hex: would silently read as (0xD48, 0x4DBF) / (0x258, 0x6FF) if guessed per token
+    ("3400-4DBF", ValueError),
+    ("0600-06FF", ValueError),
+    ("4E00-9FFF", ValueError),
+    ("0600", ValueError),
+    ("0x10-0x05", ValueError),
+    ("0x10-", ValueError),
+    ("-0x10", ValueError),
+    ("0x10-0x20-0x30", ValueError),
+    ("0xZZ", ValueError),
+    ("abc-xyz!", ValueError),
+    ("0x 41", ValueError),
+]
+
+
+@pytest.mark.parametrize("text, expected", PARSE_CASES)
+def test_parse_case(text, expected):
+    check_parse_case(text, expected)
+
+
+# -----------------------------
+# Range text generation
+# -----------------------------
+
+WHITESPACE = ("", "", " ", "  ", "\t", " \t ")
+
+
+def format_codepoint(rng, cp):
+    """
+    Write cp as decimal, 0x/U+ hex (random case and zero padding) or bare hex. Return
+    (text, is_bare_hex). Bare hex that reads as a plain decimal number can't be told
+    apart from one, so bare hex is only generated when it has a letter or a leading zero.
+    """
+    digits = f"{cp:0{rng.choice((1, 4, 6))}X}"
+    if rng.random() < 0.5:
+        digits = digits.lower()
+    kind = rng.choice(("dec", "0x", "U+", "bare"))
+    if kind == "bare" and (digits.isdigit() and not (len(digits) > 1 and digits[0] == "0")):
+        kind = "0x"
+    if kind == "dec":
+        return str(cp), False
+    if kind == "bare":
+        return digits, True
+    prefix = rng.choice(("0x", "0X")) if kind == "0x" else rng.choice(("U+", "u+"))
+    return prefix + digits, False
+
+
+def format_range_text(rng, ranges):
+    """Random text for ranges; return (text, has_bare_hex)."""
+    def ws():
+        return rng.choice(WHITESPACE)
+
+    segments = []
+    bare = False
+    for a, b in ranges:
+        ta, bare_a = format_codepoint(rng, a)
+        if a == b and rng.random() < 0.5:
+            segments.append(ws() + ta + ws())
+            bare |= bare_a
+            continue
+        tb, bare_b = format_codepoint(rng, b)
+        segments.append(ws() + ta + ws() + "-" + ws() + tb + ws())
+        bare |= bare_a or bare_b
+    # empty segments anywhere, including leading and trailing
+    for _ in range(rng.randrange(3)):
+        segments.insert(rng.randrange(len(segments) + 1), ws())
+    return ",".join(segments), bare
+
+
+def check_parse_generated(rng, ranges):
+    text, bare = format_range_text(rng, ranges)
+    check_parse_case(text, ValueError if bare else list(ranges))
+    if not bare:
+        assert oracle_points(fr.parse_range_str(text)) == oracle_points(ranges), "parse vs oracle"
+
+
+# -----------------------------
+# Generated cases
+# -----------------------------
+
+def random_ranges(rng, n, span=4096, max_len=64):
+    """Random, possibly overlapping and unsorted ranges within [0, span)."""
+    out = []
+    for _ in range(n):
+        a = rng.randrange(span)
+        out.append((a, min(a + rng.randrange(max_len), MAX_CP)))
+    return out
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_random_cases(seed):
+    rng = random.Random(seed)
+    for _ in range(100):
+        span = rng.choice((64, 4096, 70000))
+        font = random_ranges(rng, rng.randrange(0, 40), span)
+        target = random_ranges(rng, rng.randrange(0, 10), span)
+        points = [rng.randrange(span) for _ in range(rng.randrange(0, 200))]
+        check_ranges_case(font, target, points)
+        check_parse_generated(rng, font)
+
+
+if st is not None:
+    cp_st = st.integers(0, 5000)
+    range_st = st.tuples(cp_st, st.integers(0, 80)).map(lambda t: (t[0], t[0] + t[1]))
+    ranges_st = st.lists(range_st, max_size=30)
+    # big codepoints too, so 5- and 6-digit and letter-free hex get written
+    wide_range_st = st.tuples(st.integers(0, MAX_CP), st.integers(0, 300)).map(
+        lambda t: (t[0], min(t[0] + t[1], MAX_CP)))
+
+    @settings(max_examples=500, deadline=None)
+    @given(ranges_st, ranges_st, st.lists(cp_st, max_size=200))
+    def test_ranges_property(font, target, points):
+        check_ranges_case(font, target, points)
+
+    @settings(max_examples=500, deadline=None)
+    @given(st.lists(st.one_of(range_st, wide_range_st), max_size=20), st.randoms(use_true_random=False))
+    def test_parse_property(ranges, rng):
+        check_parse_generated(rng, ranges)
+
+
+# -----------------------------
+# Throughput
+# -----------------------------
+
+# minimum speedup over the reference, about 60% of what was measured on the machine the
+# values were last updated on (update both together); only checked with RANGES_MIN_SPEEDUP=1
+MIN_SPEEDUP = {
+    "points_to_ranges": 1.3,
+    "missing_count": 2.5,
+    "merge_ranges": 15.0,
+    "missing_ranges": 12.0,
+    "parse_range_str": 0.3,  # validating parser vs bare split/int
+}
+
+SPEEDUP_GATE = os.environ.get("RANGES_MIN_SPEEDUP", "") not in ("", "0")
+
+def reference_parse(text):
+    """Bare split/int parse of well-formed '0x..-0x..' text (no validation)."""
+    return [tuple(int(x, 16) for x in part.split("-")) for part in text.split(",")]
+
+
+def timed(fn, *args, repeat=3):
+    best = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn(*args)
+        dt = time.perf_counter() - t0
+        best = dt if best is None else min(best, dt)
+    return best, result
+
+
+def check_speedup(benchmark, name, result, reference, *args, repeat=3):
+    """With RANGES_MIN_SPEEDUP=1, time the reference and compare with the benchmark."""
+    if not SPEEDUP_GATE or benchmark.stats is None:  # off, or --benchmark-disable
+        return
+    t_ref, ref = timed(reference, *args, repeat=repeat)
+    assert result == ref, name
+    speedup = t_ref / benchmark.stats.stats.min
+    benchmark.extra_info["speedup"] = round(speedup, 2)
+    assert speedup >= MIN_SPEEDUP[name], f"{name}: {speedup:.2f}x, minimum {MIN_SPEEDUP[name]}x"
+
+
+@pytest.fixture
+def benchmark_or_skip(request):
+    """The pytest-benchmark `benchmark` fixture; skip the test when the plugin isn't loaded."""
+    if not request.config.pluginmanager.hasplugin("benchmark"):
+        pytest.skip("pytest-benchmark not installed")
+    return request.getfixturevalue("benchmark")
+
+
+@pytest.fixture(scope="module")
+def bench_data():
+    rng = random.Random(1)
+    # cmap with 100k+ entries, as in a full CJK font
+    cmap_points = sorted(rng.sample(range(0x20000), 120000))
+    big = random_ranges(rng, 50000, span=0x110000 - 512, max_len=512)
+    other = random_ranges(rng, 50000, span=0x110000 - 512, max_len=512)
+    return {
+        "cmap_points": cmap_points,
+        "cmap_runs": fr.points_to_ranges(cmap_points),
+        "cjk": [(0x3400, 0x4DBF), (0x4E00, 0x9FFF), (0xF900, 0xFAFF), (0x20000, 0x2A6DF)],
+        "big": big,
+        "other": other,
+        "text": ",".join(f"0x{a:04X}-0x{b:04X}" for a, b in big),
+    }
+
+
+def test_bench_points_to_ranges(benchmark_or_skip, bench_data):
+    benchmark = benchmark_or_skip
+    points = bench_data["cmap_points"]
+    runs = benchmark(fr.points_to_ranges, points)
+    check_speedup(benchmark, "points_to_ranges", runs, oracle_runs, set(points))
+
+
+def test_bench_missing_count(benchmark_or_skip, bench_data):
+    benchmark = benchmark_or_skip
+    runs, target = bench_data["cmap_runs"], bench_data["cjk"]
+    missing = benchmark(fr.missing_count, runs, target)
+    check_speedup(benchmark, "missing_count", missing,
+                  lambda: len(oracle_points(target) - oracle_points(runs)))
+
+
+def test_bench_merge_ranges(benchmark_or_skip, bench_data):
+    benchmark = benchmark_or_skip
+    big = bench_data["big"]
+    merged = benchmark(fr.merge_ranges, big)
+    check_speedup(benchmark, "merge_ranges", merged,
+                  lambda: oracle_runs(oracle_points(big)), repeat=1)
+
+
+def test_bench_missing_ranges(benchmark_or_skip, bench_data):
+    benchmark = benchmark_or_skip
+    big, other = bench_data["big"], bench_data["other"]
+    missing = benchmark(fr.missing_ranges, big, other)
+    check_speedup(benchmark, "missing_ranges", missing,
+                  lambda: oracle_runs(oracle_points(other) - oracle_points(big)), repeat=1)
+
+
+def test_bench_parse_range_str(benchmark_or_skip, bench_data):
+    benchmark = benchmark_or_skip
+    text = bench_data["text"]
+    parsed = benchmark(fr.parse_range_str, text)
+    assert parsed == bench_data["big"]
+    check_speedup(benchmark, "parse_range_str", parsed, reference_parse, text)
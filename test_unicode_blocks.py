@@ -0,0 +1,141 @@
+"""
+Tests for unicode_blocks.py against fontTools.unicodedata (pytest).
+
+The lookups over the generated tables in unicode_data.py are compared with
+fontTools.unicodedata.block / script / category at every table boundary and on seeded
+random codepoints; the run-based and numpy (corpus) summaries are compared with
+per-codepoint lookups. A failure after upgrading fontTools means unicode_data.py has to
+be regenerated with generate-unicode-data.py.
+
+  python -m pytest -q test_unicode_blocks.py
+"""
+
+import random
+from collections import Counter
+
+import pytest
+from fontTools import unicodedata
+
+import unicode_blocks as ub
+from font_ranges import points_to_ranges
+from unicode_data import BLOCK_STARTS, NONPRINTABLE_ENDS, NONPRINTABLE_STARTS, SCRIPT_STARTS
+
+MAX_CP = ub.MAX_CP
+NONPRINTABLE_CATEGORIES = {"Cc", "Cf", "Zs", "Zl", "Zp", "Cs", "Co", "Cn"}
+
+
+# -----------------------------
+# Oracle (fontTools.unicodedata)
+# -----------------------------
+
+def oracle_block(cp):
+    return unicodedata.block(chr(cp))
+
+
+def oracle_script(cp):
+    code = unicodedata.script(chr(cp))
+    return unicodedata.Scripts.NAMES.get(code, code).replace("_", " ")
+
+
+def oracle_printable(cp):
+    cat = unicodedata.category(chr(cp))
+    if cat == "Cn":
+        # category data older than Scripts.txt: assigned there means printable
+        return unicodedata.script(chr(cp)) != "Zzzz"
+    return cat not in NONPRINTABLE_CATEGORIES or cp == 0x20
+
+
+def sample_codepoints(seed=1, n=20000):
+    """Every table boundary and its neighbours, plus seeded random codepoints."""
+    edges = set()
+    for starts in (BLOCK_STARTS, SCRIPT_STARTS, NONPRINTABLE_STARTS, NONPRINTABLE_ENDS,
+                   unicodedata.Blocks.RANGES, unicodedata.Scripts.RANGES):
+        for cp in starts:
+            edges.update((cp - 1, cp, cp + 1))
+    rng = random.Random(seed)
+    edges.update(rng.randrange(MAX_CP + 1) for _ in range(n))
+    return sorted(cp for cp in edges if 0 <= cp <= MAX_CP)
+
+
+CODEPOINTS = sample_codepoints()
+
+
+def random_ranges(rng, n, span=0x30000, max_len=300):
+    out = []
+    for _ in range(n):
+        a = rng.randrange(span)
+        out.append((a, min(a + rng.randrange(max_len), MAX_CP)))
+    return out
+
+
+# -----------------------------
+# Single codepoints
+# -----------------------------
+
+def test_block_of():
+    wrong = [cp for cp in CODEPOINTS if ub.block_of(cp) != oracle_block(cp)]
+    assert not wrong, [(hex(cp), ub.block_of(cp), oracle_block(cp)) for cp in wrong[:5]]
+
+
+def test_script_of():
+    wrong = [cp for cp in CODEPOINTS if ub.script_of(cp) != oracle_script(cp)]
+    assert not wrong, [(hex(cp), ub.script_of(cp), oracle_script(cp)) for cp in wrong[:5]]
+
+
+def test_is_printable():
+    wrong = [cp for cp in CODEPOINTS if ub.is_printable(cp) != oracle_printable(cp)]
+    assert not wrong, [(hex(cp), ub.is_printable(cp)) for cp in wrong[:5]]
+
+
+@pytest.mark.parametrize("cp, block, script, printable", [
+    (0x0041, "Basic Latin", "Latin", True),
+    (0x0020, "Basic Latin", "Common", True),
+    (0x00A0, "Latin-1 Supplement", "Common", False),
+    (0x0627, "Arabic", "Arabic", True),
+    (0x200D, "General Punctuation", "Inherited", False),
+    (0x3000, "CJK Symbols and Punctuation", "Common", False),
+    (0x4E00, "CJK Unified Ideographs", "Han", True),
+    (0xFF01, "Halfwidth and Fullwidth Forms", "Common", True),
+    (0xE000, "Private Use Area", "Unknown", False),
+])
+def test_known_codepoints(cp, block, script, printable):
+    assert (ub.block_of(cp), ub.script_of(cp), ub.is_printable(cp)) == (block, script, printable)
+
+
+# -----------------------------
+# Runs and corpus histograms
+# -----------------------------
+
+@pytest.mark.parametrize("seed", range(3))
+def test_runs_match_lookups(seed):
+    rng = random.Random(seed)
+    ranges = random_ranges(rng, 40)
+    points = sorted({cp for a, b in ranges for cp in range(a, b + 1)})
+    runs = points_to_ranges(points)
+
+    def flat(ranges):
+        return [cp for a, b in ranges for cp in range(a, b + 1)]
+
+    assert ub.script_counts(runs) == dict(Counter(ub.script_of(cp) for cp in points))
+    assert flat(ub.printable_ranges(runs)) == [cp for cp in points if ub.is_printable(cp)]
+    assert flat(ub.script_ranges(runs, "Han")) == [cp for cp in points if ub.script_of(cp) == "Han"]
+    assert flat(ub.block_ranges(runs, "CJK Unified Ideographs")) == \
+        [cp for cp in points if ub.block_of(cp) == "CJK Unified Ideographs"]
+    covered = Counter(ub.block_of(cp) for cp in points)
+    covered.pop(ub.NO_BLOCK, None)
+    assert {name: n for name, _, _, n, _ in ub.block_coverage(runs)} == dict(covered)
+
+
+def test_histograms():
+    np = pytest.importorskip("numpy")
+    rng = random.Random(2)
+    cps = [rng.choice(CODEPOINTS) for _ in range(5000)] * 2  # duplicates are counted
+    assert ub.block_histogram(np.asarray(cps)) == dict(Counter(oracle_block(cp) for cp in cps))
+    assert ub.script_histogram(cps) == dict(Counter(oracle_script(cp) for cp in cps))
+
+
+def test_codepoint_array():
+    pytest.importorskip("numpy")
+    ranges = [(0x41, 0x43), (0x4E00, 0x4E00), (0x10FFFE, 0x10FFFF)]
+    assert ub.codepoint_array(ranges).tolist() == [0x41, 0x42, 0x43, 0x4E00, 0x10FFFE, 0x10FFFF]
+    assert ub.codepoint_array([]).tolist() == []
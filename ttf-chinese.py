@@ -1,6 +1,6 @@
 import os
-from fontTools.ttLib import TTFont
-from shutil import copy2
+from font_ranges import flatten_ranges, get_unicode_ranges, missing_ranges, parse_range_str
+from font_store import FONT_STORE_DIR, store_and_link
 
 # -----------------------------
 # Configuration
@@ -22,51 +22,8 @@ MISSING_TOLERANCE = 5000  # Adjust for your use case
 # Helper Functions
 # -----------------------------
 
-def get_unicode_ranges(ttf_path):
-    """Return a list of (start, end) tuples representing codepoints in the font."""
-    try:
-        font = TTFont(ttf_path)
-        cmap = font["cmap"].getBestCmap()
-        points = sorted(cmap.keys())
-        font.close()
-    except Exception as e:
-        print(f"Error reading {ttf_path}: {e}")
-        return []
-
-    if not points:
-        return []
-
-    ranges = []
-    start = prev = points[0]
-    for cp in points[1:]:
-        if cp != prev + 1:
-            ranges.append((start, prev))
-            start = cp
-        prev = cp
-    ranges.append((start, prev))
-    return ranges
-
-def parse_range_str(range_str):
-    ranges = []
-    for part in range_str.split(","):
-        if "-" in part:
-            a, b = part.split("-")
-            ranges.append((int(a,16), int(b,16)))
-        else:
-            v = int(part,16)
-            ranges.append((v,v))
-    return ranges
-
-def flatten_ranges(ranges):
-    s = set()
-    for a,b in ranges:
-        s.update(range(a,b+1))
-    return s
-
 def font_missing_from_target(font_ranges, target_ranges):
-    font_points = flatten_ranges(font_ranges)
-    target_points = flatten_ranges(target_ranges)
-    return target_points - font_points
+    return flatten_ranges(missing_ranges(font_ranges, target_ranges))
 
 # -----------------------------
 # Main Filtering Function
@@ -88,8 +45,11 @@ def filter_chinese_fonts(input_dir, output_dir, target_range_str, tolerance):
             else:
                 print(f"{file} ⚠️ Missing {len(missing)} codepoints (subset font)")
 
-            # Copy all fonts regardless of missing codepoints
-            copy2(path, os.path.join(output_dir, file))
+            # Keep all fonts regardless of missing codepoints; each unique font is
+            # stored once and linked into the output folder
+            _, method, is_new = store_and_link(path, os.path.join(output_dir, file), FONT_STORE_DIR)
+            if not is_new:
+                print(f"    already in store ({method})")
 
 # -----------------------------
 # Run
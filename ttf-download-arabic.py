@@ -1,7 +1,8 @@
 import urllib.request
 import json
 import os
-from fontTools.ttLib import TTFont
+from font_ranges import flatten_ranges, get_unicode_ranges, missing_ranges, parse_range_str
+from font_store import FONT_STORE_DIR, store_and_link, unlink
 
 # -----------------------------
 # Configuration
@@ -50,58 +51,9 @@ MISSING_TOLERANCE = 5
 # Helper Functions
 # -----------------------------
 
-def get_unicode_ranges(ttf_path):
-    """Extract Unicode ranges from a TTF file as a list of (start, end) tuples."""
-    try:
-        font = TTFont(ttf_path)
-        cmap = font["cmap"].getBestCmap()
-        points = sorted(cmap.keys())
-        font.close()
-    except Exception as e:
-        print(f"Error reading {ttf_path}: {e}")
-        return []
-
-    if not points:
-        return []
-
-    ranges = []
-    start = prev = points[0]
-    for cp in points[1:]:
-        if cp != prev + 1:
-            ranges.append((start, prev))
-            start = cp
-        prev = cp
-    ranges.append((start, prev))
-    return ranges
-
-
-def parse_range_str(range_str):
-    """Convert '0x0600-0x06FF,0x0750-0x077F' to list of (start, end) ints."""
-    parts = range_str.split(",")
-    ranges = []
-    for p in parts:
-        if "-" in p:
-            a, b = p.split("-")
-            ranges.append((int(a, 16), int(b, 16)))
-        else:
-            v = int(p, 16)
-            ranges.append((v, v))
-    return ranges
-
-
-def flatten_ranges(ranges):
-    """Return a set of all codepoints covered by the given ranges."""
-    s = set()
-    for a, b in ranges:
-        s.update(range(a, b + 1))
-    return s
-
-
 def font_missing_from_target(font_ranges, target_ranges):
     """Return missing codepoints (set difference)."""
-    font_points = flatten_ranges(font_ranges)
-    local_target_points = flatten_ranges(target_ranges)
-    return local_target_points - font_points
+    return flatten_ranges(missing_ranges(font_ranges, target_ranges))
 
 
 # -----------------------------
@@ -129,16 +81,19 @@ for fid in arabic_ids:
 
         fname = f"{fid}-{variant['id']}.ttf"
         fpath = os.path.join(OUTPUT_DIR, fname)
+        tmp_path = fpath + ".part"
         print(f"  Downloading {fname} …")
 
         try:
-            urllib.request.urlretrieve(ttf_url, fpath)
+            urllib.request.urlretrieve(ttf_url, tmp_path)
         except Exception as e:
             print(f"    Failed download {fname}: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
             continue
 
         # Check Unicode coverage
-        font_ranges = get_unicode_ranges(fpath)
+        font_ranges = get_unicode_ranges(tmp_path)
         missing = font_missing_from_target(font_ranges, target_ranges)
 
         if len(missing) == 0:
@@ -147,6 +102,15 @@ for fid in arabic_ids:
             print(f"    ⚠️ Missing {len(missing)} codepoints (tolerated)")
         else:
             print(f"    ❌ Missing {len(missing)} codepoints → removing")
-            os.remove(fpath)
+            os.remove(tmp_path)
+            if os.path.exists(fpath):
+                # may be a read-only link into the font store
+                unlink(fpath)
+            continue
+
+        # Store each unique font once and link it into the output folder
+        _, method, is_new = store_and_link(tmp_path, fpath, FONT_STORE_DIR, move=True)
+        if not is_new:
+            print(f"    Identical to a stored font ({method})")
 
 print("Done — filtered fonts saved in:", OUTPUT_DIR)
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+Unicode block and script lookups over the precomputed tables in unicode_data.py.
+
+Single codepoints are looked up with a binary search; coverage given as (start, end)
+runs is summarized per block/script by sweeping the runs against the tables (cost grows
+with the number of runs, not codepoints); arrays of codepoints from a whole corpus go
+through one vectorized numpy searchsorted.
+
+Run directly for a per-block coverage report of fonts, or with --corpus for one
+summary over all of them:
+
+  python unicode_blocks.py E:\\Fonts\\chinese_fonts_filtered\\NotoSansSC-Regular.ttf
+  python unicode_blocks.py --scripts E:\\Fonts\\arabic_fonts_filtered\\*.ttf
+  python unicode_blocks.py --corpus --scripts E:\\Fonts\\*\\*.ttf
+"""
+
+import argparse
+import glob
+import os
+import sys
+from bisect import bisect_right
+from collections import defaultdict
+
+from font_ranges import get_unicode_ranges
+from unicode_data import (
+    BLOCK_INDEX,
+    BLOCK_NAMES,
+    BLOCK_STARTS,
+    NONPRINTABLE_ENDS,
+    NONPRINTABLE_STARTS,
+    SCRIPT_INDEX,
+    SCRIPT_NAMES,
+    SCRIPT_STARTS,
+)
+
+MAX_CP = 0x10FFFF
+NO_BLOCK = "No_Block"
+
+
+# -----------------------------
+# Single codepoints
+# -----------------------------
+
+def block_of(cp):
+    """Name of the Unicode block containing cp ('No_Block' if unassigned)."""
+    return BLOCK_NAMES[BLOCK_INDEX[bisect_right(BLOCK_STARTS, cp) - 1]]
+
+
+def script_of(cp):
+    """Unicode script of cp, e.g. 'Han', 'Arabic', 'Common', 'Unknown'."""
+    return SCRIPT_NAMES[SCRIPT_INDEX[bisect_right(SCRIPT_STARTS, cp) - 1]]
+
+
+def is_printable(cp):
+    i = bisect_right(NONPRINTABLE_STARTS, cp) - 1
+    return i < 0 or cp > NONPRINTABLE_ENDS[i]
+
+
+# -----------------------------
+# Runs of codepoints
+# -----------------------------
+
+def _split_runs(starts, index, ranges):
+    """Yield (table index, start, end) pieces of the runs, cut at table boundaries."""
+    n = len(starts)
+    for a, b in ranges:
+        i = bisect_right(starts, a) - 1
+        while a <= b:
+            seg_end = starts[i + 1] - 1 if i + 1 < n else MAX_CP
+            end = min(b, seg_end)
+            yield index[i], a, end
+            a = end + 1
+            i += 1
+
+
+def _counts(starts, index, names, ranges):
+    counts = defaultdict(int)
+    for idx, a, b in _split_runs(starts, index, ranges):
+        counts[names[idx]] += b - a + 1
+    return dict(counts)
+
+
+def script_counts(ranges):
+    """{script name: codepoints of the runs in that script}."""
+    return _counts(SCRIPT_STARTS, SCRIPT_INDEX, SCRIPT_NAMES, ranges)
+
+
+def _select(starts, index, names, ranges, wanted_names):
+    if isinstance(wanted_names, str):
+        wanted_names = {wanted_names}
+    wanted = {i for i, name in enumerate(names) if name in wanted_names}
+    out = []
+    for idx, a, b in _split_runs(starts, index, ranges):
+        if idx in wanted:
+            if out and out[-1][1] + 1 == a:
+                out[-1] = (out[-1][0], b)
+            else:
+                out.append((a, b))
+    return out
+
+
+def script_ranges(ranges, scripts):
+    """The parts of the runs whose script is in `scripts` (a name or a collection of names)."""
+    return _select(SCRIPT_STARTS, SCRIPT_INDEX, SCRIPT_NAMES, ranges, scripts)
+
+
+def block_ranges(ranges, blocks):
+    """The parts of the runs inside the blocks `blocks` (a name or a collection of names)."""
+    return _select(BLOCK_STARTS, BLOCK_INDEX, BLOCK_NAMES, ranges, blocks)
+
+
+def printable_ranges(ranges):
+    """The runs with all non-printable codepoints (controls, format, separators...) removed."""
+    out = []
+    n = len(NONPRINTABLE_STARTS)
+    for a, b in ranges:
+        i = max(bisect_right(NONPRINTABLE_STARTS, a) - 1, 0)
+        while a <= b:
+            # skip non-printable runs that end before a
+            while i < n and NONPRINTABLE_ENDS[i] < a:
+                i += 1
+            if i == n or NONPRINTABLE_STARTS[i] > b:
+                out.append((a, b))
+                break
+            if NONPRINTABLE_STARTS[i] > a:
+                out.append((a, NONPRINTABLE_STARTS[i] - 1))
+            a = NONPRINTABLE_ENDS[i] + 1
+            i += 1
+    return out
+
+
+def block_coverage(ranges):
+    """
+    [(block, start, end, covered, size)] for every block the runs touch, in codepoint
+    order, e.g. ('CJK Unified Ideographs Extension A', 0x3400, 0x4DBF, 6582, 6592).
+    """
+    covered = defaultdict(int)
+    for i, a, b in _split_runs(BLOCK_STARTS, range(len(BLOCK_STARTS)), ranges):
+        covered[i] += b - a + 1
+    out = []
+    for i in sorted(covered):
+        name = BLOCK_NAMES[BLOCK_INDEX[i]]
+        if name == NO_BLOCK:
+            continue
+        end = BLOCK_STARTS[i + 1] - 1 if i + 1 < len(BLOCK_STARTS) else MAX_CP
+        out.append((name, BLOCK_STARTS[i], end, covered[i], end - BLOCK_STARTS[i] + 1))
+    return out
+
+
+def format_block_coverage(ranges):
+    return [f"0x{start:04X}-0x{end:04X} {name}: {n}/{size}"
+            for name, start, end, n, size in block_coverage(ranges)]
+
+
+# -----------------------------
+# Vectorized (numpy)
+# -----------------------------
+
+def _np_tables():
+    import numpy as np
+
+    return (np,
+            np.asarray(BLOCK_STARTS, dtype=np.int64), np.asarray(BLOCK_INDEX, dtype=np.int64),
+            np.asarray(SCRIPT_STARTS, dtype=np.int64), np.asarray(SCRIPT_INDEX, dtype=np.int64))
+
+
+def block_histogram(codepoints):
+    """{block name: count} for an array of codepoints (duplicates counted), vectorized."""
+    np, bstarts, bindex, _, _ = _np_tables()
+    idx = bindex[np.searchsorted(bstarts, np.asarray(codepoints, dtype=np.int64), side="right") - 1]
+    counts = np.bincount(idx, minlength=len(BLOCK_NAMES))
+    return {BLOCK_NAMES[i]: int(c) for i, c in enumerate(counts) if c}
+
+
+def script_histogram(codepoints):
+    """{script name: count} for an array of codepoints (duplicates counted), vectorized."""
+    np, _, _, sstarts, sindex = _np_tables()
+    idx = sindex[np.searchsorted(sstarts, np.asarray(codepoints, dtype=np.int64), side="right") - 1]
+    counts = np.bincount(idx, minlength=len(SCRIPT_NAMES))
+    return {SCRIPT_NAMES[i]: int(c) for i, c in enumerate(counts) if c}
+
+
+def codepoint_array(ranges):
+    """numpy array of the codepoints of the runs, for the histograms."""
+    import numpy as np
+
+    if not ranges:
+        return np.zeros(0, dtype=np.int64)
+    return np.concatenate([np.arange(a, b + 1, dtype=np.int64) for a, b in ranges])
+
+
+# -----------------------------
+# Report
+# -----------------------------
+
+def print_corpus_summary(font_ranges, scripts=False):
+    """
+    One summary over all fonts: per block (or script), the distinct codepoints any font
+    maps and the codepoints summed over the fonts.
+    """
+    import numpy as np
+
+    cps = np.concatenate([codepoint_array(r) for r in font_ranges]) if font_ranges else codepoint_array([])
+    histogram = script_histogram if scripts else block_histogram
+    total = histogram(cps)
+    distinct = histogram(np.unique(cps))
+    print(f"\nCorpus: {len(font_ranges)} fonts, {len(cps)} codepoints, {sum(distinct.values())} distinct")
+    for name, n in sorted(total.items(), key=lambda kv: -kv[1]):
+        print(f"  {name}: {distinct[name]} distinct, {n} over all fonts")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report font coverage per Unicode block or script.")
+    parser.add_argument("fonts", nargs="+", help="TTF/OTF files (wildcards allowed)")
+    parser.add_argument("--scripts", action="store_true", help="summarize per script instead of per block")
+    parser.add_argument("--corpus", action="store_true",
+                        help="print one summary over all fonts instead of a report per font")
+    args = parser.parse_args()
+
+    paths = [p for pattern in args.fonts for p in (glob.glob(pattern) or [pattern])]
+    font_ranges = []
+    for path in paths:
+        if not os.path.exists(path):
+            print("File not found:", path)
+            sys.exit(1)
+        ranges = get_unicode_ranges(path)
+        if args.corpus:
+            font_ranges.append(ranges)
+            continue
+        print(f"\nFile: {os.path.basename(path)}")
+        if args.scripts:
+            for name, n in sorted(script_counts(ranges).items(), key=lambda kv: -kv[1]):
+                print(f"  {name}: {n}")
+        else:
+            for line in format_block_coverage(ranges):
+                print(" ", line)
+    if args.corpus:
+        print_corpus_summary(font_ranges, args.scripts)
+
+
+if __name__ == "__main__":
+    main()
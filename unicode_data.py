@@ -0,0 +1,1157 @@
+# Generated by generate-unicode-data.py, do not edit.
+# Blocks and scripts: Unicode 18.0.0 (fontTools.unicodedata).
+# Printability: General_Category of Unicode 14.0.0 (fontTools.unicodedata),
+# plus codepoints assigned to a script since then.
+#
+# *_STARTS partition 0..0x10FFFF: entry i covers STARTS[i]..STARTS[i+1]-1 and
+# *_INDEX[i] is its position in *_NAMES. Look up with bisect_right(STARTS, cp) - 1.
+
+from array import array
+
+UNICODE_VERSION = '18.0.0'
+
+BLOCK_NAMES = (
+    'Adlam',
+    'Aegean Numbers',
+    'Ahom',
+    'Alchemical Symbols',
+    'Alphabetic Presentation Forms',
+    'Anatolian Hieroglyphs',
+    'Ancient Greek Musical Notation',
+    'Ancient Greek Numbers',
+    'Ancient Symbols',
+    'Arabic',
+    'Arabic Extended-A',
+    'Arabic Extended-B',
+    'Arabic Extended-C',
+    'Arabic Mathematical Alphabetic Symbols',
+    'Arabic Presentation Forms-A',
+    'Arabic Presentation Forms-B',
+    'Arabic Supplement',
+    'Archaic Cuneiform Numerals',
+    'Armenian',
+    'Arrows',
+    'Avestan',
+    'Balinese',
+    'Bamum',
+    'Bamum Supplement',
+    'Basic Latin',
+    'Bassa Vah',
+    'Batak',
+    'Bengali',
+    'Bengali Supplement',
+    'Beria Erfe',
+    'Bhaiksuki',
+    'Block Elements',
+    'Bopomofo',
+    'Bopomofo Extended',
+    'Box Drawing',
+    'Brahmi',
+    'Braille Patterns',
+    'Buginese',
+    'Buhid',
+    'Byzantine Musical Symbols',
+    'CJK Compatibility',
+    'CJK Compatibility Forms',
+    'CJK Compatibility Ideographs',
+    'CJK Compatibility Ideographs Supplement',
+    'CJK Radicals Supplement',
+    'CJK Strokes',
+    'CJK Symbols and Punctuation',
+    'CJK Unified Ideographs',
+    'CJK Unified Ideographs Extension A',
+    'CJK Unified Ideographs Extension B',
+    'CJK Unified Ideographs Extension C',
+    'CJK Unified Ideographs Extension D',
+    'CJK Unified Ideographs Extension E',
+    'CJK Unified Ideographs Extension F',
+    'CJK Unified Ideographs Extension G',
+    'CJK Unified Ideographs Extension H',
+    'CJK Unified Ideographs Extension I',
+    'CJK Unified Ideographs Extension J',
+    'Carian',
+    'Caucasian Albanian',
+    'Chakma',
+    'Cham',
+    'Cherokee',
+    'Cherokee Supplement',
+    'Chess Symbols',
+    'Chorasmian',
+    'Combining Diacritical Marks',
+    'Combining Diacritical Marks Extended',
+    'Combining Diacritical Marks Supplement',
+    'Combining Diacritical Marks for Symbols',
+    'Combining Half Marks',
+    'Common Indic Number Forms',
+    'Control Pictures',
+    'Coptic',
+    'Coptic Epact Numbers',
+    'Counting Rod Numerals',
+    'Cuneiform',
+    'Cuneiform Numbers and Punctuation',
+    'Currency Symbols',
+    'Cypriot Syllabary',
+    'Cypro-Minoan',
+    'Cyrillic',
+    'Cyrillic Extended-A',
+    'Cyrillic Extended-B',
+    'Cyrillic Extended-C',
+    'Cyrillic Extended-D',
+    'Cyrillic Supplement',
+    'Deseret',
+    'Devanagari',
+    'Devanagari Extended',
+    'Devanagari Extended-A',
+    'Dingbats',
+    'Dives Akuru',
+    'Dogra',
+    'Domino Tiles',
+    'Duployan',
+    'Early Dynastic Cuneiform',
+    'Egyptian Hieroglyph Format Controls',
+    'Egyptian Hieroglyphs',
+    'Egyptian Hieroglyphs Extended-A',
+    'Elbasan',
+    'Elymaic',
+    'Emoticons',
+    'Enclosed Alphanumeric Supplement',
+    'Enclosed Alphanumerics',
+    'Enclosed CJK Letters and Months',
+    'Enclosed Ideographic Supplement',
+    'Ethiopic',
+    'Ethiopic Extended',
+    'Ethiopic Extended-A',
+    'Ethiopic Extended-B',
+    'Ethiopic Supplement',
+    'Garay',
+    'General Punctuation',
+    'Geometric Shapes',
+    'Geometric Shapes Extended',
+    'Georgian',
+    'Georgian Extended',
+    'Georgian Supplement',
+    'Glagolitic',
+    'Glagolitic Supplement',
+    'Gothic',
+    'Grantha',
+    'Greek Extended',
+    'Greek and Coptic',
+    'Gujarati',
+    'Gunjala Gondi',
+    'Gurmukhi',
+    'Gurung Khema',
+    'Halfwidth and Fullwidth Forms',
+    'Hangul Compatibility Jamo',
+    'Hangul Jamo',
+    'Hangul Jamo Extended-A',
+    'Hangul Jamo Extended-B',
+    'Hangul Syllables',
+    'Hanifi Rohingya',
+    'Hanunoo',
+    'Hatran',
+    'Hebrew',
+    'High Private Use Surrogates',
+    'High Surrogates',
+    'Hiragana',
+    'IPA Extensions',
+    'Ideographic Description Characters',
+    'Ideographic Symbols and Punctuation',
+    'Imperial Aramaic',
+    'Indic Siyaq Numbers',
+    'Inscriptional Pahlavi',
+    'Inscriptional Parthian',
+    'Javanese',
+    'Jurchen',
+    'Jurchen Radicals',
+    'Kaithi',
+    'Kaktovik Numerals',
+    'Kana Extended-A',
+    'Kana Extended-B',
+    'Kana Supplement',
+    'Kanbun',
+    'Kangxi Radicals',
+    'Kannada',
+    'Katakana',
+    'Katakana Phonetic Extensions',
+    'Kawi',
+    'Kayah Li',
+    'Kharoshthi',
+    'Khitan Small Script',
+    'Khmer',
+    'Khmer Symbols',
+    'Khojki',
+    'Khudawadi',
+    'Kirat Rai',
+    'Lao',
+    'Latin Extended Additional',
+    'Latin Extended-A',
+    'Latin Extended-B',
+    'Latin Extended-C',
+    'Latin Extended-D',
+    'Latin Extended-E',
+    'Latin Extended-F',
+    'Latin Extended-G',
+    'Latin-1 Supplement',
+    'Lepcha',
+    'Letterlike Symbols',
+    'Limbu',
+    'Linear A',
+    'Linear B Ideograms',
+    'Linear B Syllabary',
+    'Lisu',
+    'Lisu Supplement',
+    'Low Surrogates',
+    'Lycian',
+    'Lydian',
+    'Mahajani',
+    'Mahjong Tiles',
+    'Makasar',
+    'Malayalam',
+    'Mandaic',
+    'Manichaean',
+    'Marchen',
+    'Masaram Gondi',
+    'Mathematical Alphanumeric Symbols',
+    'Mathematical Operators',
+    'Mayan Numerals',
+    'Medefaidrin',
+    'Meetei Mayek',
+    'Meetei Mayek Extensions',
+    'Mende Kikakui',
+    'Meroitic Cursive',
+    'Meroitic Hieroglyphs',
+    'Miao',
+    'Miscellaneous Mathematical Symbols-A',
+    'Miscellaneous Mathematical Symbols-B',
+    'Miscellaneous Symbols',
+    'Miscellaneous Symbols Supplement',
+    'Miscellaneous Symbols and Arrows',
+    'Miscellaneous Symbols and Arrows Extended',
+    'Miscellaneous Symbols and Pictographs',
+    'Miscellaneous Technical',
+    'Modi',
+    'Modifier Tone Letters',
+    'Mongolian',
+    'Mongolian Supplement',
+    'Mro',
+    'Multani',
+    'Musical Symbols',
+    'Musical Symbols Supplement',
+    'Myanmar',
+    'Myanmar Extended-A',
+    'Myanmar Extended-B',
+    'Myanmar Extended-C',
+    'NKo',
+    'Nabataean',
+    'Nag Mundari',
+    'Nandinagari',
+    'New Tai Lue',
+    'Newa',
+    'No_Block',
+    'Number Forms',
+    'Nushu',
+    'Nyiakeng Puachue Hmong',
+    'Ogham',
+    'Ol Chiki',
+    'Ol Onal',
+    'Old Hungarian',
+    'Old Italic',
+    'Old North Arabian',
+    'Old Permic',
+    'Old Persian',
+    'Old Sogdian',
+    'Old South Arabian',
+    'Old Turkic',
+    'Old Uyghur',
+    'Optical Character Recognition',
+    'Oriya',
+    'Ornamental Dingbats',
+    'Osage',
+    'Osmanya',
+    'Ottoman Siyaq Numbers',
+    'Pahawh Hmong',
+    'Palmyrene',
+    'Pau Cin Hau',
+    'Phags-pa',
+    'Phaistos Disc',
+    'Phoenician',
+    'Phonetic Extensions',
+    'Phonetic Extensions Supplement',
+    'Playing Cards',
+    'Private Use Area',
+    'Psalter Pahlavi',
+    'Rejang',
+    'Rumi Numeral Symbols',
+    'Runic',
+    'Samaritan',
+    'Saurashtra',
+    'Seal',
+    'Sharada',
+    'Sharada Supplement',
+    'Shavian',
+    'Shorthand Format Controls',
+    'Siddham',
+    'Sidetic',
+    'Sinhala',
+    'Sinhala Archaic Numbers',
+    'Small Form Variants',
+    'Small Kana Extension',
+    'Sogdian',
+    'Sora Sompeng',
+    'Soyombo',
+    'Spacing Modifier Letters',
+    'Specials',
+    'Sundanese',
+    'Sundanese Supplement',
+    'Sunuwar',
+    'Superscripts and Subscripts',
+    'Supplemental Arrows-A',
+    'Supplemental Arrows-B',
+    'Supplemental Arrows-C',
+    'Supplemental Mathematical Operators',
+    'Supplemental Punctuation',
+    'Supplemental Symbols and Pictographs',
+    'Supplementary Private Use Area-A',
+    'Supplementary Private Use Area-B',
+    'Sutton SignWriting',
+    'Syloti Nagri',
+    'Symbols and Pictographs Extended-A',
+    'Symbols for Legacy Computing',
+    'Symbols for Legacy Computing Supplement',
+    'Syriac',
+    'Syriac Supplement',
+    'Tagalog',
+    'Tagbanwa',
+    'Tags',
+    'Tai Le',
+    'Tai Tham',
+    'Tai Viet',
+    'Tai Xuan Jing Symbols',
+    'Tai Yo',
+    'Takri',
+    'Tamil',
+    'Tamil Supplement',
+    'Tangsa',
+    'Tangut',
+    'Tangut Components',
+    'Tangut Components Supplement',
+    'Tangut Supplement',
+    'Telugu',
+    'Thaana',
+    'Thai',
+    'Tibetan',
+    'Tifinagh',
+    'Tirhuta',
+    'Todhri',
+    'Tolong Siki',
+    'Toto',
+    'Transport and Map Symbols',
+    'Tulu-Tigalari',
+    'Ugaritic',
+    'Unified Canadian Aboriginal Syllabics',
+    'Unified Canadian Aboriginal Syllabics Extended',
+    'Unified Canadian Aboriginal Syllabics Extended-A',
+    'Vai',
+    'Variation Selectors',
+    'Variation Selectors Supplement',
+    'Vedic Extensions',
+    'Vertical Forms',
+    'Vithkuqi',
+    'Wancho',
+    'Warang Citi',
+    'Yezidi',
+    'Yi Radicals',
+    'Yi Syllables',
+    'Yijing Hexagram Symbols',
+    'Zanabazar Square',
+    'Znamenny Musical Notation',
+)
+
+BLOCK_STARTS = array("I", [
+    0x00000, 0x00080, 0x00100, 0x00180, 0x00250, 0x002B0, 0x00300, 0x00370,
+    0x00400, 0x00500, 0x00530, 0x00590, 0x00600, 0x00700, 0x00750, 0x00780,
+    0x007C0, 0x00800, 0x00840, 0x00860, 0x00870, 0x008A0, 0x00900, 0x00980,
+    0x00A00, 0x00A80, 0x00B00, 0x00B80, 0x00C00, 0x00C80, 0x00D00, 0x00D80,
+    0x00E00, 0x00E80, 0x00F00, 0x01000, 0x010A0, 0x01100, 0x01200, 0x01380,
+    0x013A0, 0x01400, 0x01680, 0x016A0, 0x01700, 0x01720, 0x01740, 0x01760,
+    0x01780, 0x01800, 0x018B0, 0x01900, 0x01950, 0x01980, 0x019E0, 0x01A00,
+    0x01A20, 0x01AB0, 0x01B00, 0x01B80, 0x01BC0, 0x01C00, 0x01C50, 0x01C80,
+    0x01C90, 0x01CC0, 0x01CD0, 0x01D00, 0x01D80, 0x01DC0, 0x01E00, 0x01F00,
+    0x02000, 0x02070, 0x020A0, 0x020D0, 0x02100, 0x02150, 0x02190, 0x02200,
+    0x02300, 0x02400, 0x02440, 0x02460, 0x02500, 0x02580, 0x025A0, 0x02600,
+    0x02700, 0x027C0, 0x027F0, 0x02800, 0x02900, 0x02980, 0x02A00, 0x02B00,
+    0x02C00, 0x02C60, 0x02C80, 0x02D00, 0x02D30, 0x02D80, 0x02DE0, 0x02E00,
+    0x02E80, 0x02F00, 0x02FE0, 0x02FF0, 0x03000, 0x03040, 0x030A0, 0x03100,
+    0x03130, 0x03190, 0x031A0, 0x031C0, 0x031F0, 0x03200, 0x03300, 0x03400,
+    0x04DC0, 0x04E00, 0x0A000, 0x0A490, 0x0A4D0, 0x0A500, 0x0A640, 0x0A6A0,
+    0x0A700, 0x0A720, 0x0A800, 0x0A830, 0x0A840, 0x0A880, 0x0A8E0, 0x0A900,
+    0x0A930, 0x0A960, 0x0A980, 0x0A9E0, 0x0AA00, 0x0AA60, 0x0AA80, 0x0AAE0,
+    0x0AB00, 0x0AB30, 0x0AB70, 0x0ABC0, 0x0AC00, 0x0D7B0, 0x0D800, 0x0DB80,
+    0x0DC00, 0x0E000, 0x0F900, 0x0FB00, 0x0FB50, 0x0FE00, 0x0FE10, 0x0FE20,
+    0x0FE30, 0x0FE50, 0x0FE70, 0x0FF00, 0x0FFF0, 0x10000, 0x10080, 0x10100,
+    0x10140, 0x10190, 0x101D0, 0x10200, 0x10280, 0x102A0, 0x102E0, 0x10300,
+    0x10330, 0x10350, 0x10380, 0x103A0, 0x103E0, 0x10400, 0x10450, 0x10480,
+    0x104B0, 0x10500, 0x10530, 0x10570, 0x105C0, 0x10600, 0x10780, 0x107C0,
+    0x10800, 0x10840, 0x10860, 0x10880, 0x108B0, 0x108E0, 0x10900, 0x10920,
+    0x10940, 0x10960, 0x10980, 0x109A0, 0x10A00, 0x10A60, 0x10A80, 0x10AA0,
+    0x10AC0, 0x10B00, 0x10B40, 0x10B60, 0x10B80, 0x10BB0, 0x10C00, 0x10C50,
+    0x10C80, 0x10D00, 0x10D40, 0x10D90, 0x10E60, 0x10E80, 0x10EC0, 0x10F00,
+    0x10F30, 0x10F70, 0x10FB0, 0x10FE0, 0x11000, 0x11080, 0x110D0, 0x11100,
+    0x11150, 0x11180, 0x111E0, 0x11200, 0x11250, 0x11280, 0x112B0, 0x11300,
+    0x11380, 0x11400, 0x11480, 0x114E0, 0x11580, 0x11600, 0x11660, 0x11680,
+    0x116D0, 0x11700, 0x11750, 0x11800, 0x11850, 0x118A0, 0x11900, 0x11960,
+    0x119A0, 0x11A00, 0x11A50, 0x11AB0, 0x11AC0, 0x11B00, 0x11B60, 0x11B80,
+    0x11BC0, 0x11C00, 0x11C70, 0x11CC0, 0x11D00, 0x11D60, 0x11DB0, 0x11DF0,
+    0x11E00, 0x11EE0, 0x11F00, 0x11F60, 0x11FB0, 0x11FC0, 0x12000, 0x12400,
+    0x12480, 0x12550, 0x12690, 0x12F90, 0x13000, 0x13430, 0x13460, 0x14400,
+    0x14680, 0x16100, 0x16140, 0x16800, 0x16A40, 0x16A70, 0x16AD0, 0x16B00,
+    0x16B90, 0x16D40, 0x16D80, 0x16E40, 0x16EA0, 0x16EE0, 0x16F00, 0x16FA0,
+    0x16FE0, 0x17000, 0x18800, 0x18B00, 0x18D00, 0x18D80, 0x18E00, 0x191A0,
+    0x191E0, 0x1AFF0, 0x1B000, 0x1B100, 0x1B130, 0x1B170, 0x1B300, 0x1BC00,
+    0x1BCA0, 0x1BCB0, 0x1CC00, 0x1CEC0, 0x1CF00, 0x1CFD0, 0x1D000, 0x1D100,
+    0x1D200, 0x1D250, 0x1D290, 0x1D2C0, 0x1D2E0, 0x1D300, 0x1D360, 0x1D380,
+    0x1D400, 0x1D800, 0x1DAB0, 0x1DB00, 0x1DC00, 0x1DF00, 0x1E000, 0x1E030,
+    0x1E090, 0x1E100, 0x1E150, 0x1E290, 0x1E2C0, 0x1E300, 0x1E4D0, 0x1E500,
+    0x1E5D0, 0x1E600, 0x1E6C0, 0x1E700, 0x1E7E0, 0x1E800, 0x1E8E0, 0x1E900,
+    0x1E960, 0x1EC70, 0x1ECC0, 0x1ED00, 0x1ED50, 0x1EE00, 0x1EF00, 0x1F000,
+    0x1F030, 0x1F0A0, 0x1F100, 0x1F200, 0x1F300, 0x1F600, 0x1F650, 0x1F680,
+    0x1F700, 0x1F780, 0x1F800, 0x1F900, 0x1FA00, 0x1FA70, 0x1FB00, 0x1FC00,
+    0x20000, 0x2A6E0, 0x2A700, 0x2B740, 0x2B820, 0x2CEB0, 0x2EBF0, 0x2EE60,
+    0x2F800, 0x2FA20, 0x30000, 0x31350, 0x323B0, 0x33480, 0x3D000, 0x3FC40,
+    0xE0000, 0xE0080, 0xE0100, 0xE01F0, 0xF0000, 0x100000,
+])
+
+BLOCK_INDEX = array("H", [
+    24, 180, 173, 174, 142, 288, 66, 124, 81, 86, 18, 138, 9, 307, 16, 326,
+    230, 272, 196, 308, 11, 10, 88, 27, 127, 125, 253, 318, 325, 159, 195, 281,
+    327, 171, 328, 226, 116, 131, 107, 111, 62, 337, 240, 271, 309, 136, 38, 310,
+    166, 220, 338, 183, 312, 234, 167, 37, 313, 67, 21, 290, 26, 181, 241, 84,
+    117, 291, 343, 264, 265, 68, 172, 123, 113, 293, 78, 69, 182, 237, 19, 201,
+    217, 72, 252, 104, 34, 31, 114, 212, 91, 210, 294, 36, 295, 211, 297, 214,
+    119, 175, 73, 118, 329, 108, 82, 298, 44, 158, 236, 143, 46, 141, 160, 32,
+    130, 157, 33, 45, 161, 105, 40, 48, 351, 47, 350, 349, 187, 340, 83, 22,
+    219, 176, 303, 71, 261, 273, 89, 163, 269, 132, 149, 228, 61, 227, 314, 205,
+    109, 177, 63, 204, 134, 133, 140, 139, 189, 267, 42, 4, 14, 341, 344, 70,
+    41, 283, 15, 129, 289, 186, 185, 1, 7, 8, 262, 236, 190, 58, 74, 244,
+    121, 246, 336, 247, 236, 87, 277, 256, 255, 100, 59, 345, 331, 184, 178, 236,
+    79, 145, 259, 231, 236, 137, 263, 191, 280, 236, 208, 207, 164, 249, 245, 236,
+    197, 20, 148, 147, 268, 236, 250, 236, 243, 135, 112, 236, 270, 348, 12, 248,
+    285, 251, 65, 101, 35, 152, 286, 60, 192, 275, 282, 168, 236, 223, 169, 122,
+    335, 235, 330, 236, 279, 218, 221, 317, 229, 2, 236, 93, 236, 347, 92, 236,
+    233, 352, 287, 339, 260, 90, 276, 236, 292, 30, 198, 236, 199, 126, 332, 28,
+    236, 194, 162, 236, 188, 319, 76, 77, 96, 17, 236, 80, 98, 97, 99, 5,
+    236, 128, 236, 23, 222, 320, 25, 258, 236, 170, 236, 203, 29, 236, 209, 236,
+    144, 321, 322, 165, 324, 323, 150, 151, 236, 155, 156, 154, 284, 238, 236, 95,
+    278, 236, 306, 213, 353, 236, 39, 224, 6, 225, 236, 153, 202, 315, 75, 236,
+    200, 302, 236, 215, 236, 179, 120, 85, 236, 239, 236, 333, 346, 236, 232, 236,
+    242, 236, 316, 236, 110, 206, 236, 0, 236, 146, 236, 257, 236, 13, 236, 193,
+    94, 266, 103, 106, 216, 102, 254, 334, 3, 115, 296, 299, 64, 304, 305, 236,
+    49, 236, 50, 51, 52, 53, 56, 236, 43, 236, 54, 55, 57, 236, 274, 236,
+    311, 236, 342, 236, 300, 301,
+])
+
+SCRIPT_NAMES = (
+    'Adlam',
+    'Ahom',
+    'Anatolian Hieroglyphs',
+    'Arabic',
+    'Armenian',
+    'Avestan',
+    'Balinese',
+    'Bamum',
+    'Bassa Vah',
+    'Batak',
+    'Bengali',
+    'Beria Erfe',
+    'Bhaiksuki',
+    'Bopomofo',
+    'Brahmi',
+    'Braille',
+    'Buginese',
+    'Buhid',
+    'Canadian Aboriginal',
+    'Carian',
+    'Caucasian Albanian',
+    'Chakma',
+    'Cham',
+    'Cherokee',
+    'Chorasmian',
+    'Common',
+    'Coptic',
+    'Cuneiform',
+    'Cypriot',
+    'Cypro Minoan',
+    'Cyrillic',
+    'Deseret',
+    'Devanagari',
+    'Dives Akuru',
+    'Dogra',
+    'Duployan',
+    'Egyptian Hieroglyphs',
+    'Elbasan',
+    'Elymaic',
+    'Ethiopic',
+    'Garay',
+    'Georgian',
+    'Glagolitic',
+    'Gothic',
+    'Grantha',
+    'Greek',
+    'Gujarati',
+    'Gunjala Gondi',
+    'Gurmukhi',
+    'Gurung Khema',
+    'Han',
+    'Hangul',
+    'Hanifi Rohingya',
+    'Hanunoo',
+    'Hatran',
+    'Hebrew',
+    'Hiragana',
+    'Imperial Aramaic',
+    'Inherited',
+    'Inscriptional Pahlavi',
+    'Inscriptional Parthian',
+    'Javanese',
+    'Jurchen',
+    'Kaithi',
+    'Kannada',
+    'Katakana',
+    'Kawi',
+    'Kayah Li',
+    'Kharoshthi',
+    'Khitan Small Script',
+    'Khmer',
+    'Khojki',
+    'Khudawadi',
+    'Kirat Rai',
+    'Lao',
+    'Latin',
+    'Lepcha',
+    'Limbu',
+    'Linear A',
+    'Linear B',
+    'Lisu',
+    'Lycian',
+    'Lydian',
+    'Mahajani',
+    'Makasar',
+    'Malayalam',
+    'Mandaic',
+    'Manichaean',
+    'Marchen',
+    'Masaram Gondi',
+    'Medefaidrin',
+    'Meetei Mayek',
+    'Mende Kikakui',
+    'Meroitic Cursive',
+    'Meroitic Hieroglyphs',
+    'Miao',
+    'Modi',
+    'Mongolian',
+    'Mro',
+    'Multani',
+    'Myanmar',
+    'Nabataean',
+    'Nag Mundari',
+    'Nandinagari',
+    'New Tai Lue',
+    'Newa',
+    'Nko',
+    'Nushu',
+    'Nyiakeng Puachue Hmong',
+    'Ogham',
+    'Ol Chiki',
+    'Ol Onal',
+    'Old Hungarian',
+    'Old Italic',
+    'Old North Arabian',
+    'Old Permic',
+    'Old Persian',
+    'Old Sogdian',
+    'Old South Arabian',
+    'Old Turkic',
+    'Old Uyghur',
+    'Oriya',
+    'Osage',
+    'Osmanya',
+    'Pahawh Hmong',
+    'Palmyrene',
+    'Pau Cin Hau',
+    'Phags Pa',
+    'Phoenician',
+    'Proto Cuneiform',
+    'Psalter Pahlavi',
+    'Rejang',
+    'Runic',
+    'Samaritan',
+    'Saurashtra',
+    'Seal',
+    'Sharada',
+    'Shavian',
+    'Siddham',
+    'Sidetic',
+    'SignWriting',
+    'Sinhala',
+    'Sogdian',
+    'Sora Sompeng',
+    'Soyombo',
+    'Sundanese',
+    'Sunuwar',
+    'Syloti Nagri',
+    'Syriac',
+    'Tagalog',
+    'Tagbanwa',
+    'Tai Le',
+    'Tai Tham',
+    'Tai Viet',
+    'Tai Yo',
+    'Takri',
+    'Tamil',
+    'Tangsa',
+    'Tangut',
+    'Telugu',
+    'Thaana',
+    'Thai',
+    'Tibetan',
+    'Tifinagh',
+    'Tirhuta',
+    'Todhri',
+    'Tolong Siki',
+    'Toto',
+    'Tulu Tigalari',
+    'Ugaritic',
+    'Unknown',
+    'Vai',
+    'Vithkuqi',
+    'Wancho',
+    'Warang Citi',
+    'Yezidi',
+    'Yi',
+    'Zanabazar Square',
+)
+
+SCRIPT_STARTS = array("I", [
+    0x00000, 0x00041, 0x0005B, 0x00061, 0x0007B, 0x000AA, 0x000AB, 0x000BA,
+    0x000BB, 0x000C0, 0x000D7, 0x000D8, 0x000F7, 0x000F8, 0x002B9, 0x002E0,
+    0x002E5, 0x002EA, 0x002EC, 0x00300, 0x00370, 0x00374, 0x00375, 0x00378,
+    0x0037A, 0x0037E, 0x0037F, 0x00380, 0x00384, 0x00385, 0x00386, 0x00387,
+    0x00388, 0x0038B, 0x0038C, 0x0038D, 0x0038E, 0x003A2, 0x003A3, 0x003E2,
+    0x003F0, 0x00400, 0x00485, 0x00487, 0x00530, 0x00531, 0x00557, 0x00558,
+    0x00590, 0x00591, 0x005CA, 0x005D0, 0x005EB, 0x005EF, 0x005F5, 0x00600,
+    0x00605, 0x00606, 0x0060C, 0x0060D, 0x0061B, 0x0061C, 0x0061F, 0x00620,
+    0x00640, 0x00641, 0x0064B, 0x00656, 0x00670, 0x00671, 0x006DD, 0x006DE,
+    0x00700, 0x0070E, 0x0070F, 0x0074B, 0x0074D, 0x00750, 0x00780, 0x007B2,
+    0x007C0, 0x007FB, 0x007FD, 0x00800, 0x0082E, 0x00830, 0x0083F, 0x00840,
+    0x0085C, 0x0085E, 0x0085F, 0x00860, 0x0086B, 0x00870, 0x00892, 0x00897,
+    0x008E2, 0x008E3, 0x00900, 0x00951, 0x00955, 0x00964, 0x00966, 0x00980,
+    0x00984, 0x00985, 0x0098D, 0x0098F, 0x00991, 0x00993, 0x009A9, 0x009AA,
+    0x009B1, 0x009B2, 0x009B3, 0x009B6, 0x009BA, 0x009BC, 0x009C5, 0x009C7,
+    0x009C9, 0x009CB, 0x009CF, 0x009D7, 0x009D8, 0x009DC, 0x009DE, 0x009DF,
+    0x009E4, 0x009E6, 0x009FF, 0x00A01, 0x00A04, 0x00A05, 0x00A0B, 0x00A0F,
+    0x00A11, 0x00A13, 0x00A29, 0x00A2A, 0x00A31, 0x00A32, 0x00A34, 0x00A35,
+    0x00A37, 0x00A38, 0x00A3A, 0x00A3C, 0x00A3D, 0x00A3E, 0x00A43, 0x00A47,
+    0x00A49, 0x00A4B, 0x00A4E, 0x00A51, 0x00A52, 0x00A59, 0x00A5D, 0x00A5E,
+    0x00A5F, 0x00A66, 0x00A77, 0x00A81, 0x00A84, 0x00A85, 0x00A8E, 0x00A8F,
+    0x00A92, 0x00A93, 0x00AA9, 0x00AAA, 0x00AB1, 0x00AB2, 0x00AB4, 0x00AB5,
+    0x00ABA, 0x00ABC, 0x00AC6, 0x00AC7, 0x00ACA, 0x00ACB, 0x00ACE, 0x00AD0,
+    0x00AD1, 0x00AE0, 0x00AE4, 0x00AE6, 0x00AF2, 0x00AF9, 0x00B00, 0x00B01,
+    0x00B04, 0x00B05, 0x00B0D, 0x00B0F, 0x00B11, 0x00B13, 0x00B29, 0x00B2A,
+    0x00B31, 0x00B32, 0x00B34, 0x00B35, 0x00B3A, 0x00B3C, 0x00B45, 0x00B47,
+    0x00B49, 0x00B4B, 0x00B4E, 0x00B53, 0x00B58, 0x00B5C, 0x00B5E, 0x00B5F,
+    0x00B64, 0x00B66, 0x00B78, 0x00B82, 0x00B84, 0x00B85, 0x00B8B, 0x00B8E,
+    0x00B91, 0x00B92, 0x00B96, 0x00B99, 0x00B9B, 0x00B9C, 0x00B9D, 0x00B9E,
+    0x00BA0, 0x00BA3, 0x00BA5, 0x00BA8, 0x00BAB, 0x00BAE, 0x00BBA, 0x00BBE,
+    0x00BC3, 0x00BC6, 0x00BC9, 0x00BCA, 0x00BCE, 0x00BD0, 0x00BD1, 0x00BD7,
+    0x00BD8, 0x00BE6, 0x00BFB, 0x00C00, 0x00C0D, 0x00C0E, 0x00C11, 0x00C12,
+    0x00C29, 0x00C2A, 0x00C3A, 0x00C3C, 0x00C45, 0x00C46, 0x00C49, 0x00C4A,
+    0x00C4E, 0x00C55, 0x00C57, 0x00C58, 0x00C5B, 0x00C5C, 0x00C5E, 0x00C60,
+    0x00C64, 0x00C66, 0x00C70, 0x00C77, 0x00C80, 0x00C8D, 0x00C8E, 0x00C91,
+    0x00C92, 0x00CA9, 0x00CAA, 0x00CB4, 0x00CB5, 0x00CBA, 0x00CBC, 0x00CC5,
+    0x00CC6, 0x00CC9, 0x00CCA, 0x00CCE, 0x00CD5, 0x00CD7, 0x00CDC, 0x00CDF,
+    0x00CE0, 0x00CE4, 0x00CE6, 0x00CF0, 0x00CF1, 0x00CF4, 0x00D00, 0x00D0D,
+    0x00D0E, 0x00D11, 0x00D12, 0x00D45, 0x00D46, 0x00D49, 0x00D4A, 0x00D50,
+    0x00D54, 0x00D64, 0x00D66, 0x00D80, 0x00D81, 0x00D84, 0x00D85, 0x00D97,
+    0x00D9A, 0x00DB2, 0x00DB3, 0x00DBC, 0x00DBD, 0x00DBE, 0x00DC0, 0x00DC7,
+    0x00DCA, 0x00DCB, 0x00DCF, 0x00DD5, 0x00DD6, 0x00DD7, 0x00DD8, 0x00DE0,
+    0x00DE6, 0x00DF0, 0x00DF2, 0x00DF5, 0x00E01, 0x00E3B, 0x00E3F, 0x00E40,
+    0x00E5C, 0x00E81, 0x00E83, 0x00E84, 0x00E85, 0x00E86, 0x00E8B, 0x00E8C,
+    0x00EA4, 0x00EA5, 0x00EA6, 0x00EA7, 0x00EBE, 0x00EC0, 0x00EC5, 0x00EC6,
+    0x00EC7, 0x00EC8, 0x00ECF, 0x00ED0, 0x00EDA, 0x00EDC, 0x00EE0, 0x00F00,
+    0x00F48, 0x00F49, 0x00F6D, 0x00F71, 0x00F98, 0x00F99, 0x00FBD, 0x00FBE,
+    0x00FCD, 0x00FCE, 0x00FD5, 0x00FD9, 0x00FDB, 0x01000, 0x010A0, 0x010C6,
+    0x010C7, 0x010C8, 0x010CD, 0x010CE, 0x010D0, 0x010FB, 0x010FC, 0x01100,
+    0x01200, 0x01249, 0x0124A, 0x0124E, 0x01250, 0x01257, 0x01258, 0x01259,
+    0x0125A, 0x0125E, 0x01260, 0x01289, 0x0128A, 0x0128E, 0x01290, 0x012B1,
+    0x012B2, 0x012B6, 0x012B8, 0x012BF, 0x012C0, 0x012C1, 0x012C2, 0x012C6,
+    0x012C8, 0x012D7, 0x012D8, 0x01311, 0x01312, 0x01316, 0x01318, 0x0135B,
+    0x0135D, 0x0137D, 0x01380, 0x0139A, 0x013A0, 0x013F6, 0x013F8, 0x013FE,
+    0x01400, 0x01680, 0x0169D, 0x016A0, 0x016EB, 0x016EE, 0x016F9, 0x01700,
+    0x01716, 0x0171F, 0x01720, 0x01735, 0x01737, 0x01740, 0x01754, 0x01760,
+    0x0176D, 0x0176E, 0x01771, 0x01772, 0x01774, 0x01780, 0x017DE, 0x017E0,
+    0x017EA, 0x017F0, 0x017FA, 0x01800, 0x01802, 0x01804, 0x01805, 0x01806,
+    0x0181A, 0x01820, 0x01879, 0x01880, 0x018AB, 0x018B0, 0x018F6, 0x01900,
+    0x0191F, 0x01920, 0x0192C, 0x01930, 0x0193C, 0x01940, 0x01941, 0x01944,
+    0x01950, 0x0196E, 0x01970, 0x01975, 0x01980, 0x019AC, 0x019B0, 0x019CA,
+    0x019D0, 0x019DB, 0x019DE, 0x019E0, 0x01A00, 0x01A1C, 0x01A1E, 0x01A20,
+    0x01A5F, 0x01A60, 0x01A7D, 0x01A7F, 0x01A8A, 0x01A90, 0x01A9A, 0x01AA0,
+    0x01AAE, 0x01AB0, 0x01AF1, 0x01B00, 0x01B4D, 0x01B4E, 0x01B80, 0x01BC0,
+    0x01BF4, 0x01BFC, 0x01C00, 0x01C38, 0x01C3B, 0x01C4A, 0x01C4D, 0x01C50,
+    0x01C80, 0x01C8B, 0x01C90, 0x01CBB, 0x01CBD, 0x01CC0, 0x01CC8, 0x01CD0,
+    0x01CD3, 0x01CD4, 0x01CE1, 0x01CE2, 0x01CE9, 0x01CED, 0x01CEE, 0x01CF4,
+    0x01CF5, 0x01CF8, 0x01CFA, 0x01CFB, 0x01D00, 0x01D26, 0x01D2B, 0x01D2C,
+    0x01D5D, 0x01D62, 0x01D66, 0x01D6B, 0x01D78, 0x01D79, 0x01DBF, 0x01DC0,
+    0x01E00, 0x01F00, 0x01F16, 0x01F18, 0x01F1E, 0x01F20, 0x01F46, 0x01F48,
+    0x01F4E, 0x01F50, 0x01F58, 0x01F59, 0x01F5A, 0x01F5B, 0x01F5C, 0x01F5D,
+    0x01F5E, 0x01F5F, 0x01F7E, 0x01F80, 0x01FB5, 0x01FB6, 0x01FC5, 0x01FC6,
+    0x01FD4, 0x01FD6, 0x01FDC, 0x01FDD, 0x01FF0, 0x01FF2, 0x01FF5, 0x01FF6,
+    0x01FFF, 0x02000, 0x0200C, 0x0200E, 0x02065, 0x02066, 0x02071, 0x02072,
+    0x02074, 0x0207F, 0x02080, 0x02090, 0x020A0, 0x020C5, 0x020D0, 0x020F1,
+    0x02100, 0x02126, 0x02127, 0x0212A, 0x0212C, 0x02132, 0x02133, 0x0214E,
+    0x0214F, 0x02160, 0x02189, 0x0218C, 0x02190, 0x0242A, 0x02440, 0x0244B,
+    0x02460, 0x02800, 0x02900, 0x02B74, 0x02B76, 0x02C00, 0x02C60, 0x02C80,
+    0x02CF4, 0x02CF9, 0x02D00, 0x02D26, 0x02D27, 0x02D28, 0x02D2D, 0x02D2E,
+    0x02D30, 0x02D68, 0x02D6F, 0x02D71, 0x02D7F, 0x02D80, 0x02D97, 0x02DA0,
+    0x02DA7, 0x02DA8, 0x02DAF, 0x02DB0, 0x02DB7, 0x02DB8, 0x02DBF, 0x02DC0,
+    0x02DC7, 0x02DC8, 0x02DCF, 0x02DD0, 0x02DD7, 0x02DD8, 0x02DDF, 0x02DE0,
+    0x02E00, 0x02E5E, 0x02E60, 0x02E64, 0x02E80, 0x02E9A, 0x02E9B, 0x02EF4,
+    0x02F00, 0x02FD6, 0x02FF0, 0x03005, 0x03006, 0x03007, 0x03008, 0x03021,
+    0x0302A, 0x0302E, 0x03030, 0x03038, 0x0303C, 0x03040, 0x03041, 0x03097,
+    0x03099, 0x0309B, 0x0309D, 0x030A0, 0x030A1, 0x030FB, 0x030FD, 0x03100,
+    0x03105, 0x03130, 0x03131, 0x0318F, 0x03190, 0x031A0, 0x031C0, 0x031E6,
+    0x031EF, 0x031F0, 0x03200, 0x0321F, 0x03220, 0x03260, 0x0327F, 0x032D0,
+    0x032FF, 0x03300, 0x03358, 0x03400, 0x04DC0, 0x04E00, 0x0A000, 0x0A48D,
+    0x0A490, 0x0A4C7, 0x0A4D0, 0x0A500, 0x0A62C, 0x0A640, 0x0A6A0, 0x0A6F8,
+    0x0A700, 0x0A722, 0x0A788, 0x0A78B, 0x0A7DE, 0x0A7E2, 0x0A7E3, 0x0A7F1,
+    0x0A800, 0x0A82D, 0x0A830, 0x0A83A, 0x0A840, 0x0A878, 0x0A880, 0x0A8C6,
+    0x0A8CE, 0x0A8DA, 0x0A8E0, 0x0A900, 0x0A92E, 0x0A92F, 0x0A930, 0x0A954,
+    0x0A95F, 0x0A960, 0x0A97D, 0x0A980, 0x0A9CE, 0x0A9CF, 0x0A9D0, 0x0A9DA,
+    0x0A9DE, 0x0A9E0, 0x0A9FF, 0x0AA00, 0x0AA37, 0x0AA40, 0x0AA4E, 0x0AA50,
+    0x0AA5A, 0x0AA5C, 0x0AA60, 0x0AA80, 0x0AAC3, 0x0AADB, 0x0AAE0, 0x0AAF7,
+    0x0AB01, 0x0AB07, 0x0AB09, 0x0AB0F, 0x0AB11, 0x0AB17, 0x0AB20, 0x0AB27,
+    0x0AB28, 0x0AB2F, 0x0AB30, 0x0AB5B, 0x0AB5C, 0x0AB65, 0x0AB66, 0x0AB6A,
+    0x0AB6C, 0x0AB6E, 0x0AB70, 0x0ABC0, 0x0ABEE, 0x0ABF0, 0x0ABFA, 0x0AC00,
+    0x0D7A4, 0x0D7B0, 0x0D7C7, 0x0D7CB, 0x0D7FC, 0x0F900, 0x0FA6E, 0x0FA70,
+    0x0FADA, 0x0FB00, 0x0FB07, 0x0FB13, 0x0FB18, 0x0FB1D, 0x0FB37, 0x0FB38,
+    0x0FB3D, 0x0FB3E, 0x0FB3F, 0x0FB40, 0x0FB42, 0x0FB43, 0x0FB45, 0x0FB46,
+    0x0FB50, 0x0FD3E, 0x0FD40, 0x0FDD0, 0x0FDF0, 0x0FE00, 0x0FE10, 0x0FE1A,
+    0x0FE20, 0x0FE2E, 0x0FE30, 0x0FE53, 0x0FE54, 0x0FE67, 0x0FE68, 0x0FE6C,
+    0x0FE70, 0x0FE75, 0x0FE76, 0x0FEFD, 0x0FEFF, 0x0FF00, 0x0FF01, 0x0FF21,
+    0x0FF3B, 0x0FF41, 0x0FF5B, 0x0FF66, 0x0FF70, 0x0FF71, 0x0FF9E, 0x0FFA0,
+    0x0FFBF, 0x0FFC2, 0x0FFC8, 0x0FFCA, 0x0FFD0, 0x0FFD2, 0x0FFD8, 0x0FFDA,
+    0x0FFDD, 0x0FFE0, 0x0FFE7, 0x0FFE8, 0x0FFEF, 0x0FFF9, 0x0FFFE, 0x10000,
+    0x1000C, 0x1000D, 0x10027, 0x10028, 0x1003B, 0x1003C, 0x1003E, 0x1003F,
+    0x1004E, 0x10050, 0x1005E, 0x10080, 0x100FB, 0x10100, 0x10103, 0x10107,
+    0x10134, 0x10137, 0x10140, 0x1018F, 0x10190, 0x1019D, 0x101A0, 0x101A1,
+    0x101D0, 0x101FD, 0x101FE, 0x10280, 0x1029D, 0x102A0, 0x102D1, 0x102E0,
+    0x102E1, 0x102FC, 0x10300, 0x10324, 0x1032D, 0x10330, 0x1034B, 0x10350,
+    0x1037B, 0x10380, 0x1039E, 0x1039F, 0x103A0, 0x103C4, 0x103C8, 0x103D6,
+    0x10400, 0x10450, 0x10480, 0x1049E, 0x104A0, 0x104AA, 0x104B0, 0x104D4,
+    0x104D8, 0x104FC, 0x10500, 0x10528, 0x10530, 0x10564, 0x1056F, 0x10570,
+    0x1057B, 0x1057C, 0x1058B, 0x1058C, 0x10593, 0x10594, 0x10596, 0x10597,
+    0x105A2, 0x105A3, 0x105B2, 0x105B3, 0x105BA, 0x105BB, 0x105BD, 0x105C0,
+    0x105F4, 0x10600, 0x10737, 0x10740, 0x10756, 0x10760, 0x10768, 0x10780,
+    0x10786, 0x10787, 0x107B1, 0x107B2, 0x107C0, 0x10800, 0x10806, 0x10808,
+    0x10809, 0x1080A, 0x10836, 0x10837, 0x10839, 0x1083C, 0x1083D, 0x1083F,
+    0x10840, 0x10856, 0x10857, 0x10860, 0x10880, 0x1089F, 0x108A7, 0x108B0,
+    0x108E0, 0x108F3, 0x108F4, 0x108F6, 0x108FB, 0x10900, 0x1091C, 0x1091F,
+    0x10920, 0x1093A, 0x1093F, 0x10940, 0x1095A, 0x10980, 0x109A0, 0x109B8,
+    0x109BC, 0x109D0, 0x109D2, 0x10A00, 0x10A04, 0x10A05, 0x10A07, 0x10A0C,
+    0x10A14, 0x10A15, 0x10A18, 0x10A19, 0x10A36, 0x10A38, 0x10A3B, 0x10A3F,
+    0x10A49, 0x10A50, 0x10A59, 0x10A60, 0x10A80, 0x10AA0, 0x10AC0, 0x10AE7,
+    0x10AEB, 0x10AF7, 0x10B00, 0x10B36, 0x10B39, 0x10B40, 0x10B56, 0x10B58,
+    0x10B60, 0x10B73, 0x10B78, 0x10B80, 0x10B92, 0x10B99, 0x10B9D, 0x10BA9,
+    0x10BB0, 0x10C00, 0x10C49, 0x10C80, 0x10CB3, 0x10CC0, 0x10CF3, 0x10CFA,
+    0x10D00, 0x10D28, 0x10D30, 0x10D3A, 0x10D40, 0x10D66, 0x10D69, 0x10D86,
+    0x10D8E, 0x10D90, 0x10E60, 0x10E7F, 0x10E80, 0x10EAA, 0x10EAB, 0x10EAE,
+    0x10EB0, 0x10EB2, 0x10EC2, 0x10EC8, 0x10EC9, 0x10EEF, 0x10EF0, 0x10F00,
+    0x10F28, 0x10F30, 0x10F5A, 0x10F70, 0x10F8A, 0x10FB0, 0x10FCC, 0x10FE0,
+    0x10FF7, 0x11000, 0x1104E, 0x11052, 0x11076, 0x1107F, 0x11080, 0x110C3,
+    0x110CD, 0x110CE, 0x110D0, 0x110E9, 0x110F0, 0x110FA, 0x11100, 0x11135,
+    0x11136, 0x11148, 0x11150, 0x11177, 0x11180, 0x111E0, 0x111E1, 0x111F5,
+    0x11200, 0x11212, 0x11213, 0x11242, 0x11280, 0x11287, 0x11288, 0x11289,
+    0x1128A, 0x1128E, 0x1128F, 0x1129E, 0x1129F, 0x112AA, 0x112B0, 0x112EB,
+    0x112F0, 0x112FA, 0x11300, 0x11304, 0x11305, 0x1130D, 0x1130F, 0x11311,
+    0x11313, 0x11329, 0x1132A, 0x11331, 0x11332, 0x11334, 0x11335, 0x1133A,
+    0x1133B, 0x1133C, 0x11345, 0x11347, 0x11349, 0x1134B, 0x1134E, 0x11350,
+    0x11351, 0x11357, 0x11358, 0x1135D, 0x11364, 0x11366, 0x1136D, 0x11370,
+    0x11375, 0x11380, 0x1138A, 0x1138B, 0x1138C, 0x1138E, 0x1138F, 0x11390,
+    0x113B6, 0x113B7, 0x113C1, 0x113C2, 0x113C3, 0x113C5, 0x113C6, 0x113C7,
+    0x113CB, 0x113CC, 0x113D6, 0x113D7, 0x113D9, 0x113E1, 0x113E3, 0x11400,
+    0x1145C, 0x1145D, 0x11462, 0x11480, 0x114C8, 0x114D0, 0x114DA, 0x11580,
+    0x115B6, 0x115B8, 0x115DE, 0x11600, 0x11645, 0x11650, 0x1165A, 0x11660,
+    0x1166D, 0x11680, 0x116BA, 0x116C0, 0x116CA, 0x116D0, 0x116E4, 0x11700,
+    0x1171B, 0x1171D, 0x1172C, 0x11730, 0x11747, 0x11800, 0x1183C, 0x118A0,
+    0x118F3, 0x118FF, 0x11900, 0x11907, 0x11909, 0x1190A, 0x1190C, 0x11914,
+    0x11915, 0x11917, 0x11918, 0x11936, 0x11937, 0x11939, 0x1193B, 0x11947,
+    0x11950, 0x1195A, 0x119A0, 0x119A8, 0x119AA, 0x119D8, 0x119DA, 0x119E5,
+    0x11A00, 0x11A48, 0x11A50, 0x11AA3, 0x11AB0, 0x11AC0, 0x11AF9, 0x11B00,
+    0x11B0B, 0x11B60, 0x11B68, 0x11BC0, 0x11BE2, 0x11BF0, 0x11BFA, 0x11C00,
+    0x11C09, 0x11C0A, 0x11C37, 0x11C38, 0x11C46, 0x11C50, 0x11C6D, 0x11C70,
+    0x11C90, 0x11C92, 0x11CA8, 0x11CA9, 0x11CB7, 0x11D00, 0x11D07, 0x11D08,
+    0x11D0A, 0x11D0B, 0x11D37, 0x11D3A, 0x11D3B, 0x11D3C, 0x11D3E, 0x11D3F,
+    0x11D48, 0x11D50, 0x11D5A, 0x11D60, 0x11D66, 0x11D67, 0x11D69, 0x11D6A,
+    0x11D8F, 0x11D90, 0x11D92, 0x11D93, 0x11D99, 0x11DA0, 0x11DAA, 0x11DB0,
+    0x11DDC, 0x11DE0, 0x11DEA, 0x11DF0, 0x11DF2, 0x11EE0, 0x11EF9, 0x11F00,
+    0x11F11, 0x11F12, 0x11F3B, 0x11F3E, 0x11F5B, 0x11FB0, 0x11FB1, 0x11FC0,
+    0x11FF2, 0x11FFF, 0x12000, 0x1239A, 0x12400, 0x12544, 0x12550, 0x125A8,
+    0x1264C, 0x12687, 0x12F90, 0x12FF3, 0x13000, 0x13456, 0x13460, 0x143FB,
+    0x14400, 0x14647, 0x16100, 0x1613A, 0x16800, 0x16A39, 0x16A40, 0x16A5F,
+    0x16A60, 0x16A6A, 0x16A6E, 0x16A70, 0x16ABF, 0x16AC0, 0x16ACA, 0x16AD0,
+    0x16AEE, 0x16AF0, 0x16AF6, 0x16B00, 0x16B46, 0x16B50, 0x16B5A, 0x16B5B,
+    0x16B62, 0x16B63, 0x16B78, 0x16B7D, 0x16B90, 0x16D40, 0x16D7A, 0x16E40,
+    0x16E9B, 0x16EA0, 0x16EB9, 0x16EBB, 0x16ED4, 0x16F00, 0x16F4B, 0x16F4F,
+    0x16F88, 0x16F8F, 0x16FA0, 0x16FE0, 0x16FE1, 0x16FE2, 0x16FE4, 0x16FE5,
+    0x16FF0, 0x16FF7, 0x17000, 0x18B00, 0x18CDB, 0x18CFF, 0x18D00, 0x18D21,
+    0x18D80, 0x18DF3, 0x18E00, 0x19192, 0x191A0, 0x191D3, 0x1AFF0, 0x1AFF4,
+    0x1AFF5, 0x1AFFC, 0x1AFFD, 0x1AFFF, 0x1B000, 0x1B001, 0x1B120, 0x1B123,
+    0x1B124, 0x1B129, 0x1B132, 0x1B133, 0x1B150, 0x1B153, 0x1B155, 0x1B156,
+    0x1B164, 0x1B169, 0x1B170, 0x1B2FC, 0x1BC00, 0x1BC6B, 0x1BC70, 0x1BC7D,
+    0x1BC80, 0x1BC89, 0x1BC90, 0x1BC9A, 0x1BC9C, 0x1BCA0, 0x1BCA4, 0x1CC00,
+    0x1CCFD, 0x1CD00, 0x1CEB4, 0x1CEBA, 0x1CED1, 0x1CED2, 0x1CED5, 0x1CEDD,
+    0x1CEFE, 0x1CF00, 0x1CF2E, 0x1CF30, 0x1CF47, 0x1CF50, 0x1CFC4, 0x1D000,
+    0x1D0F6, 0x1D100, 0x1D127, 0x1D129, 0x1D167, 0x1D16A, 0x1D17B, 0x1D183,
+    0x1D185, 0x1D18C, 0x1D1AA, 0x1D1AE, 0x1D200, 0x1D246, 0x1D250, 0x1D25B,
+    0x1D25D, 0x1D282, 0x1D2C0, 0x1D2D4, 0x1D2E0, 0x1D2F4, 0x1D300, 0x1D357,
+    0x1D360, 0x1D379, 0x1D400, 0x1D455, 0x1D456, 0x1D49D, 0x1D49E, 0x1D4A0,
+    0x1D4A2, 0x1D4A3, 0x1D4A5, 0x1D4A7, 0x1D4A9, 0x1D4AD, 0x1D4AE, 0x1D4BA,
+    0x1D4BB, 0x1D4BC, 0x1D4BD, 0x1D4C4, 0x1D4C5, 0x1D506, 0x1D507, 0x1D50B,
+    0x1D50D, 0x1D515, 0x1D516, 0x1D51D, 0x1D51E, 0x1D53A, 0x1D53B, 0x1D53F,
+    0x1D540, 0x1D545, 0x1D546, 0x1D547, 0x1D54A, 0x1D551, 0x1D552, 0x1D6A7,
+    0x1D6A8, 0x1D7CC, 0x1D7CE, 0x1D800, 0x1DA8C, 0x1DA9B, 0x1DAA0, 0x1DAA1,
+    0x1DAB0, 0x1DB00, 0x1DB1D, 0x1DF00, 0x1DF82, 0x1DF90, 0x1DF97, 0x1DFCD,
+    0x1DFF3, 0x1DFF5, 0x1E000, 0x1E007, 0x1E008, 0x1E019, 0x1E01B, 0x1E022,
+    0x1E023, 0x1E025, 0x1E026, 0x1E02B, 0x1E030, 0x1E06E, 0x1E08F, 0x1E090,
+    0x1E100, 0x1E12D, 0x1E130, 0x1E13E, 0x1E140, 0x1E14A, 0x1E14E, 0x1E150,
+    0x1E290, 0x1E2AF, 0x1E2C0, 0x1E2FA, 0x1E2FF, 0x1E300, 0x1E4D0, 0x1E4FA,
+    0x1E5D0, 0x1E5FB, 0x1E5FF, 0x1E600, 0x1E6C0, 0x1E6DF, 0x1E6E0, 0x1E6F6,
+    0x1E6FE, 0x1E700, 0x1E7E0, 0x1E7E7, 0x1E7E8, 0x1E7EC, 0x1E7ED, 0x1E7EF,
+    0x1E7F0, 0x1E7FF, 0x1E800, 0x1E8C5, 0x1E8C7, 0x1E8D7, 0x1E900, 0x1E94C,
+    0x1E950, 0x1E95A, 0x1E95E, 0x1E960, 0x1EC71, 0x1ECB5, 0x1ED01, 0x1ED3E,
+    0x1EE00, 0x1EE04, 0x1EE05, 0x1EE20, 0x1EE21, 0x1EE23, 0x1EE24, 0x1EE25,
+    0x1EE27, 0x1EE28, 0x1EE29, 0x1EE33, 0x1EE34, 0x1EE38, 0x1EE39, 0x1EE3A,
+    0x1EE3B, 0x1EE3C, 0x1EE42, 0x1EE43, 0x1EE47, 0x1EE48, 0x1EE49, 0x1EE4A,
+    0x1EE4B, 0x1EE4C, 0x1EE4D, 0x1EE50, 0x1EE51, 0x1EE53, 0x1EE54, 0x1EE55,
+    0x1EE57, 0x1EE58, 0x1EE59, 0x1EE5A, 0x1EE5B, 0x1EE5C, 0x1EE5D, 0x1EE5E,
+    0x1EE5F, 0x1EE60, 0x1EE61, 0x1EE63, 0x1EE64, 0x1EE65, 0x1EE67, 0x1EE6B,
+    0x1EE6C, 0x1EE73, 0x1EE74, 0x1EE78, 0x1EE79, 0x1EE7D, 0x1EE7E, 0x1EE7F,
+    0x1EE80, 0x1EE8A, 0x1EE8B, 0x1EE9C, 0x1EEA1, 0x1EEA4, 0x1EEA5, 0x1EEAA,
+    0x1EEAB, 0x1EEBC, 0x1EEF0, 0x1EEF2, 0x1F000, 0x1F02C, 0x1F030, 0x1F094,
+    0x1F0A0, 0x1F0AF, 0x1F0B1, 0x1F0C0, 0x1F0C1, 0x1F0D0, 0x1F0D1, 0x1F0F6,
+    0x1F100, 0x1F1AF, 0x1F1E6, 0x1F200, 0x1F201, 0x1F203, 0x1F210, 0x1F23C,
+    0x1F240, 0x1F249, 0x1F250, 0x1F252, 0x1F260, 0x1F266, 0x1F300, 0x1F6DA,
+    0x1F6DC, 0x1F6ED, 0x1F6F0, 0x1F6FD, 0x1F700, 0x1F7DC, 0x1F7E0, 0x1F7EC,
+    0x1F7F0, 0x1F80C, 0x1F810, 0x1F848, 0x1F850, 0x1F85A, 0x1F860, 0x1F888,
+    0x1F890, 0x1F8AE, 0x1F8B0, 0x1F8BC, 0x1F8C0, 0x1F8C2, 0x1F8D0, 0x1F8D9,
+    0x1F900, 0x1FA58, 0x1FA60, 0x1FA6E, 0x1FA70, 0x1FA7D, 0x1FA80, 0x1FAC7,
+    0x1FAC8, 0x1FAC9, 0x1FACC, 0x1FADE, 0x1FADF, 0x1FAEC, 0x1FAEF, 0x1FAFB,
+    0x1FB00, 0x1FB93, 0x1FB94, 0x1FBFB, 0x20000, 0x2A6E0, 0x2A700, 0x2B81F,
+    0x2B820, 0x2CEAE, 0x2CEB0, 0x2EBE1, 0x2EBF0, 0x2EE5E, 0x2F800, 0x2FA1E,
+    0x30000, 0x3134B, 0x31350, 0x3347A, 0x3D000, 0x3FC40, 0xE0001, 0xE0002,
+    0xE0020, 0xE0080, 0xE0100, 0xE01F0,
+])
+
+SCRIPT_INDEX = array("H", [
+    25, 75, 25, 75, 25, 75, 25, 75, 25, 75, 25, 75, 25, 75, 25, 75,
+    25, 13, 25, 58, 45, 25, 45, 170, 45, 25, 45, 170, 45, 25, 45, 25,
+    45, 170, 45, 170, 45, 170, 45, 26, 45, 30, 58, 30, 170, 4, 170, 4,
+    170, 55, 170, 55, 170, 55, 170, 3, 25, 3, 25, 3, 25, 3, 25, 3,
+    25, 3, 58, 3, 58, 3, 25, 3, 148, 170, 148, 170, 148, 3, 160, 170,
+    106, 170, 106, 133, 170, 133, 170, 86, 170, 86, 170, 148, 170, 3, 170, 3,
+    25, 3, 32, 58, 32, 25, 32, 10, 170, 10, 170, 10, 170, 10, 170, 10,
+    170, 10, 170, 10, 170, 10, 170, 10, 170, 10, 170, 10, 170, 10, 170, 10,
+    170, 10, 170, 48, 170, 48, 170, 48, 170, 48, 170, 48, 170, 48, 170, 48,
+    170, 48, 170, 48, 170, 48, 170, 48, 170, 48, 170, 48, 170, 48, 170, 48,
+    170, 48, 170, 46, 170, 46, 170, 46, 170, 46, 170, 46, 170, 46, 170, 46,
+    170, 46, 170, 46, 170, 46, 170, 46, 170, 46, 170, 46, 170, 46, 170, 121,
+    170, 121, 170, 121, 170, 121, 170, 121, 170, 121, 170, 121, 170, 121, 170, 121,
+    170, 121, 170, 121, 170, 121, 170, 121, 170, 121, 170, 156, 170, 156, 170, 156,
+    170, 156, 170, 156, 170, 156, 170, 156, 170, 156, 170, 156, 170, 156, 170, 156,
+    170, 156, 170, 156, 170, 156, 170, 156, 170, 156, 170, 159, 170, 159, 170, 159,
+    170, 159, 170, 159, 170, 159, 170, 159, 170, 159, 170, 159, 170, 159, 170, 159,
+    170, 159, 170, 159, 64, 170, 64, 170, 64, 170, 64, 170, 64, 170, 64, 170,
+    64, 170, 64, 170, 64, 170, 64, 170, 64, 170, 64, 170, 64, 170, 85, 170,
+    85, 170, 85, 170, 85, 170, 85, 170, 85, 170, 85, 170, 141, 170, 141, 170,
+    141, 170, 141, 170, 141, 170, 141, 170, 141, 170, 141, 170, 141, 170, 141, 170,
+    141, 170, 141, 170, 161, 170, 25, 161, 170, 74, 170, 74, 170, 74, 170, 74,
+    170, 74, 170, 74, 170, 74, 170, 74, 170, 74, 170, 74, 170, 74, 170, 162,
+    170, 162, 170, 162, 170, 162, 170, 162, 170, 162, 25, 162, 170, 100, 41, 170,
+    41, 170, 41, 170, 41, 25, 41, 51, 39, 170, 39, 170, 39, 170, 39, 170,
+    39, 170, 39, 170, 39, 170, 39, 170, 39, 170, 39, 170, 39, 170, 39, 170,
+    39, 170, 39, 170, 39, 170, 39, 170, 39, 170, 39, 170, 23, 170, 23, 170,
+    18, 109, 170, 132, 25, 132, 170, 149, 170, 149, 53, 25, 170, 17, 170, 150,
+    170, 150, 170, 150, 170, 70, 170, 70, 170, 70, 170, 97, 25, 97, 25, 97,
+    170, 97, 170, 97, 170, 18, 170, 77, 170, 77, 170, 77, 170, 77, 170, 77,
+    151, 170, 151, 170, 104, 170, 104, 170, 104, 170, 104, 70, 16, 170, 16, 152,
+    170, 152, 170, 152, 170, 152, 170, 152, 170, 58, 170, 6, 170, 6, 145, 9,
+    170, 9, 76, 170, 76, 170, 76, 110, 30, 170, 41, 170, 41, 145, 170, 58,
+    25, 58, 25, 58, 25, 58, 25, 58, 25, 58, 25, 170, 75, 45, 30, 75,
+    45, 75, 45, 75, 30, 75, 45, 58, 75, 45, 170, 45, 170, 45, 170, 45,
+    170, 45, 170, 45, 170, 45, 170, 45, 170, 45, 170, 45, 170, 45, 170, 45,
+    170, 45, 170, 45, 170, 45, 170, 45, 170, 25, 58, 25, 170, 25, 75, 170,
+    25, 75, 25, 75, 25, 170, 58, 170, 25, 45, 25, 75, 25, 75, 25, 75,
+    25, 75, 25, 170, 25, 170, 25, 170, 25, 15, 25, 170, 25, 42, 75, 26,
+    170, 26, 41, 170, 41, 170, 41, 170, 163, 170, 163, 170, 163, 39, 170, 39,
+    170, 39, 170, 39, 170, 39, 170, 39, 170, 39, 170, 39, 170, 39, 170, 30,
+    25, 170, 25, 170, 50, 170, 50, 170, 50, 170, 25, 50, 25, 50, 25, 50,
+    58, 51, 25, 50, 25, 170, 56, 170, 58, 25, 56, 25, 65, 25, 65, 170,
+    13, 170, 51, 170, 25, 13, 25, 170, 25, 65, 51, 170, 25, 51, 25, 65,
+    25, 65, 25, 50, 25, 50, 176, 170, 176, 170, 80, 171, 170, 30, 7, 170,
+    25, 75, 25, 75, 170, 75, 170, 75, 147, 170, 25, 170, 127, 170, 134, 170,
+    134, 170, 32, 67, 25, 67, 131, 170, 131, 51, 170, 61, 170, 25, 61, 170,
+    61, 100, 170, 22, 170, 22, 170, 22, 170, 22, 100, 153, 170, 153, 91, 170,
+    39, 170, 39, 170, 39, 170, 39, 170, 39, 170, 75, 25, 75, 45, 75, 25,
+    75, 170, 23, 91, 170, 91, 170, 51, 170, 51, 170, 51, 170, 50, 170, 50,
+    170, 75, 170, 4, 170, 55, 170, 55, 170, 55, 170, 55, 170, 55, 170, 55,
+    3, 25, 3, 170, 3, 58, 25, 170, 58, 30, 25, 170, 25, 170, 25, 170,
+    3, 170, 3, 170, 25, 170, 25, 75, 25, 75, 25, 65, 25, 65, 25, 51,
+    170, 51, 170, 51, 170, 51, 170, 51, 170, 25, 170, 25, 170, 25, 170, 79,
+    170, 79, 170, 79, 170, 79, 170, 79, 170, 79, 170, 79, 170, 25, 170, 25,
+    170, 25, 45, 170, 25, 170, 45, 170, 25, 58, 170, 81, 170, 19, 170, 58,
+    25, 170, 113, 170, 113, 43, 170, 115, 170, 169, 170, 169, 116, 170, 116, 170,
+    31, 137, 123, 170, 123, 170, 122, 170, 122, 170, 37, 170, 20, 170, 20, 172,
+    170, 172, 170, 172, 170, 172, 170, 172, 170, 172, 170, 172, 170, 172, 170, 165,
+    170, 78, 170, 78, 170, 78, 170, 75, 170, 75, 170, 75, 170, 28, 170, 28,
+    170, 28, 170, 28, 170, 28, 170, 28, 57, 170, 57, 125, 101, 170, 101, 170,
+    54, 170, 54, 170, 54, 128, 170, 128, 82, 170, 82, 139, 170, 94, 93, 170,
+    93, 170, 93, 68, 170, 68, 170, 68, 170, 68, 170, 68, 170, 68, 170, 68,
+    170, 68, 170, 118, 114, 170, 87, 170, 87, 170, 5, 170, 5, 60, 170, 60,
+    59, 170, 59, 130, 170, 130, 170, 130, 170, 119, 170, 112, 170, 112, 170, 112,
+    52, 170, 52, 170, 40, 170, 40, 170, 40, 170, 3, 170, 175, 170, 175, 170,
+    175, 170, 3, 170, 3, 170, 3, 117, 170, 142, 170, 120, 170, 24, 170, 38,
+    170, 14, 170, 14, 170, 14, 63, 170, 63, 170, 143, 170, 143, 170, 21, 170,
+    21, 170, 83, 170, 136, 170, 141, 170, 71, 170, 71, 170, 99, 170, 99, 170,
+    99, 170, 99, 170, 99, 170, 72, 170, 72, 170, 44, 170, 44, 170, 44, 170,
+    44, 170, 44, 170, 44, 170, 44, 170, 58, 44, 170, 44, 170, 44, 170, 44,
+    170, 44, 170, 44, 170, 44, 170, 44, 170, 168, 170, 168, 170, 168, 170, 168,
+    170, 168, 170, 168, 170, 168, 170, 168, 170, 168, 170, 168, 170, 168, 170, 105,
+    170, 105, 170, 164, 170, 164, 170, 138, 170, 138, 170, 96, 170, 96, 170, 97,
+    170, 155, 170, 155, 170, 100, 170, 1, 170, 1, 170, 1, 170, 34, 170, 174,
+    170, 174, 33, 170, 33, 170, 33, 170, 33, 170, 33, 170, 33, 170, 33, 170,
+    33, 170, 103, 170, 103, 170, 103, 170, 177, 170, 144, 170, 18, 126, 170, 32,
+    170, 136, 170, 146, 170, 146, 170, 12, 170, 12, 170, 12, 170, 12, 170, 88,
+    170, 88, 170, 88, 170, 89, 170, 89, 170, 89, 170, 89, 170, 89, 170, 89,
+    170, 89, 170, 47, 170, 47, 170, 47, 170, 47, 170, 47, 170, 47, 170, 166,
+    170, 166, 170, 10, 170, 84, 170, 66, 170, 66, 170, 66, 170, 80, 170, 156,
+    170, 156, 27, 170, 27, 170, 27, 129, 27, 170, 29, 170, 36, 170, 36, 170,
+    2, 170, 49, 170, 7, 170, 98, 170, 98, 170, 98, 157, 170, 157, 170, 8,
+    170, 8, 170, 124, 170, 124, 170, 124, 170, 124, 170, 124, 170, 73, 170, 90,
+    170, 11, 170, 11, 170, 95, 170, 95, 170, 95, 170, 158, 107, 50, 69, 170,
+    50, 170, 158, 69, 170, 69, 158, 170, 158, 170, 62, 170, 62, 170, 65, 170,
+    65, 170, 65, 170, 65, 56, 65, 56, 65, 170, 56, 170, 56, 170, 65, 170,
+    65, 170, 107, 170, 35, 170, 35, 170, 35, 170, 35, 170, 35, 25, 170, 25,
+    170, 25, 170, 25, 170, 25, 170, 25, 170, 58, 170, 58, 170, 25, 170, 25,
+    170, 25, 58, 25, 58, 25, 58, 25, 58, 25, 58, 25, 45, 170, 25, 58,
+    25, 170, 25, 170, 25, 170, 25, 170, 25, 170, 25, 170, 25, 170, 25, 170,
+    25, 170, 25, 170, 25, 170, 25, 170, 25, 170, 25, 170, 25, 170, 25, 170,
+    25, 170, 25, 170, 25, 170, 25, 170, 25, 170, 25, 170, 25, 170, 25, 170,
+    25, 170, 25, 140, 170, 140, 170, 140, 170, 25, 170, 75, 170, 75, 170, 75,
+    45, 75, 42, 170, 42, 170, 42, 170, 42, 170, 42, 170, 30, 170, 30, 170,
+    108, 170, 108, 170, 108, 170, 108, 170, 167, 170, 173, 170, 173, 170, 102, 170,
+    111, 170, 111, 170, 154, 170, 154, 170, 154, 170, 39, 170, 39, 170, 39, 170,
+    39, 170, 92, 170, 92, 170, 0, 170, 0, 170, 0, 170, 25, 170, 25, 170,
+    3, 170, 3, 170, 3, 170, 3, 170, 3, 170, 3, 170, 3, 170, 3, 170,
+    3, 170, 3, 170, 3, 170, 3, 170, 3, 170, 3, 170, 3, 170, 3, 170,
+    3, 170, 3, 170, 3, 170, 3, 170, 3, 170, 3, 170, 3, 170, 3, 170,
+    3, 170, 3, 170, 3, 170, 3, 170, 3, 170, 3, 170, 3, 170, 3, 170,
+    3, 170, 3, 170, 25, 170, 25, 170, 25, 170, 25, 170, 25, 170, 25, 170,
+    25, 170, 25, 56, 25, 170, 25, 170, 25, 170, 25, 170, 25, 170, 25, 170,
+    25, 170, 25, 170, 25, 170, 25, 170, 25, 170, 25, 170, 25, 170, 25, 170,
+    25, 170, 25, 170, 25, 170, 25, 170, 25, 170, 25, 170, 25, 170, 25, 170,
+    25, 170, 25, 170, 25, 170, 25, 170, 25, 170, 25, 170, 50, 170, 50, 170,
+    50, 170, 50, 170, 50, 170, 50, 170, 50, 170, 50, 170, 135, 170, 25, 170,
+    25, 170, 58, 170,
+])
+
+# Sorted, non-overlapping (start, end) runs of non-printable codepoints
+NONPRINTABLE_STARTS = array("I", [
+    0x00000, 0x0007F, 0x000AD, 0x00378, 0x00380, 0x0038B, 0x0038D, 0x003A2,
+    0x00530, 0x00557, 0x00590, 0x005CA, 0x005EB, 0x005F5, 0x0061C, 0x006DD,
+    0x0070E, 0x0074B, 0x007B2, 0x007FB, 0x0082E, 0x0083F, 0x0085C, 0x0085F,
+    0x0086B, 0x00890, 0x008E2, 0x00984, 0x0098D, 0x00991, 0x009A9, 0x009B1,
+    0x009B3, 0x009BA, 0x009C5, 0x009C9, 0x009CF, 0x009D8, 0x009DE, 0x009E4,
+    0x009FF, 0x00A04, 0x00A0B, 0x00A11, 0x00A29, 0x00A31, 0x00A34, 0x00A37,
+    0x00A3A, 0x00A3D, 0x00A43, 0x00A49, 0x00A4E, 0x00A52, 0x00A5D, 0x00A5F,
+    0x00A77, 0x00A84, 0x00A8E, 0x00A92, 0x00AA9, 0x00AB1, 0x00AB4, 0x00ABA,
+    0x00AC6, 0x00ACA, 0x00ACE, 0x00AD1, 0x00AE4, 0x00AF2, 0x00B00, 0x00B04,
+    0x00B0D, 0x00B11, 0x00B29, 0x00B31, 0x00B34, 0x00B3A, 0x00B45, 0x00B49,
+    0x00B4E, 0x00B58, 0x00B5E, 0x00B64, 0x00B78, 0x00B84, 0x00B8B, 0x00B91,
+    0x00B96, 0x00B9B, 0x00B9D, 0x00BA0, 0x00BA5, 0x00BAB, 0x00BBA, 0x00BC3,
+    0x00BC9, 0x00BCE, 0x00BD1, 0x00BD8, 0x00BFB, 0x00C0D, 0x00C11, 0x00C29,
+    0x00C3A, 0x00C45, 0x00C49, 0x00C4E, 0x00C57, 0x00C5B, 0x00C5E, 0x00C64,
+    0x00C70, 0x00C8D, 0x00C91, 0x00CA9, 0x00CB4, 0x00CBA, 0x00CC5, 0x00CC9,
+    0x00CCE, 0x00CD7, 0x00CDF, 0x00CE4, 0x00CF0, 0x00CF4, 0x00D0D, 0x00D11,
+    0x00D45, 0x00D49, 0x00D50, 0x00D64, 0x00D80, 0x00D84, 0x00D97, 0x00DB2,
+    0x00DBC, 0x00DBE, 0x00DC7, 0x00DCB, 0x00DD5, 0x00DD7, 0x00DE0, 0x00DF0,
+    0x00DF5, 0x00E3B, 0x00E5C, 0x00E83, 0x00E85, 0x00E8B, 0x00EA4, 0x00EA6,
+    0x00EBE, 0x00EC5, 0x00EC7, 0x00ECF, 0x00EDA, 0x00EE0, 0x00F48, 0x00F6D,
+    0x00F98, 0x00FBD, 0x00FCD, 0x00FDB, 0x010C6, 0x010C8, 0x010CE, 0x01249,
+    0x0124E, 0x01257, 0x01259, 0x0125E, 0x01289, 0x0128E, 0x012B1, 0x012B6,
+    0x012BF, 0x012C1, 0x012C6, 0x012D7, 0x01311, 0x01316, 0x0135B, 0x0137D,
+    0x0139A, 0x013F6, 0x013FE, 0x01680, 0x0169D, 0x016F9, 0x01716, 0x01737,
+    0x01754, 0x0176D, 0x01771, 0x01774, 0x017DE, 0x017EA, 0x017FA, 0x0180E,
+    0x0181A, 0x01879, 0x018AB, 0x018F6, 0x0191F, 0x0192C, 0x0193C, 0x01941,
+    0x0196E, 0x01975, 0x019AC, 0x019CA, 0x019DB, 0x01A1C, 0x01A5F, 0x01A7D,
+    0x01A8A, 0x01A9A, 0x01AAE, 0x01AF1, 0x01B4D, 0x01BF4, 0x01C38, 0x01C4A,
+    0x01C8B, 0x01CBB, 0x01CC8, 0x01CFB, 0x01F16, 0x01F1E, 0x01F46, 0x01F4E,
+    0x01F58, 0x01F5A, 0x01F5C, 0x01F5E, 0x01F7E, 0x01FB5, 0x01FC5, 0x01FD4,
+    0x01FDC, 0x01FF0, 0x01FF5, 0x01FFF, 0x02028, 0x0205F, 0x02072, 0x020C5,
+    0x020F1, 0x0218C, 0x0242A, 0x0244B, 0x02B74, 0x02CF4, 0x02D26, 0x02D28,
+    0x02D2E, 0x02D68, 0x02D71, 0x02D97, 0x02DA7, 0x02DAF, 0x02DB7, 0x02DBF,
+    0x02DC7, 0x02DCF, 0x02DD7, 0x02DDF, 0x02E5E, 0x02E64, 0x02E9A, 0x02EF4,
+    0x02FD6, 0x03000, 0x03040, 0x03097, 0x03100, 0x03130, 0x0318F, 0x031E6,
+    0x0321F, 0x0A48D, 0x0A4C7, 0x0A62C, 0x0A6F8, 0x0A7DE, 0x0A7E3, 0x0A82D,
+    0x0A83A, 0x0A878, 0x0A8C6, 0x0A8DA, 0x0A954, 0x0A97D, 0x0A9CE, 0x0A9DA,
+    0x0A9FF, 0x0AA37, 0x0AA4E, 0x0AA5A, 0x0AAC3, 0x0AAF7, 0x0AB07, 0x0AB0F,
+    0x0AB17, 0x0AB27, 0x0AB2F, 0x0AB6E, 0x0ABEE, 0x0ABFA, 0x0D7A4, 0x0D7C7,
+    0x0D7FC, 0x0FA6E, 0x0FADA, 0x0FB07, 0x0FB18, 0x0FB37, 0x0FB3D, 0x0FB3F,
+    0x0FB42, 0x0FB45, 0x0FDD0, 0x0FE1A, 0x0FE53, 0x0FE67, 0x0FE6C, 0x0FE75,
+    0x0FEFD, 0x0FFBF, 0x0FFC8, 0x0FFD0, 0x0FFD8, 0x0FFDD, 0x0FFE7, 0x0FFEF,
+    0x0FFFE, 0x1000C, 0x10027, 0x1003B, 0x1003E, 0x1004E, 0x1005E, 0x100FB,
+    0x10103, 0x10134, 0x1018F, 0x1019D, 0x101A1, 0x101FE, 0x1029D, 0x102D1,
+    0x102FC, 0x10324, 0x1034B, 0x1037B, 0x1039E, 0x103C4, 0x103D6, 0x1049E,
+    0x104AA, 0x104D4, 0x104FC, 0x10528, 0x10564, 0x1057B, 0x1058B, 0x10593,
+    0x10596, 0x105A2, 0x105B2, 0x105BA, 0x105BD, 0x105F4, 0x10737, 0x10756,
+    0x10768, 0x10786, 0x107B1, 0x107C0, 0x10806, 0x10809, 0x10836, 0x10839,
+    0x1083D, 0x10856, 0x1089F, 0x108B0, 0x108F3, 0x108F6, 0x1091C, 0x1093A,
+    0x1095A, 0x109B8, 0x109D0, 0x10A04, 0x10A07, 0x10A14, 0x10A18, 0x10A36,
+    0x10A3B, 0x10A49, 0x10A59, 0x10AA0, 0x10AE7, 0x10AF7, 0x10B36, 0x10B56,
+    0x10B73, 0x10B92, 0x10B9D, 0x10BB0, 0x10C49, 0x10CB3, 0x10CF3, 0x10D28,
+    0x10D3A, 0x10D66, 0x10D86, 0x10D90, 0x10E7F, 0x10EAA, 0x10EAE, 0x10EB2,
+    0x10EC8, 0x10EEF, 0x10F28, 0x10F5A, 0x10F8A, 0x10FCC, 0x10FF7, 0x1104E,
+    0x11076, 0x110BD, 0x110C3, 0x110E9, 0x110FA, 0x11135, 0x11148, 0x11177,
+    0x111E0, 0x111F5, 0x11212, 0x11242, 0x11287, 0x11289, 0x1128E, 0x1129E,
+    0x112AA, 0x112EB, 0x112FA, 0x11304, 0x1130D, 0x11311, 0x11329, 0x11331,
+    0x11334, 0x1133A, 0x11345, 0x11349, 0x1134E, 0x11351, 0x11358, 0x11364,
+    0x1136D, 0x11375, 0x1138A, 0x1138C, 0x1138F, 0x113B6, 0x113C1, 0x113C3,
+    0x113C6, 0x113CB, 0x113D6, 0x113D9, 0x113E3, 0x1145C, 0x11462, 0x114C8,
+    0x114DA, 0x115B6, 0x115DE, 0x11645, 0x1165A, 0x1166D, 0x116BA, 0x116CA,
+    0x116E4, 0x1171B, 0x1172C, 0x11747, 0x1183C, 0x118F3, 0x11907, 0x1190A,
+    0x11914, 0x11917, 0x11936, 0x11939, 0x11947, 0x1195A, 0x119A8, 0x119D8,
+    0x119E5, 0x11A48, 0x11AA3, 0x11AF9, 0x11B0B, 0x11B68, 0x11BE2, 0x11BFA,
+    0x11C09, 0x11C37, 0x11C46, 0x11C6D, 0x11C90, 0x11CA8, 0x11CB7, 0x11D07,
+    0x11D0A, 0x11D37, 0x11D3B, 0x11D3E, 0x11D48, 0x11D5A, 0x11D66, 0x11D69,
+    0x11D8F, 0x11D92, 0x11D99, 0x11DAA, 0x11DDC, 0x11DEA, 0x11DF2, 0x11EF9,
+    0x11F11, 0x11F3B, 0x11F5B, 0x11FB1, 0x11FF2, 0x1239A, 0x12544, 0x12687,
+    0x12FF3, 0x13430, 0x13456, 0x143FB, 0x14647, 0x1613A, 0x16A39, 0x16A5F,
+    0x16A6A, 0x16ABF, 0x16ACA, 0x16AEE, 0x16AF6, 0x16B46, 0x16B5A, 0x16B62,
+    0x16B78, 0x16B90, 0x16D7A, 0x16E9B, 0x16EB9, 0x16ED4, 0x16F4B, 0x16F88,
+    0x16FA0, 0x16FE5, 0x16FF7, 0x18CDB, 0x18D21, 0x18DF3, 0x19192, 0x191D3,
+    0x1AFF4, 0x1AFFC, 0x1AFFF, 0x1B129, 0x1B133, 0x1B153, 0x1B156, 0x1B169,
+    0x1B2FC, 0x1BC6B, 0x1BC7D, 0x1BC89, 0x1BC9A, 0x1BCA0, 0x1CCFD, 0x1CEB4,
+    0x1CED1, 0x1CED5, 0x1CEFE, 0x1CF2E, 0x1CF47, 0x1CFC4, 0x1D0F6, 0x1D173,
+    0x1D246, 0x1D282, 0x1D2D4, 0x1D2F4, 0x1D357, 0x1D379, 0x1D455, 0x1D49D,
+    0x1D4A0, 0x1D4A3, 0x1D4A7, 0x1D4AD, 0x1D4BA, 0x1D4BC, 0x1D4C4, 0x1D506,
+    0x1D50B, 0x1D515, 0x1D51D, 0x1D53A, 0x1D53F, 0x1D545, 0x1D547, 0x1D551,
+    0x1D6A7, 0x1D7CC, 0x1DA8C, 0x1DAA0, 0x1DAB0, 0x1DB1D, 0x1DF82, 0x1DF97,
+    0x1E007, 0x1E019, 0x1E022, 0x1E025, 0x1E02B, 0x1E06E, 0x1E090, 0x1E12D,
+    0x1E13E, 0x1E14A, 0x1E150, 0x1E2AF, 0x1E2FA, 0x1E300, 0x1E4FA, 0x1E5FB,
+    0x1E600, 0x1E6DF, 0x1E6F6, 0x1E700, 0x1E7E7, 0x1E7EC, 0x1E7EF, 0x1E7FF,
+    0x1E8C5, 0x1E8D7, 0x1E94C, 0x1E95A, 0x1E960, 0x1ECB5, 0x1ED3E, 0x1EE04,
+    0x1EE20, 0x1EE23, 0x1EE25, 0x1EE28, 0x1EE33, 0x1EE38, 0x1EE3A, 0x1EE3C,
+    0x1EE43, 0x1EE48, 0x1EE4A, 0x1EE4C, 0x1EE50, 0x1EE53, 0x1EE55, 0x1EE58,
+    0x1EE5A, 0x1EE5C, 0x1EE5E, 0x1EE60, 0x1EE63, 0x1EE65, 0x1EE6B, 0x1EE73,
+    0x1EE78, 0x1EE7D, 0x1EE7F, 0x1EE8A, 0x1EE9C, 0x1EEA4, 0x1EEAA, 0x1EEBC,
+    0x1EEF2, 0x1F02C, 0x1F094, 0x1F0AF, 0x1F0C0, 0x1F0D0, 0x1F0F6, 0x1F1AF,
+    0x1F203, 0x1F23C, 0x1F249, 0x1F252, 0x1F266, 0x1F6DA, 0x1F6ED, 0x1F6FD,
+    0x1F7DC, 0x1F7EC, 0x1F80C, 0x1F848, 0x1F85A, 0x1F888, 0x1F8AE, 0x1F8BC,
+    0x1F8C2, 0x1F8D9, 0x1FA58, 0x1FA6E, 0x1FA7D, 0x1FAC7, 0x1FAC9, 0x1FADE,
+    0x1FAEC, 0x1FAFB, 0x1FB93, 0x1FBFB, 0x2A6E0, 0x2B81F, 0x2CEAE, 0x2EBE1,
+    0x2EE5E, 0x2FA1E, 0x3134B, 0x3347A, 0x3FC40, 0xE01F0,
+])
+
+NONPRINTABLE_ENDS = array("I", [
+    0x0001F, 0x000A0, 0x000AD, 0x00379, 0x00383, 0x0038B, 0x0038D, 0x003A2,
+    0x00530, 0x00557, 0x00590, 0x005CF, 0x005EE, 0x00605, 0x0061C, 0x006DD,
+    0x0070F, 0x0074C, 0x007BF, 0x007FC, 0x0082F, 0x0083F, 0x0085D, 0x0085F,
+    0x0086F, 0x00896, 0x008E2, 0x00984, 0x0098E, 0x00992, 0x009A9, 0x009B1,
+    0x009B5, 0x009BB, 0x009C6, 0x009CA, 0x009D6, 0x009DB, 0x009DE, 0x009E5,
+    0x00A00, 0x00A04, 0x00A0E, 0x00A12, 0x00A29, 0x00A31, 0x00A34, 0x00A37,
+    0x00A3B, 0x00A3D, 0x00A46, 0x00A4A, 0x00A50, 0x00A58, 0x00A5D, 0x00A65,
+    0x00A80, 0x00A84, 0x00A8E, 0x00A92, 0x00AA9, 0x00AB1, 0x00AB4, 0x00ABB,
+    0x00AC6, 0x00ACA, 0x00ACF, 0x00ADF, 0x00AE5, 0x00AF8, 0x00B00, 0x00B04,
+    0x00B0E, 0x00B12, 0x00B29, 0x00B31, 0x00B34, 0x00B3B, 0x00B46, 0x00B4A,
+    0x00B52, 0x00B5B, 0x00B5E, 0x00B65, 0x00B81, 0x00B84, 0x00B8D, 0x00B91,
+    0x00B98, 0x00B9B, 0x00B9D, 0x00BA2, 0x00BA7, 0x00BAD, 0x00BBD, 0x00BC5,
+    0x00BC9, 0x00BCF, 0x00BD6, 0x00BE5, 0x00BFF, 0x00C0D, 0x00C11, 0x00C29,
+    0x00C3B, 0x00C45, 0x00C49, 0x00C54, 0x00C57, 0x00C5B, 0x00C5F, 0x00C65,
+    0x00C76, 0x00C8D, 0x00C91, 0x00CA9, 0x00CB4, 0x00CBB, 0x00CC5, 0x00CC9,
+    0x00CD4, 0x00CDB, 0x00CDF, 0x00CE5, 0x00CF0, 0x00CFF, 0x00D0D, 0x00D11,
+    0x00D45, 0x00D49, 0x00D53, 0x00D65, 0x00D80, 0x00D84, 0x00D99, 0x00DB2,
+    0x00DBC, 0x00DBF, 0x00DC9, 0x00DCE, 0x00DD5, 0x00DD7, 0x00DE5, 0x00DF1,
+    0x00E00, 0x00E3E, 0x00E80, 0x00E83, 0x00E85, 0x00E8B, 0x00EA4, 0x00EA6,
+    0x00EBF, 0x00EC5, 0x00EC7, 0x00ECF, 0x00EDB, 0x00EFF, 0x00F48, 0x00F70,
+    0x00F98, 0x00FBD, 0x00FCD, 0x00FFF, 0x010C6, 0x010CC, 0x010CF, 0x01249,
+    0x0124F, 0x01257, 0x01259, 0x0125F, 0x01289, 0x0128F, 0x012B1, 0x012B7,
+    0x012BF, 0x012C1, 0x012C7, 0x012D7, 0x01311, 0x01317, 0x0135C, 0x0137F,
+    0x0139F, 0x013F7, 0x013FF, 0x01680, 0x0169F, 0x016FF, 0x0171E, 0x0173F,
+    0x0175F, 0x0176D, 0x01771, 0x0177F, 0x017DF, 0x017EF, 0x017FF, 0x0180E,
+    0x0181F, 0x0187F, 0x018AF, 0x018FF, 0x0191F, 0x0192F, 0x0193F, 0x01943,
+    0x0196F, 0x0197F, 0x019AF, 0x019CF, 0x019DD, 0x01A1D, 0x01A5F, 0x01A7E,
+    0x01A8F, 0x01A9F, 0x01AAF, 0x01AFF, 0x01B4D, 0x01BFB, 0x01C3A, 0x01C4C,
+    0x01C8F, 0x01CBC, 0x01CCF, 0x01CFF, 0x01F17, 0x01F1F, 0x01F47, 0x01F4F,
+    0x01F58, 0x01F5A, 0x01F5C, 0x01F5E, 0x01F7F, 0x01FB5, 0x01FC5, 0x01FD5,
+    0x01FDC, 0x01FF1, 0x01FF5, 0x0200F, 0x0202F, 0x0206F, 0x02073, 0x020CF,
+    0x020FF, 0x0218F, 0x0243F, 0x0245F, 0x02B75, 0x02CF8, 0x02D26, 0x02D2C,
+    0x02D2F, 0x02D6E, 0x02D7E, 0x02D9F, 0x02DA7, 0x02DAF, 0x02DB7, 0x02DBF,
+    0x02DC7, 0x02DCF, 0x02DD7, 0x02DDF, 0x02E5F, 0x02E7F, 0x02E9A, 0x02EFF,
+    0x02FEF, 0x03000, 0x03040, 0x03098, 0x03104, 0x03130, 0x0318F, 0x031EE,
+    0x0321F, 0x0A48F, 0x0A4CF, 0x0A63F, 0x0A6FF, 0x0A7E1, 0x0A7F0, 0x0A82F,
+    0x0A83F, 0x0A87F, 0x0A8CD, 0x0A8DF, 0x0A95E, 0x0A97F, 0x0A9CE, 0x0A9DD,
+    0x0A9FF, 0x0AA3F, 0x0AA4F, 0x0AA5B, 0x0AADA, 0x0AB00, 0x0AB08, 0x0AB10,
+    0x0AB1F, 0x0AB27, 0x0AB2F, 0x0AB6F, 0x0ABEF, 0x0ABFF, 0x0D7AF, 0x0D7CA,
+    0x0F8FF, 0x0FA6F, 0x0FAFF, 0x0FB12, 0x0FB1C, 0x0FB37, 0x0FB3D, 0x0FB3F,
+    0x0FB42, 0x0FB45, 0x0FDEF, 0x0FE1F, 0x0FE53, 0x0FE67, 0x0FE6F, 0x0FE75,
+    0x0FF00, 0x0FFC1, 0x0FFC9, 0x0FFD1, 0x0FFD9, 0x0FFDF, 0x0FFE7, 0x0FFFB,
+    0x0FFFF, 0x1000C, 0x10027, 0x1003B, 0x1003E, 0x1004F, 0x1007F, 0x100FF,
+    0x10106, 0x10136, 0x1018F, 0x1019F, 0x101CF, 0x1027F, 0x1029F, 0x102DF,
+    0x102FF, 0x1032C, 0x1034F, 0x1037F, 0x1039E, 0x103C7, 0x103FF, 0x1049F,
+    0x104AF, 0x104D7, 0x104FF, 0x1052F, 0x1056E, 0x1057B, 0x1058B, 0x10593,
+    0x10596, 0x105A2, 0x105B2, 0x105BA, 0x105BF, 0x105FF, 0x1073F, 0x1075F,
+    0x1077F, 0x10786, 0x107B1, 0x107FF, 0x10807, 0x10809, 0x10836, 0x1083B,
+    0x1083E, 0x10856, 0x108A6, 0x108DF, 0x108F3, 0x108FA, 0x1091E, 0x1093E,
+    0x1097F, 0x109BB, 0x109D1, 0x10A04, 0x10A0B, 0x10A14, 0x10A18, 0x10A37,
+    0x10A3E, 0x10A4F, 0x10A5F, 0x10ABF, 0x10AEA, 0x10AFF, 0x10B38, 0x10B57,
+    0x10B77, 0x10B98, 0x10BA8, 0x10BFF, 0x10C7F, 0x10CBF, 0x10CF9, 0x10D2F,
+    0x10D3F, 0x10D68, 0x10D8D, 0x10E5F, 0x10E7F, 0x10EAA, 0x10EAF, 0x10EC1,
+    0x10EC8, 0x10EEF, 0x10F2F, 0x10F6F, 0x10FAF, 0x10FDF, 0x10FFF, 0x11051,
+    0x1107E, 0x110BD, 0x110CF, 0x110EF, 0x110FF, 0x11135, 0x1114F, 0x1117F,
+    0x111E0, 0x111FF, 0x11212, 0x1127F, 0x11287, 0x11289, 0x1128E, 0x1129E,
+    0x112AF, 0x112EF, 0x112FF, 0x11304, 0x1130E, 0x11312, 0x11329, 0x11331,
+    0x11334, 0x1133A, 0x11346, 0x1134A, 0x1134F, 0x11356, 0x1135C, 0x11365,
+    0x1136F, 0x1137F, 0x1138A, 0x1138D, 0x1138F, 0x113B6, 0x113C1, 0x113C4,
+    0x113C6, 0x113CB, 0x113D6, 0x113E0, 0x113FF, 0x1145C, 0x1147F, 0x114CF,
+    0x1157F, 0x115B7, 0x115FF, 0x1164F, 0x1165F, 0x1167F, 0x116BF, 0x116CF,
+    0x116FF, 0x1171C, 0x1172F, 0x117FF, 0x1189F, 0x118FE, 0x11908, 0x1190B,
+    0x11914, 0x11917, 0x11936, 0x1193A, 0x1194F, 0x1199F, 0x119A9, 0x119D9,
+    0x119FF, 0x11A4F, 0x11AAF, 0x11AFF, 0x11B5F, 0x11BBF, 0x11BEF, 0x11BFF,
+    0x11C09, 0x11C37, 0x11C4F, 0x11C6F, 0x11C91, 0x11CA8, 0x11CFF, 0x11D07,
+    0x11D0A, 0x11D39, 0x11D3B, 0x11D3E, 0x11D4F, 0x11D5F, 0x11D66, 0x11D69,
+    0x11D8F, 0x11D92, 0x11D9F, 0x11DAF, 0x11DDF, 0x11DEF, 0x11EDF, 0x11EFF,
+    0x11F11, 0x11F3D, 0x11FAF, 0x11FBF, 0x11FFE, 0x123FF, 0x1254F, 0x12F8F,
+    0x12FFF, 0x13438, 0x1345F, 0x143FF, 0x160FF, 0x167FF, 0x16A3F, 0x16A5F,
+    0x16A6D, 0x16ABF, 0x16ACF, 0x16AEF, 0x16AFF, 0x16B4F, 0x16B5A, 0x16B62,
+    0x16B7C, 0x16D3F, 0x16E3F, 0x16E9F, 0x16EBA, 0x16EFF, 0x16F4E, 0x16F8E,
+    0x16FDF, 0x16FEF, 0x16FFF, 0x18CFE, 0x18D7F, 0x18DFF, 0x1919F, 0x1AFEF,
+    0x1AFF4, 0x1AFFC, 0x1AFFF, 0x1B131, 0x1B14F, 0x1B154, 0x1B163, 0x1B16F,
+    0x1BBFF, 0x1BC6F, 0x1BC7F, 0x1BC8F, 0x1BC9B, 0x1CBFF, 0x1CCFF, 0x1CEB9,
+    0x1CED1, 0x1CEDC, 0x1CEFF, 0x1CF2F, 0x1CF4F, 0x1CFFF, 0x1D0FF, 0x1D17A,
+    0x1D24F, 0x1D2BF, 0x1D2DF, 0x1D2FF, 0x1D35F, 0x1D3FF, 0x1D455, 0x1D49D,
+    0x1D4A1, 0x1D4A4, 0x1D4A8, 0x1D4AD, 0x1D4BA, 0x1D4BC, 0x1D4C4, 0x1D506,
+    0x1D50C, 0x1D515, 0x1D51D, 0x1D53A, 0x1D53F, 0x1D545, 0x1D549, 0x1D551,
+    0x1D6A7, 0x1D7CD, 0x1DA9A, 0x1DAA0, 0x1DAFF, 0x1DEFF, 0x1DF8F, 0x1DFCC,
+    0x1E007, 0x1E01A, 0x1E022, 0x1E025, 0x1E02F, 0x1E08E, 0x1E0FF, 0x1E12F,
+    0x1E13F, 0x1E14D, 0x1E28F, 0x1E2BF, 0x1E2FE, 0x1E4CF, 0x1E5CF, 0x1E5FE,
+    0x1E6BF, 0x1E6DF, 0x1E6FD, 0x1E7DF, 0x1E7E7, 0x1E7EC, 0x1E7EF, 0x1E7FF,
+    0x1E8C6, 0x1E8FF, 0x1E94F, 0x1E95D, 0x1EC70, 0x1ED00, 0x1EDFF, 0x1EE04,
+    0x1EE20, 0x1EE23, 0x1EE26, 0x1EE28, 0x1EE33, 0x1EE38, 0x1EE3A, 0x1EE41,
+    0x1EE46, 0x1EE48, 0x1EE4A, 0x1EE4C, 0x1EE50, 0x1EE53, 0x1EE56, 0x1EE58,
+    0x1EE5A, 0x1EE5C, 0x1EE5E, 0x1EE60, 0x1EE63, 0x1EE66, 0x1EE6B, 0x1EE73,
+    0x1EE78, 0x1EE7D, 0x1EE7F, 0x1EE8A, 0x1EEA0, 0x1EEA4, 0x1EEAA, 0x1EEEF,
+    0x1EFFF, 0x1F02F, 0x1F09F, 0x1F0B0, 0x1F0C0, 0x1F0D0, 0x1F0FF, 0x1F1E5,
+    0x1F20F, 0x1F23F, 0x1F24F, 0x1F25F, 0x1F2FF, 0x1F6DB, 0x1F6EF, 0x1F6FF,
+    0x1F7DF, 0x1F7EF, 0x1F80F, 0x1F84F, 0x1F85F, 0x1F88F, 0x1F8AF, 0x1F8BF,
+    0x1F8CF, 0x1F8FF, 0x1FA5F, 0x1FA6F, 0x1FA7F, 0x1FAC7, 0x1FACB, 0x1FADE,
+    0x1FAEE, 0x1FAFF, 0x1FB93, 0x1FFFF, 0x2A6FF, 0x2B81F, 0x2CEAF, 0x2EBEF,
+    0x2F7FF, 0x2FFFF, 0x3134F, 0x3CFFF, 0xE00FF, 0x10FFFF,
+])
@@ -2,20 +2,28 @@
 
 from fontTools.ttLib import TTFont
 from fontTools.varLib import instancer
+import os
 import shutil
 
+from font_store import unlink
+
 src_font = r"E:\Fonts\chinese_fonts\NotoSansSC-VariableFont_wght.ttf"
 out_dir = r"E:\Fonts\chinese_fonts_filtered"
 
 # --- Regular 400 ---
 vf = TTFont(src_font)
 static_regular = instancer.instantiateVariableFont(vf, {"wght": 400})  # do NOT use inplace=True
+# the output may be a read-only link into the font store: write a new file, not through the link
+if os.path.exists(out_dir + r"\NotoSansSC-Regular.ttf"):
+    unlink(out_dir + r"\NotoSansSC-Regular.ttf")
 static_regular.save(out_dir + r"\NotoSansSC-Regular.ttf")
 vf.close()
 
 # --- Semibold 600 ---
 vf = TTFont(src_font)
 static_semibold = instancer.instantiateVariableFont(vf, {"wght": 600})
+if os.path.exists(out_dir + r"\NotoSansSC-Semibold.ttf"):
+    unlink(out_dir + r"\NotoSansSC-Semibold.ttf")
 static_semibold.save(out_dir + r"\NotoSansSC-Semibold.ttf")
 vf.close()
 